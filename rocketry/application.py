@@ -4,8 +4,7 @@ import warnings
 
 from redbird import BaseRepo
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
-from rocketry.log.log_record import LogRecord
+from rocketry.log import CompactRepo, LogRecord
 
 from rocketry.conditions import FuncCond
 from rocketry.parameters import FuncParam
@@ -19,9 +18,9 @@ class _AppMixin:
         "Create a task"
         return self.session.create_task(start_cond=start_cond, name=name, **kwargs)
 
-    def param(self, name:Optional[str]=None):
+    def param(self, name:Optional[str]=None, cache=None):
         "Set one session parameter (decorator)"
-        return FuncParam(name, session=self.session)
+        return FuncParam(name, session=self.session, cache=cache)
 
     def cond(self, syntax: Union[str, Pattern, List[Union[str, Pattern]]]=None):
         "Create a condition (decorator)"
@@ -81,7 +80,7 @@ class Rocketry(_AppMixin):
 
     def _set_logger_with_repo(self, repo):
         if repo is None:
-            repo = MemoryRepo(model=LogRecord)
+            repo = CompactRepo(model=LogRecord)
         logger = self._get_task_logger()
         logger.handlers.insert(0, RepoHandler(repo=repo))
 
@@ -1,10 +1,15 @@
 
+import datetime
+import inspect
 import logging
 import os
 import sys
 import threading
+import time
 import warnings
-from typing import Any, Callable, Optional, Union
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from uuid import uuid4
 from rocketry.core.log.adapter import TaskAdapter
 try:
     from typing import Literal
@@ -12,7 +17,8 @@ except ImportError: # pragma: no cover
     from typing_extensions import Literal
 
 from rocketry.core.task import Task as BaseTask
-from rocketry.core.parameters import BaseArgument, Parameters
+from rocketry.core.parameters import BaseArgument, Parameters, SpooledReturn, spool_return
+from rocketry.pybox.time import to_timedelta
 
 class NotSet:
     def __repr__(self):
@@ -20,6 +26,33 @@ class NotSet:
 
 NOTSET = NotSet()
 
+# Cached values of FuncArgs in this process by cache id:
+# (version, {task name: (value, expires, cycle)}). The task
+# name is None if the value is the same for all tasks. Only
+# the latest version is kept
+_CACHE: Dict[str, Tuple[int, Dict[Optional[str], Tuple[Any, Optional[float], Optional[int]]]]] = {}
+# Shared values passed as files by cache id: (version, handle, spool)
+_SHARED: Dict[str, tuple] = {}
+_CACHE_LOCK = threading.Lock()
+
+def _drop_cached(cache_id:str):
+    "Remove the cached value (and the file of a shared value)"
+    with _CACHE_LOCK:
+        _CACHE.pop(cache_id, None)
+        spooled = _SHARED.pop(cache_id, None)
+    if spooled is not None:
+        _, handle, spool = spooled
+        spool.release(handle)
+
+def _drop_expired(now:float):
+    # Called with the lock
+    for cache_id, (_, entries) in list(_CACHE.items()):
+        for key, (_, expires, _) in list(entries.items()):
+            if expires is not None and expires <= now:
+                del entries[key]
+        if not entries:
+            del _CACHE[cache_id]
+
 class SimpleArg(BaseArgument):
     """A simple argument.
 
@@ -182,6 +215,18 @@ class Return(BaseArgument):
                 raise KeyError(f"Return value not found for {repr(task)}")
             return self.default
 
+    def stage(self, task=None, session=None, **kwargs):
+        if session is None:
+            session = task.session
+        input_task = session.tasks.get(self.task_name)
+        value = session.returns.to_dict().get(input_task)
+        if isinstance(value, SpooledReturn):
+            # Passed as the file, kept till the task finishes
+            if task is not None and session._return_spool is not None:
+                session._return_spool.stage(value, task.name)
+            return value
+        return self.get_value(task=task, session=session, **kwargs)
+
     def __repr__(self):
         return f'Return({repr(self.task_name)}{"" if self.default is None else ", default=" + repr(self.default)})'
 
@@ -198,6 +243,28 @@ class FuncArg(BaseArgument):
         Function that is executed and passed as value.
     *args : tuple
         Positional arguments passed to func.
+    materialize : {'pre', 'post'}, optional
+        Whether to materialize before or after
+        passing to child processes/threads. By
+        default, ``param_materialize`` of the config.
+    cache : str, float, timedelta, optional
+        How the value is cached (in the process).
+        Options:
+
+        - ``None``: not cached (default)
+        - ``'cycle'``: for the scheduling cycle
+        - ``'session'``: until ``invalidate`` is called
+        - ``'shared'``: until ``invalidate`` is called and
+          the value is materialized only in the scheduler's
+          process. The process tasks get the value passed
+          (as a memory-mapped file if ``return_spool`` is set).
+        - Timedelta, seconds or timespan string: time to live
+
+        If the function takes arguments specific to the
+        task (``Task()``, ``TaskLogger()`` or
+        ``TerminationFlag()``), the value is cached
+        separately for each task. Such functions cannot
+        be cached with ``'shared'``.
     **kwargs : dict
         Keyword arguments passed to func.
 
@@ -233,14 +300,57 @@ class FuncArg(BaseArgument):
         >>> session.parameters
         Parameters(myarg1=FuncArg(myarg1), myarg2=FuncArg(myfunc))
     """
-    def __init__(self, __func:Callable, *args, materialize:Optional[Literal['pre', 'post']]=None, **kwargs):
+    def __init__(self, __func:Callable, *args, materialize:Optional[Literal['pre', 'post']]=None,
+                 cache:Union[None, Literal['cycle', 'session', 'shared'], str, float, datetime.timedelta]=None, **kwargs):
         self.func = __func
         self.materialize = materialize
+        self.cache = cache
         self.args = args
         self.kwargs = kwargs
 
+        self._ttl = None
+        if cache is not None and cache not in ('cycle', 'session', 'shared'):
+            self._ttl = (cache if isinstance(cache, datetime.timedelta) else to_timedelta(cache)).total_seconds()
+        # Whether the value is cached for each task
+        self._per_task = cache is not None and _depends_on_task(__func)
+        if self._per_task and cache == "shared":
+            raise ValueError(f"Function {__func!r} takes task specific arguments thus it cannot be cached with 'shared'")
+        self._cache_id = uuid4().hex
+        self._cache_version = 0
+        if cache is not None:
+            # Not kept after the argument is gone (in the
+            # process it was created, not in the children)
+            weakref.finalize(self, _drop_cached, self._cache_id)
+
     def get_value(self, **kwargs):
-        return self(**kwargs)
+        if self.cache is None:
+            return self(**kwargs)
+        cache_id, version = self._cache_id, self._cache_version
+        key = getattr(kwargs.get("task"), "name", None) if self._per_task else None
+        cycle = self._get_cycle(kwargs.get("session"))
+        now = time.monotonic()
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_id)
+            if cached is not None and cached[0] != version:
+                # Other version, drop all of its values
+                del _CACHE[cache_id]
+                cached = None
+            entry = cached[1].get(key) if cached is not None else None
+            if entry is not None and self._is_valid(entry, cycle, now):
+                return entry[0]
+            # Drop the stale value (expired) before
+            # materializing a new one
+            if entry is not None:
+                del cached[1][key]
+            _drop_expired(now)
+        value = self(**kwargs)
+        expires = now + self._ttl if self._ttl is not None else None
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_id)
+            if cached is None or cached[0] != version:
+                cached = _CACHE[cache_id] = (version, {})
+            cached[1][key] = (value, expires, cycle)
+        return value
 
     def __call__(self, **kwargs):
         param_kwargs = Parameters._from_signature(self.func)
@@ -249,12 +359,61 @@ class FuncArg(BaseArgument):
 
     def stage(self, **kwargs):
         session = kwargs['session']
+        if self.cache == "shared":
+            return self._stage_shared(**kwargs)
         materialize = self.materialize if self.materialize is not None else session.config.param_materialize
 
         if materialize == "pre":
             return self.get_value(**kwargs)
         return self
 
+    def invalidate(self):
+        "Clear the cached value"
+        _drop_cached(self._cache_id)
+        # The processes (ie. in the pool) miss their
+        # cached values as the version is changed
+        self._cache_version += 1
+
+    def _stage_shared(self, task=None, session=None, **kwargs):
+        # Materialized once in this process and the
+        # value is passed to the children
+        value = self.get_value(task=task, session=session, **kwargs)
+        spool_dir = session.config.return_spool
+        if spool_dir is None or task is None or task.get_execution() != "process":
+            return value
+        with _CACHE_LOCK:
+            spooled = _SHARED.get(self._cache_id)
+        if spooled is None or spooled[0] != self._cache_version:
+            if spooled is not None:
+                # File of an old version
+                with _CACHE_LOCK:
+                    _SHARED.pop(self._cache_id, None)
+                spooled[2].release(spooled[1])
+            handle = spool_return(value, spool_dir)
+            if handle is None:
+                # Small, passed as is
+                return value
+            spooled = (self._cache_version, handle, session._return_spool)
+            spooled[2].add(handle)
+            with _CACHE_LOCK:
+                _SHARED[self._cache_id] = spooled
+        _, handle, spool = spooled
+        spool.stage(handle, task.name)
+        return handle
+
+    def _is_valid(self, entry:tuple, cycle:Optional[int], now:float) -> bool:
+        _, expires, cached_cycle = entry
+        if self.cache == "cycle":
+            return cycle is not None and cycle == cached_cycle
+        if expires is not None:
+            return now < expires
+        return True
+
+    @staticmethod
+    def _get_cycle(session) -> Optional[int]:
+        scheduler = getattr(session, "scheduler", None)
+        return getattr(scheduler, "n_cycles", None)
+
     def __repr__(self):
         cls_name = type(self).__name__
         return f'{cls_name}({self.func.__name__})'
@@ -312,6 +471,24 @@ class CliArg(BaseArgument):
             return self.default
         return args[i+1]
 
+def _depends_on_task(func:Callable) -> bool:
+    "Whether the function takes arguments that depend on the task"
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        # Signature not available (ie. builtin)
+        return False
+    for param in params.values():
+        arg = param.default
+        if isinstance(arg, (TaskLogger, TerminationFlag)):
+            return True
+        if isinstance(arg, Task) and arg.name is None:
+            # The task the argument is materialized for
+            return True
+        if isinstance(arg, FuncArg) and _depends_on_task(arg.func):
+            return True
+    return False
+
 def argument(**kwargs):
     def wrapper(func):
         return FuncArg(func, **kwargs)
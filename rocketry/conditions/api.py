@@ -28,7 +28,29 @@ from .task import TaskExecutable, TaskRunning
 # Utility classes
 # ---------------
 
-class TimeCondWrapper(BaseCondition):
+class _CondWrapper(BaseCondition):
+    "Condition that represents another condition"
+
+    def observe(self, **kwargs):
+        return self.get_cond().observe(**kwargs)
+
+    def get_next_time(self, **kwargs):
+        return self.get_cond().get_next_time(**kwargs)
+
+    def _compile(self):
+        return self.get_cond()._compile()
+
+    def _get_cost(self):
+        return self.get_cond()._get_cost()
+
+    def _get_needed_logs(self, task=None, session=None):
+        return self.get_cond()._get_needed_logs(task=task, session=session)
+
+    def get_cond(self):
+        "Get condition the wrapper represents"
+        raise NotImplementedError
+
+class TimeCondWrapper(_CondWrapper):
 
     def __init__(self, cls_cond, cls_period, **kwargs):
         self._cls_cond = cls_cond
@@ -60,10 +82,6 @@ class TimeCondWrapper(BaseCondition):
         period = self._cls_period.starting(start)
         return self._get_cond(period)
 
-    def observe(self, **kwargs):
-        cond = self.get_cond()
-        return cond.observe(**kwargs)
-
     def get_cond(self):
         "Get condition the wrapper itself represents"
         period = self._cls_period(None, None)
@@ -78,16 +96,12 @@ class TimeCondWrapper(BaseCondition):
         except AttributeError:
             return str(self.get_cond())
 
-class TimeActionWrapper(BaseCondition):
+class TimeActionWrapper(_CondWrapper):
 
     def __init__(self, cls_cond, task=None):
         self.cls_cond = cls_cond
         self.task = task
 
-    def observe(self, **kwargs):
-        cond = self.get_cond()
-        return cond.observe(**kwargs)
-
     def __call__(self, task):
         return TimeActionWrapper(self.cls_cond, task=task)
 
@@ -122,26 +136,20 @@ class TimeActionWrapper(BaseCondition):
         "Get condition the wrapper represents"
         return self.cls_cond(task=self.task)
 
-class RetryWrapper(BaseCondition):
+class RetryWrapper(_CondWrapper):
 
     def __call__(self, n:int):
         return Retry(n)
 
-    def observe(self, **kwargs):
-        return self.get_cond().observe(**kwargs)
-
     def get_cond(self):
         "Get condition the wrapper represents"
         return Retry(-1)
 
-class RunningWrapper(BaseCondition):
+class RunningWrapper(_CondWrapper):
 
     def __init__(self, task=None):
         self.task = task
 
-    def observe(self, **kwargs):
-        return self.get_cond().observe(**kwargs)
-
     def __call__(self, task=None, more_than=None, less_than=None):
         if more_than is not None or less_than is not None or task is None:
             warnings.warn(
@@ -32,6 +32,7 @@ class IsEnv(BaseCondition):
     False
     """
     __parsers__ = {re.compile(r"env '(?P<env>.+)'"): "__init__"}
+    _cost = 1
 
     def __init__(self, env):
         self.env = env
@@ -74,6 +75,7 @@ class ParamExists(BaseCondition):
         re.compile(r"param '(?P<l>.+)' exists"): "_from_list",
         re.compile(r"param '(?P<key>.+)' is '(?P<value>.+)'"): "_from_key_value",
     }
+    _cost = 1
 
     param_keys:dict
     param_vals:tuple
@@ -8,6 +8,7 @@ class SchedulerCycles(BaseComparable):
     more/less/equal given amount of cycles of executing
     tasks.
     """
+    _cost = 1
 
     def get_measurement(self, session=Session()) -> int:
         n_cycles = session.scheduler.n_cycles
@@ -49,6 +50,7 @@ class SchedulerStarted(BaseCondition):
     >>> parse_condition("scheduler has run over 10 minutes")
     ~SchedulerStarted(period=TimeDelta('10 minutes'))
     """
+    _cost = 1
 
     def __init__(self, period=None):
         self.period = period
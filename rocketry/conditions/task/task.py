@@ -1,5 +1,6 @@
 from typing import Optional
 import datetime
+import math
 
 from redbird.oper import in_, greater_equal, between
 
@@ -8,9 +9,9 @@ from rocketry.log.utils import get_field_value
 from rocketry.pybox.time import to_timestamp
 from rocketry.time.construct import get_before, get_between, get_full_cycle, get_after, get_on
 from rocketry.args import Task, Session
-from rocketry.core.time.utils import get_period_span
+from rocketry.core.time.utils import get_period_span, get_next_start
 from rocketry.core.time import TimeDelta
-from .utils import DependMixin, TaskStatusMixin
+from .utils import DependMixin, TaskStatusMixin, _get_needed_since
 
 from ..time import IsPeriod
 
@@ -221,6 +222,14 @@ class TaskRunning(BaseComparable):
                     runs.append(created)
         return runs
 
+    def _get_needed_logs(self, task=None, session=None):
+        session = session if session is not None else self.session
+        task = self.task if self.task is not None else task
+        if task is None:
+            return {}
+        start, _ = get_period_span(self.period, session=session)
+        return {session._get_task_name(task): to_timestamp(start)}
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -269,6 +278,8 @@ class TaskExecutable(BaseCondition):
 
     """
 
+    _cost = 20
+
     def __init__(self, retries=None, task=None, period=None):
         self.retries = retries
         self.period = period
@@ -310,6 +321,36 @@ class TaskExecutable(BaseCondition):
             and has_not_terminated.observe(task=task, session=session)
         )
 
+    def _get_needed_logs(self, task=None, session=None):
+        session = session if session is not None else self.session
+        return _get_needed_since(self, task, session)
+
+    def get_next_time(self, task=None, session=None, **kwargs):
+        session = session if session is not None else self.session
+        if session.config.force_status_from_logs or self.period is None:
+            return None
+        task = self.task if self.task is not None else task
+        if self.observe(task=task, session=session):
+            return -math.inf
+
+        period = self.period
+        if isinstance(period, TimeDelta):
+            if type(period) is not TimeDelta or period.future or self.retries:
+                return None
+            # The task has finished on the past period
+            task = session[task]
+            last_occurs = [
+                task._get_last_action(action)
+                for action in ("success", "inaction", "fail", "terminate")
+            ]
+            last_occurs = [occur for occur in last_occurs if occur is not None]
+            if not last_occurs:
+                return None
+            return max(last_occurs) + period.past.total_seconds()
+        # Either not in the period or already finished
+        # on the ongoing interval of the period
+        return get_next_start(period, session=session, skip_current=True)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -337,6 +378,7 @@ class TaskRunnable(BaseCondition):
     Useful to set the given task to run once
     in given period.
     """
+    _cost = 20
 
     def __init__(self, task=None, period=None):
         self.period = period
@@ -360,6 +402,23 @@ class TaskRunnable(BaseCondition):
             and has_not_run.observe(task=task, session=session)
         )
 
+    def _get_needed_logs(self, task=None, session=None):
+        session = session if session is not None else self.session
+        return _get_needed_since(self, task, session)
+
+    def get_next_time(self, task=None, session=None, **kwargs):
+        session = session if session is not None else self.session
+        if session.config.force_status_from_logs or self.period is None:
+            return None
+        task = self.task if self.task is not None else task
+        period = self.period
+        if isinstance(period, TimeDelta):
+            has_not_run = TaskStarted(period=period, task=task) == 0
+            return has_not_run.get_next_time(task=task, session=session)
+        if self.observe(task=task, session=session):
+            return -math.inf
+        return get_next_start(period, session=session, skip_current=True)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -481,3 +540,19 @@ class Retry(BaseCondition):
             action='fail'
         ).count()
         return self.n >= n_failed_in_row
+
+    def _get_needed_logs(self, task=None, session=None):
+        if task is None or self.n in (0, -1):
+            return {}
+        # The fails after the latest other finish
+        last_non_fail = [
+            task._get_last_action(action)
+            for action in ('success', 'crash', 'inaction', 'terminate')
+        ]
+        last_non_fail = [last for last in last_non_fail if last is not None]
+        since = max(last_non_fail) if last_non_fail else -math.inf
+        return {task.name: since}
+
+    def get_next_time(self, task=None, session=None, **kwargs):
+        session = session if session is not None else self.session
+        return self._get_next_time_from_state(task=task, session=session)
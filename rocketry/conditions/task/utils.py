@@ -1,16 +1,33 @@
+import math
+
 from redbird.oper import in_, between
 
 from rocketry.core.condition import All, Any
 from rocketry.args import Task, Session
 from rocketry.core.condition import BaseCondition
 from rocketry.core.condition.base import BaseComparable
-from rocketry.core.time.utils import get_period_span
+from rocketry.core.time import TimeDelta
+from rocketry.core.time.utils import get_period_span, get_next_start
 from rocketry.pybox.time import to_timestamp
 from rocketry.log.utils import get_field_value
 
+def _get_needed_since(cond, task, session) -> dict:
+    "Get the logs needed from the start of the period of the condition"
+    task = cond.task if cond.task is not None else task
+    if task is None:
+        return {}
+    try:
+        task = session[task]
+    except KeyError:
+        return {}
+    period = cond.period if cond.period is not None else task.period
+    start, _ = get_period_span(period, session=session)
+    return {task.name: to_timestamp(start)}
+
 class DependMixin(BaseCondition):
 
     _dep_actions = None
+    _cost = 10 # Reads logs
 
     def __init__(self, depend_task, task=None):
         self.task = task
@@ -37,7 +54,18 @@ class DependMixin(BaseCondition):
         actual_task = session[self.task] if self.task is not None else task
         depend_task = session[self.depend_task]
 
-        #! TODO: use Task._last_success & Task._last_run if not none and not forced
+        if not session.config.force_status_from_logs:
+            depend_index = depend_task._get_action_index()
+            actual_index = actual_task._get_action_index()
+            if depend_index is not None and actual_index is not None:
+                last_depend_finish = depend_index.latest(self._dep_actions)
+                last_actual_start = actual_index.latest("run")
+                if last_depend_finish is None:
+                    return False
+                if last_actual_start is None:
+                    return True
+                return last_depend_finish > last_actual_start
+
         last_depend_finish = depend_task.logger.get_latest(action=in_(self._dep_actions))
         last_actual_start = actual_task.logger.get_latest(action="run")
 
@@ -50,9 +78,15 @@ class DependMixin(BaseCondition):
 
         return get_field_value(last_depend_finish, "created") > get_field_value(last_actual_start, "created")
 
+    def get_next_time(self, task=None, session=None, **kwargs):
+        # Only the tasks finishing or starting change the state
+        session = session if session is not None else self.session
+        return self._get_next_time_from_state(task=task, session=session)
+
 class TaskStatusMixin(BaseComparable):
 
     _action = None
+    _cost = 10 # May read logs
 
     def __init__(self, period=None, task=None):
         self.task = task
@@ -100,15 +134,54 @@ class TaskStatusMixin(BaseComparable):
                 if occurred_on_period:
                     return True
 
+            index = task._get_action_index()
+            if index is not None:
+                # All status changes are indexed
+                return index.count(self._action, to_timestamp(_start_), to_timestamp(_end_))
 
-        records = task.logger.get_records(
+        # Counted by the repo (as it may have an index for it)
+        return task.logger.filter_by(
             created=between(to_timestamp(_start_), to_timestamp(_end_)),
             action=in_(self._action) if isinstance(self._action, list) else self._action
-        )
-        return [
-            get_field_value(record, "created")
-            for record in records
-        ]
+        ).count()
+
+    def _get_needed_logs(self, task=None, session=None):
+        session = session if session is not None else self.session
+        return _get_needed_since(self, task, session)
+
+    def get_next_time(self, task=None, session=None, **kwargs):
+        session = session if session is not None else self.session
+        if session.config.force_status_from_logs:
+            return None
+        task = session[self.task] if self.task is not None else task
+        kwargs = {'task': task, 'session': session}
+
+        if self._is_any_over_zero():
+            # Only a new log record can make this true
+            return self._get_next_time_from_state(**kwargs)
+        if not self._is_equal_zero():
+            return None
+        if self.observe(**kwargs):
+            return -math.inf
+
+        # The condition is false because the action
+        # has occurred on the period
+        period = self.period if self.period is not None else task.period
+        if type(period) is TimeDelta:
+            if period.future:
+                return None
+            actions = [self._action] if isinstance(self._action, str) else self._action
+            last_occurs = [
+                task._get_last_action(action)
+                for action in actions
+            ]
+            last_occurs = [occur for occur in last_occurs if occur is not None]
+            if not last_occurs:
+                return None
+            return max(last_occurs) + period.past.total_seconds()
+        if isinstance(period, TimeDelta):
+            return None
+        return get_next_start(period, session=session, skip_current=True)
 
     def __str__(self):
         if hasattr(self, "_str"):
@@ -2,6 +2,7 @@ import datetime
 
 from rocketry.time import TimeDelta
 from rocketry.core.condition.base import BaseCondition
+from rocketry.core.time.utils import get_next_start
 from rocketry.args import Session
 
 class IsPeriod(BaseCondition):
@@ -28,6 +29,8 @@ class IsPeriod(BaseCondition):
     >>> from rocketry.time import TimeOfDay
     >>> is_morning = IsPeriod(period=TimeOfDay("06:00", "12:00")) # doctest: +SKIP
     """
+    _cost = 1
+
     def __init__(self, period):
         if isinstance(period, TimeDelta):
             raise AttributeError("TimeDelta does not have __contains__.")
@@ -37,6 +40,10 @@ class IsPeriod(BaseCondition):
         now = session._get_datetime_now()
         return now in self.period
 
+    def get_next_time(self, session=None, **kwargs):
+        session = session if session is not None else self.session
+        return get_next_start(self.period, session=session)
+
     def __str__(self):
         if hasattr(self, "_str"):
             return self._str
@@ -1,6 +1,7 @@
 from copy import copy
 from abc import abstractmethod
-from typing import Callable, Dict, Pattern, Union
+import math
+from typing import Callable, Dict, Optional, Pattern, Union
 
 from rocketry._base import RedBase
 from rocketry.core.parameters.parameters import Parameters
@@ -60,16 +61,74 @@ class BaseCondition(RedBase):
 
     """
 
+    _state_method = "get_state" # Method that observes the state
+    _cost = 5 # Relative cost of observing (checked first in All/Any if low)
+
     def observe(self, **kwargs):
         "Observe the status of the condition"
-        cond_params = Parameters._from_signature(self.get_state, **kwargs)
-        param_dict = cond_params.materialize(**kwargs)
+        session = kwargs.get("session", self.session)
+        cache = getattr(session, "_cond_cycle_cache", None)
+        if cache is not None:
+            # In a scheduling cycle
+            return cache.observe(self, self._observe, kwargs)
+        return self._observe(**kwargs)
+
+    def _observe(self, **kwargs):
+        param_dict = Parameters._compile_signature(self.get_state)(kwargs)
         return self.get_state(**param_dict)
 
+    def _compile(self) -> Callable[..., bool]:
+        """Compile the condition to a function that
+        observes it. The conditions of the containers
+        are ordered by their costs."""
+        return self.observe
+
+    def _get_cost(self) -> int:
+        return self._cost
+
     def __bool__(self) -> bool:
         """Check whether the condition holds."""
         return self.observe()
 
+    def get_next_time(self, **kwargs) -> Optional[float]:
+        """Get the earliest time (as timestamp) the
+        condition could be true, assuming no task
+        changes its state before that.
+
+        Used by the scheduler to sleep till something
+        can happen. Override for custom conditions
+        that are known to depend only on time.
+
+        Returns
+        -------
+        float, optional
+            Timestamp of the earliest time the
+            condition could be true. ``-math.inf``
+            if it could be true now, ``math.inf``
+            if only a change in a task can make it
+            true and None if this cannot be determined.
+        """
+        return None
+
+    def _get_next_time_from_state(self, **kwargs) -> float:
+        # For conditions that only change when tasks
+        # change their state (log a record)
+        return -math.inf if self.observe(**kwargs) else math.inf
+
+    def _get_needed_logs(self, task=None, session=None) -> Dict[str, float]:
+        """Get the log records the condition reads.
+
+        Used to compact the logs. Override for
+        conditions that read the log records.
+
+        Returns
+        -------
+        Dict[str, float]
+            Timestamp of the oldest log record the
+            condition needs by task names.
+        """
+        return {}
+
     @abstractmethod
     def get_state(self):
         """Get the status of the condition
@@ -119,9 +178,28 @@ class BaseCondition(RedBase):
         raise AttributeError(f"Condition {type(self)} is missing __str__.")
 
 
+def _merge_needed_logs(needed:Dict[str, float], other:Dict[str, float]):
+    for task_name, since in other.items():
+        if since < needed.get(task_name, math.inf):
+            needed[task_name] = since
+
+def _sort_by_cost(conds):
+    # Stable thus conditions with same cost
+    # are checked in the given order
+    return sorted(conds, key=lambda cond: cond._get_cost())
+
 class _ConditionContainer:
     "Wraps another condition"
 
+    def _get_cost(self) -> int:
+        return sum(cond._get_cost() for cond in self.subconditions)
+
+    def _get_needed_logs(self, task=None, session=None) -> Dict[str, float]:
+        needed = {}
+        for cond in self.subconditions:
+            _merge_needed_logs(needed, cond._get_needed_logs(task=task, session=session))
+        return needed
+
     def __getitem__(self, val):
         return self.subconditions[val]
 
@@ -156,6 +234,25 @@ class Any(_ConditionContainer, BaseCondition):
                 return True
         return False
 
+    def _compile(self) -> Callable[..., bool]:
+        funcs = tuple(cond._compile() for cond in _sort_by_cost(self.subconditions))
+        def observe(**kwargs):
+            for func in funcs:
+                if func(**kwargs):
+                    return True
+            return False
+        return observe
+
+    def get_next_time(self, **kwargs) -> Optional[float]:
+        # Could be true when any of the subconditions could be
+        next_time = math.inf
+        for subcond in self.subconditions:
+            sub_time = subcond.get_next_time(**kwargs)
+            if sub_time is None:
+                return None
+            next_time = min(next_time, sub_time)
+        return next_time
+
     def __str__(self):
         try:
             return super().__str__()
@@ -181,6 +278,31 @@ class All(_ConditionContainer, BaseCondition):
                 return False
         return True
 
+    def _compile(self) -> Callable[..., bool]:
+        funcs = tuple(cond._compile() for cond in _sort_by_cost(self.subconditions))
+        def observe(**kwargs):
+            for func in funcs:
+                if not func(**kwargs):
+                    return False
+            return True
+        return observe
+
+    def get_next_time(self, **kwargs) -> Optional[float]:
+        # Cannot be true before all of the subconditions could be
+        next_time = -math.inf
+        is_unknown = False
+        for subcond in self.subconditions:
+            sub_time = subcond.get_next_time(**kwargs)
+            if sub_time is None:
+                is_unknown = True
+            elif sub_time == math.inf:
+                # One of the subconditions can never be true
+                # by only time passing
+                return math.inf
+            else:
+                next_time = max(next_time, sub_time)
+        return None if is_unknown else next_time
+
     def __str__(self):
         try:
             return super().__str__()
@@ -198,6 +320,10 @@ class Not(_ConditionContainer, BaseCondition):
     def observe(self, **kwargs):
         return not self.condition.observe(**kwargs)
 
+    def _compile(self) -> Callable[..., bool]:
+        func = self.condition._compile()
+        return lambda **kwargs: not func(**kwargs)
+
     def __repr__(self):
         string = repr(self.condition)
         return f'Not({string})'
@@ -232,9 +358,14 @@ class Not(_ConditionContainer, BaseCondition):
 
 class AlwaysTrue(BaseCondition):
     "Condition that is always true"
+    _cost = 0
+
     def observe(self, **kwargs):
         return True
 
+    def get_next_time(self, **kwargs):
+        return -math.inf
+
     def __repr__(self):
         return 'true'
 
@@ -244,9 +375,14 @@ class AlwaysTrue(BaseCondition):
 class AlwaysFalse(BaseCondition):
     "Condition that is always false"
 
+    _cost = 0
+
     def observe(self, **kwargs):
         return False
 
+    def get_next_time(self, **kwargs):
+        return math.inf
+
     def __repr__(self):
         return 'false'
 
@@ -258,13 +394,14 @@ class BaseComparable(BaseCondition):
 
     _comp_attrs = ("__eq__", "__ne__", "__lt__", "__gt__", "__le__", "__ge__")
 
+    _state_method = "get_measurement"
+
     def __init__(self):
         self._comps = {}
         super().__init__()
 
-    def observe(self, **kwargs):
-        params = Parameters._from_signature(self.get_measurement, **kwargs)
-        param_dict = params.materialize(**kwargs)
+    def _observe(self, **kwargs):
+        param_dict = Parameters._compile_signature(self.get_measurement)(kwargs)
         value = self.get_measurement(**param_dict)
         if isinstance(value, bool):
             # Possibly has some optimization and already did the comparison
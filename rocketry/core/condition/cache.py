@@ -0,0 +1,87 @@
+import inspect
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from rocketry.core.time import TimePeriod
+from .base import BaseCondition
+
+_TASK_ARG: Dict[type, bool] = {}
+
+def _has_task_arg(cls:type) -> bool:
+    "Whether the state of the condition class is determined using the task it is checked for"
+    try:
+        return _TASK_ARG[cls]
+    except KeyError:
+        func = getattr(cls, cls._state_method)
+        has_task = "task" in inspect.signature(func).parameters
+        _TASK_ARG[cls] = has_task
+        return has_task
+
+def _freeze(value) -> Hashable:
+    """Turn a value to a key that is the same for equal
+    conditions. Unhashable values that are not conditions
+    or periods are keyed by their identity."""
+    if isinstance(value, (BaseCondition, TimePeriod)):
+        return (type(value),) + tuple(
+            (attr, _freeze(attr_value))
+            for attr, attr_value in vars(value).items()
+            if attr != "_str"
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return (dict,) + tuple((key, _freeze(item)) for key, item in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    # Type included as ie. 1 == True
+    return (type(value), value)
+
+class CondStateCache:
+    """Cache of the states of the conditions for
+    a scheduling cycle.
+
+    Conditions that are equal (same type and attributes)
+    share the cached state so each distinct condition is
+    evaluated once in a cycle regardless how many tasks
+    have it. Conditions whose state depends on the task
+    they are checked for are not cached. The states are
+    cleared when a task changes its state.
+    """
+
+    def __init__(self):
+        self._keys: Dict[int, Tuple[BaseCondition, Optional[Hashable]]] = {}
+        self._states: Dict[Hashable, Any] = {}
+
+    def observe(self, cond:BaseCondition, func:Callable, kwargs:dict):
+        "Get the state from the cache or observe it using the function"
+        key = self.get_key(cond, kwargs)
+        if key is None:
+            return func(**kwargs)
+        try:
+            return self._states[key]
+        except KeyError:
+            state = func(**kwargs)
+            self._states[key] = state
+            return state
+
+    def get_key(self, cond:BaseCondition, kwargs:dict) -> Optional[Hashable]:
+        "Get cache key of the condition (None if not cacheable)"
+        if not kwargs.keys() <= {"task", "session"}:
+            # Observed with something else
+            return None
+        try:
+            return self._keys[id(cond)][1]
+        except KeyError:
+            pass
+        if getattr(cond, "task", None) is None and _has_task_arg(type(cond)):
+            key = None
+        else:
+            key = _freeze(cond)
+        # Condition is stored so its id won't be reused during the cycle
+        self._keys[id(cond)] = (cond, key)
+        return key
+
+    def clear(self):
+        "Clear the cached states"
+        self._states.clear()
@@ -1 +1,2 @@
 from .adapter import TaskAdapter
+from .index import ActionIndex
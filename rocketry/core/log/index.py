@@ -0,0 +1,82 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Optional, Union
+
+from rocketry.log.utils import get_field_value
+
+class ActionIndex:
+    """Time-sorted timestamps of the status changes
+    (actions) of a task.
+
+    The index is seeded from the log records of the
+    task when first needed (by the conditions) and
+    fed when the task changes its status so the
+    counts and the latest occurrences of actions
+    can be searched without reading the logs. The
+    index can be used only if it is complete (seeded).
+    """
+
+    def __init__(self):
+        self._times: Dict[str, array] = {}
+        self.complete = False
+
+    def seed(self, records:Iterable):
+        "Set the index from log records"
+        self.clear()
+        for record in records:
+            action = get_field_value(record, "action")
+            if action is not None:
+                self.add(action, get_field_value(record, "created"))
+        self.complete = True
+
+    def add(self, action:str, created:float):
+        "Add an occurrence of an action"
+        try:
+            times = self._times[action]
+        except KeyError:
+            times = self._times[action] = array('d')
+        if not times or created >= times[-1]:
+            # Usually the newest
+            times.append(created)
+        else:
+            insort(times, created)
+
+    def count(self, action:Union[str, list], start:float, end:float) -> int:
+        "Count occurrences of the action(s) between start and end (inclusive)"
+        actions = [action] if isinstance(action, str) else action
+        n = 0
+        for act in actions:
+            times = self._times.get(act)
+            if times:
+                n += bisect_right(times, end) - bisect_left(times, start)
+        return n
+
+    def latest(self, action:Union[str, list], before:float=None) -> Optional[float]:
+        "Get the latest occurrence of the action(s) (optionally before or at given time)"
+        actions = [action] if isinstance(action, str) else action
+        latest = None
+        for act in actions:
+            times = self._times.get(act)
+            if not times:
+                continue
+            if before is None:
+                value = times[-1]
+            else:
+                pos = bisect_right(times, before)
+                if not pos:
+                    continue
+                value = times[pos - 1]
+            if latest is None or value > latest:
+                latest = value
+        return latest
+
+    def trim(self, before:float):
+        "Remove occurrences older than given time (the latest of each action is kept)"
+        for times in self._times.values():
+            pos = min(bisect_left(times, before), len(times) - 1)
+            if pos > 0:
+                del times[:pos]
+
+    def clear(self):
+        self._times.clear()
+        self.complete = False
@@ -1,2 +1,4 @@
 from .parameters import Parameters
 from .arguments import BaseArgument
+from .spool import SpooledReturn, ReturnSpool, spool_return
+from .returns import ReturnStore
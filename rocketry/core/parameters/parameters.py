@@ -1,10 +1,11 @@
 from collections.abc import Mapping
-from typing import Callable, Type, Union, TYPE_CHECKING
+from typing import Any, Callable, Type, Union, TYPE_CHECKING
 from functools import partial
 import inspect
+import weakref
 
 from rocketry._base import RedBase
-from rocketry.core.utils import is_pickleable
+from rocketry.core.utils import is_pickleable, is_pickle_checked
 from rocketry.core.utils import filter_keyword_args
 
 from .arguments import BaseArgument
@@ -12,6 +13,9 @@ from .arguments import BaseArgument
 if TYPE_CHECKING:
     import rocketry
 
+# Weak so that the functions (and their closures) are not kept alive
+_COMPILED: 'weakref.WeakKeyDictionary[Callable, Callable[[dict], dict]]' = weakref.WeakKeyDictionary()
+
 class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...)) would work
     """Parameter set for tasks.
 
@@ -60,6 +64,33 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
                 params[name] = default
         return params
 
+    @classmethod
+    def _compile_signature(cls, __func:Callable) -> Callable[[dict], dict]:
+        """Get a function that materializes the arguments
+        in the signature of the given function from a dict
+        of keyword arguments. Same as
+        ``_from_signature(func).materialize(**kwargs)`` but
+        the signature is inspected only once."""
+        func = getattr(__func, "__func__", __func) # Unbound method
+        try:
+            return _COMPILED[func]
+        except (KeyError, TypeError):
+            # TypeError if not weak referable
+            pass
+        getters = tuple(
+            (name, _compile_argument(param.default))
+            for name, param in inspect.signature(func).parameters.items()
+            if isinstance(param.default, BaseArgument)
+        )
+        def materialize(kwargs:dict) -> dict:
+            return {name: get_value(kwargs) for name, get_value in getters}
+        try:
+            _COMPILED[func] = materialize
+        except TypeError:
+            # Not weak referable (ie. builtin), not cached
+            pass
+        return materialize
+
 # For mapping interface
     def get(self, key, default=None):
         try:
@@ -177,11 +208,12 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
         state = self.__dict__.copy()
 
         # Remove unpicklable parameters
-        state["_params"] = {
-            key: val
-            for key, val in state["_params"].items()
-            if is_pickleable(val)
-        }
+        if is_pickle_checked():
+            state["_params"] = {
+                key: val
+                for key, val in state["_params"].items()
+                if is_pickleable(val)
+            }
         return state
 
 #    def __setstate__(self, newstate):
@@ -213,4 +245,12 @@ class Parameters(RedBase, Mapping): # Mapping so that mytask(**Parameters(...))
 def get_kwargs(__func, **kwargs) -> dict:
     "Get function arguments"
     sig_kwargs = Parameters._from_signature(__func).materialize(**kwargs)
-    return {**sig_kwargs, **kwargs}
\ No newline at end of file
+    return {**sig_kwargs, **kwargs}
+
+def _compile_argument(arg:BaseArgument) -> Callable[[dict], Any]:
+    "Get a function that materializes the argument (like Parameters.materialize)"
+    get_value = arg.get_value
+    get_sig_kwargs = Parameters._compile_signature(get_value)
+    def materialize(kwargs:dict):
+        return get_value(**{**get_sig_kwargs(kwargs), **kwargs})
+    return materialize
\ No newline at end of file
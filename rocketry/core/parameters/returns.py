@@ -0,0 +1,265 @@
+"""Store of the return values of the tasks."""
+
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .arguments import BaseArgument
+from .parameters import Parameters
+from .spool import SpooledReturn, _Pickler, spool_return
+
+if TYPE_CHECKING:
+    import rocketry
+
+class _Spilled:
+    "Return value written to a file"
+
+    __slots__ = ("handle",)
+
+    def __init__(self, handle:SpooledReturn):
+        self.handle = handle
+
+    def __repr__(self):
+        return f'<spilled to {self.handle.path!r}>'
+
+class ReturnStore(Parameters):
+    """Return values of the tasks.
+
+    The store can be bounded by the size of the
+    values (``returns_max_size``) and by the time
+    since the values were last used
+    (``returns_max_age``) in the session's config.
+    The least recently used values are evicted
+    first. Evicted values are spilled to the
+    directory ``returns_spill`` (if set) and read
+    back when needed. Otherwise they are removed.
+
+    The sizes are the sizes of the values pickled.
+    Returns passed as memory-mapped files
+    (``return_spool``) are not evicted.
+
+    Parameters
+    ----------
+    session : rocketry.Session, optional
+        Session of which config is used. If not
+        given, the store is not bounded.
+    """
+
+    def __init__(self, _param=None, session:'rocketry.Session'=None, **params):
+        super().__init__(_param, **params)
+        self.session = session
+        self._sizes: Dict[Any, int] = {}
+        self._used: 'OrderedDict[Any, float]' = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.spills = 0
+        self.evictions = 0
+        for key in self._params:
+            self._used[key] = time.monotonic()
+        self._spilled = set()
+        # Thread tasks set their returns from their threads
+        self._lock = threading.RLock()
+        # Remove the files at exit (or when garbage collected)
+        weakref.finalize(self, _remove_files, self._spilled)
+
+    def _get(self, __item, **kwargs):
+        item = __item
+        if callable(item) and hasattr(item, "__rocketry__") and "param_name" in item.__rocketry__:
+            item = item.__rocketry__['param_name']
+        with self._lock:
+            try:
+                value = self._params[item]
+            except KeyError:
+                self.misses += 1
+                raise
+            if isinstance(value, _Spilled):
+                value = self._reload(item, value)
+            else:
+                self.hits += 1
+                self._touch(item)
+        return value if not isinstance(value, BaseArgument) else value.get_value(**kwargs)
+
+    def __setitem__(self, key, item):
+        with self._lock:
+            self._discard(key)
+            self._params[key] = item
+            self._touch(key)
+            if self._get_limits()[0] is not None:
+                self._account(key)
+            self.evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self._params:
+                raise KeyError(key)
+            self._discard(key)
+            del self._params[key]
+
+    def update(self, params):
+        params = params._params if isinstance(params, Parameters) else params
+        for key, value in params.items():
+            self[key] = value
+
+    def clear(self):
+        "Empty the parameters"
+        with self._lock:
+            for key in list(self._params):
+                self._discard(key)
+            self._params = {}
+
+    def evict(self, now:float=None) -> int:
+        """Evict the values exceeding the limits.
+
+        Returns
+        -------
+        int
+            Number of values evicted.
+        """
+        max_size, max_age, spill = self._get_limits()
+        if max_size is None and max_age is None:
+            return 0
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            if max_size is not None:
+                for key in self._used:
+                    if key not in self._sizes:
+                        self._account(key)
+
+            n_evicted = 0
+            for key, used in list(self._used.items()):
+                too_old = max_age is not None and now - used > max_age
+                too_large = max_size is not None and self._size > max_size
+                if not too_old and not too_large:
+                    # Least recently used first
+                    break
+                self._evict(key, spill)
+                n_evicted += 1
+        return n_evicted
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        "Metrics of the store"
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "spills": self.spills,
+                "evictions": self.evictions,
+                "size": self._size,
+                "spilled": sum(isinstance(value, _Spilled) for value in self._params.values()),
+            }
+
+    def _get_limits(self):
+        config = getattr(self.session, "config", None)
+        if config is None:
+            return None, None, None
+        max_age = config.returns_max_age
+        return (
+            config.returns_max_size,
+            max_age.total_seconds() if max_age is not None else None,
+            config.returns_spill,
+        )
+
+    def _touch(self, key):
+        if isinstance(self._params[key], SpooledReturn):
+            # Already in a file
+            return
+        self._used[key] = time.monotonic()
+        self._used.move_to_end(key)
+
+    def _account(self, key):
+        size = _get_size(self._params[key])
+        self._sizes[key] = size
+        self._size += size
+
+    def _evict(self, key, spill:Optional[str]):
+        value = self._params[key]
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self._size -= size
+        del self._used[key]
+        self.evictions += 1
+
+        handle = None
+        if spill is not None:
+            try:
+                handle = spool_return(value, spill, min_size=0, keep_pickle=False)
+            except Exception:
+                # Not pickleable, cannot be spilled
+                pass
+        if handle is not None:
+            self._params[key] = _Spilled(handle)
+            self._spilled.add(handle.path)
+            self.spills += 1
+        else:
+            del self._params[key]
+
+    def _reload(self, key, spilled:_Spilled):
+        value = spilled.handle.load()
+        self.reloads += 1
+        # Back to memory (may evict others)
+        self[key] = value
+        return value
+
+    def _discard(self, key):
+        # Remove the value from the bookkeeping
+        value = self._params.get(key)
+        if isinstance(value, _Spilled):
+            self._spilled.discard(value.handle.path)
+            _remove_files([value.handle.path])
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self._size -= size
+        self._used.pop(key, None)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["session"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+class _SizeCounter:
+    "File-like that only counts the bytes"
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+def _get_size(value) -> int:
+    "Get size of a value (pickled)"
+    if isinstance(value, SpooledReturn):
+        return 0
+    counter = _SizeCounter()
+    buffers = []
+    try:
+        pickler = _Pickler(counter, protocol=5, buffer_callback=buffers.append)
+        pickler.dump(value)
+    except Exception:
+        # Not pickleable
+        return sys.getsizeof(value)
+    return (
+        counter.size
+        + sum(memoryview(buffer).nbytes for buffer in buffers)
+        + sum(blob.nbytes for blob in pickler.blobs)
+    )
+
+def _remove_files(paths):
+    for path in list(paths):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
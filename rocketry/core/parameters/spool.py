@@ -0,0 +1,242 @@
+"""Passing large return values of process
+tasks via memory-mapped files."""
+
+import atexit
+import io
+import mmap
+import os
+import pickle
+import tempfile
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .arguments import BaseArgument
+
+_ALIGNMENT = 64 # Of the buffers in the file (for ie. NumPy)
+MIN_SPOOL_SIZE = 1_000_000 # Bytes in buffers to spool a return
+
+class _Pickler(pickle.Pickler):
+    # Bytes and bytearrays are always pickled in-band
+    # thus they are passed as persistent IDs. They are
+    # copied from the file when read.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blobs = []
+
+    def persistent_id(self, obj):
+        if type(obj) in (bytes, bytearray) and len(obj) >= _ALIGNMENT:
+            self.blobs.append(memoryview(obj))
+            return (type(obj).__name__, len(self.blobs) - 1)
+        return None
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, file, blobs, **kwargs):
+        super().__init__(file, **kwargs)
+        self.blobs = blobs
+
+    def persistent_load(self, pid):
+        type_name, index = pid
+        cls = {"bytes": bytes, "bytearray": bytearray}[type_name]
+        return cls(self.blobs[index])
+
+def spool_return(value, directory:str, min_size:int=MIN_SPOOL_SIZE, keep_pickle:bool=True) -> Optional['SpooledReturn']:
+    """Write the buffers of a return value to a file
+    in the directory.
+
+    The value is pickled with out-of-band buffers
+    (ie. NumPy arrays and objects consisting of
+    them, such as Pandas DataFrames). The buffers,
+    bytes and bytearrays are written to the file
+    and the rest of the pickle is kept in the
+    returned handle.
+
+    Parameters
+    ----------
+    min_size : int
+        Minimum size of the buffers (in bytes) to
+        write the file.
+    keep_pickle : bool
+        Whether to keep the rest of the pickle in
+        the handle. If False, it is also written
+        to the file.
+
+    Returns
+    -------
+    SpooledReturn, optional
+        Handle of the value. None if the value has
+        less than min_size bytes in buffers.
+    """
+    pickled, raws, n_buffers = _dump(value)
+    if sum(raw.nbytes for raw in raws) < min_size:
+        return None
+    if not keep_pickle:
+        raws.append(memoryview(pickled))
+
+    fd, path = tempfile.mkstemp(prefix="return-", suffix=".bin", dir=directory)
+    positions = []
+    with os.fdopen(fd, "wb") as file:
+        offset = 0
+        for raw in raws:
+            padding = -offset % _ALIGNMENT
+            file.write(b"\0" * padding)
+            offset += padding
+            file.write(raw)
+            positions.append((offset, raw.nbytes))
+            offset += raw.nbytes
+    if not keep_pickle:
+        pickled = positions.pop()
+    return SpooledReturn(path, pickled, positions[:n_buffers], positions[n_buffers:])
+
+def _dump(value) -> Tuple[bytes, List[memoryview], int]:
+    "Pickle the value and get its buffers"
+    for out_of_band in (True, False):
+        buffers = []
+        file = io.BytesIO()
+        pickler = _Pickler(file, protocol=5, buffer_callback=buffers.append if out_of_band else None)
+        pickler.dump(value)
+        try:
+            raws = [buffer.raw() for buffer in buffers]
+        except BufferError:
+            # Not contiguous, pickled in-band
+            continue
+        return file.getvalue(), raws + [blob.cast("B") for blob in pickler.blobs], len(raws)
+
+class SpooledReturn(BaseArgument):
+    """Return value of a task stored in a file.
+
+    The file is mapped to memory (read-only) when
+    the value is read thus the buffers of the value
+    are not copied and the processes reading the
+    value share the memory.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file of the buffers.
+    pickled : bytes, tuple
+        Pickle of the value without the buffers or
+        its offset and size in the file.
+    buffers : list of tuples
+        Offsets and sizes of the out-of-band buffers
+        in the file.
+    blobs : list of tuples
+        Offsets and sizes of the bytes and bytearrays
+        in the file.
+    """
+
+    def __init__(self, path:str, pickled:Union[bytes, Tuple[int, int]], buffers:List[Tuple[int, int]], blobs:List[Tuple[int, int]]=()):
+        self.path = path
+        self.pickled = pickled
+        self.buffers = buffers
+        self.blobs = blobs
+
+    def get_value(self, **kwargs) -> Any:
+        return self.load()
+
+    def stage(self, **kwargs) -> 'SpooledReturn':
+        # Passed as is, the value is read in the child
+        return self
+
+    def load(self) -> Any:
+        "Read the value (buffers mapped from the file)"
+        with open(self.path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        pickled = self.pickled
+        if isinstance(pickled, tuple):
+            offset, size = pickled
+            pickled = view[offset:offset + size]
+        unpickler = _Unpickler(
+            io.BytesIO(pickled),
+            blobs=[view[offset:offset + size] for offset, size in self.blobs],
+            buffers=[view[offset:offset + size] for offset, size in self.buffers],
+        )
+        return unpickler.load()
+
+    def __eq__(self, other):
+        if isinstance(other, SpooledReturn):
+            return self.path == other.path
+        return False
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __repr__(self):
+        return f'SpooledReturn({self.path!r})'
+
+    def __str__(self):
+        return f'Return spooled to {self.path!r}'
+
+class ReturnSpool:
+    """Reference counts of the spooled returns.
+
+    A file is removed when it is no longer the
+    return of its task and the tasks it was
+    passed to have finished. The processes that
+    have already mapped the file can still read
+    it (except on Windows, where the removal is
+    retried later).
+    """
+
+    def __init__(self):
+        self._refs: Dict[str, int] = {}
+        self._staged: Dict[str, List[str]] = {}
+        _SPOOLS.add(self)
+
+    def add(self, value:SpooledReturn):
+        "Add a reference to a spooled return"
+        self._refs[value.path] = self._refs.get(value.path, 0) + 1
+
+    def release(self, value:SpooledReturn):
+        "Release a reference to a spooled return"
+        self._release(value.path)
+
+    def stage(self, value:SpooledReturn, task_name:str):
+        "Add a reference till the task finishes"
+        self.add(value)
+        self._staged.setdefault(task_name, []).append(value.path)
+
+    def release_staged(self, task_name:str):
+        "Release the references of a finished task"
+        for path in self._staged.pop(task_name, ()):
+            self._release(path)
+        self._remove_failed()
+
+    def clear(self):
+        "Remove all the files"
+        for path in list(self._refs):
+            self._remove(path)
+        self._refs.clear()
+        self._staged.clear()
+
+    def _release(self, path:str):
+        n = self._refs.get(path, 0) - 1
+        if n > 0:
+            self._refs[path] = n
+        else:
+            self._refs.pop(path, None)
+            self._remove(path)
+
+    def _remove(self, path:str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Still mapped (Windows)
+            self._refs.setdefault(path, 0)
+
+    def _remove_failed(self):
+        for path, n in list(self._refs.items()):
+            if n == 0:
+                del self._refs[path]
+                self._remove(path)
+
+_SPOOLS = weakref.WeakSet()
+
+@atexit.register
+def _clear_spools():
+    for spool in list(_SPOOLS):
+        spool.clear()
@@ -0,0 +1,290 @@
+"""Pools of reusable processes and threads
+for running tasks that have execution as
+process or thread."""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import count
+import multiprocessing
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from rocketry.core.utils.process import get_context
+
+try:
+    import resource
+except ImportError: # pragma: no cover
+    # Not available on Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from rocketry import Session
+    from rocketry.core import Task
+    from rocketry.log.transport import LogWriter
+
+@dataclass
+class WorkerDone:
+    """Message a worker puts to its log pipe after
+    a run is finished. As it comes through the same
+    pipe, the log records of the run are handled
+    before the run is considered finished."""
+    worker_id: int
+    rss: Optional[int] = None # Peak resident set size (bytes)
+
+def _get_max_rss() -> Optional[int]:
+    if resource is None: # pragma: no cover
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+def _serve(worker_id:int, conn, log_queue:'LogWriter'):
+    "Run tasks sent by the pool. Run in the worker process."
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            # Asked to stop
+            break
+        task, kwargs = job
+        try:
+            task._run_as_process(queue=log_queue, **kwargs)
+        finally:
+            log_queue.put(WorkerDone(worker_id=worker_id, rss=_get_max_rss()))
+            log_queue.flush()
+
+class PooledProcess:
+    """A run of a task in a worker process of the pool.
+
+    Mimics ``multiprocessing.Process`` so that the run
+    can be inspected and terminated like a run in
+    a dedicated process. Terminating the run terminates
+    the worker as well."""
+
+    def __init__(self, worker:'_Worker'):
+        self.worker = worker
+        self.done = False
+
+    @property
+    def pid(self) -> int:
+        return self.worker.process.pid
+
+    def is_alive(self) -> bool:
+        return not self.done and self.worker.process.is_alive()
+
+    def terminate(self):
+        if not self.done:
+            self.worker.pool._discard(self.worker)
+            self.worker.process.terminate()
+
+    def join(self, timeout:float=None):
+        if not self.done:
+            self.worker.process.join(timeout)
+
+class _Worker:
+
+    def __init__(self, pool:'ProcessPool', worker_id:int, daemon:bool):
+        self.pool = pool
+        self.id = worker_id
+        self.n_runs = 0
+        self.run: Optional[PooledProcess] = None
+
+        conn_recv, self.conn = multiprocessing.Pipe(duplex=False)
+        log_writer = pool.log_queue.open_pipe()
+        self.process = get_context().Process(
+            target=_serve,
+            args=(worker_id, conn_recv, log_writer),
+            daemon=daemon,
+        )
+        try:
+            self.process.start()
+        finally:
+            conn_recv.close()
+            log_writer.close()
+
+class ProcessPool:
+    """Pool of worker processes that are reused
+    across the runs of tasks.
+
+    The workers are created when needed and the
+    size of the pool is limited by ``max_process_count``.
+    A worker is replaced by a new one after it has
+    run ``process_pool_max_runs`` runs or its memory
+    exceeds ``process_pool_max_rss`` (in megabytes).
+
+    Parameters
+    ----------
+    session : rocketry.Session
+        Session of the pool.
+    """
+
+    def __init__(self, session:'Session'):
+        self.session = session
+        self.log_queue = session.scheduler._log_queue
+
+        self._workers: Dict[int, _Worker] = {}
+        self._idle: List[_Worker] = []
+        self._ids = count()
+
+    def submit(self, data:bytes) -> PooledProcess:
+        """Send a task to be run on an idle worker
+
+        Parameters
+        ----------
+        data : bytes
+            The task and the keyword arguments of
+            its ``_run_as_process`` pickled (see
+            ``Task._dump_launch``).
+        """
+        worker = self._get_idle()
+        try:
+            worker.conn.send_bytes(data)
+        except Exception:
+            # Failed to send
+            self._idle.append(worker)
+            raise
+        worker.run = PooledProcess(worker)
+        return worker.run
+
+    def release(self, msg:WorkerDone):
+        "Mark the run of a worker finished"
+        worker = self._workers.get(msg.worker_id)
+        if worker is None or worker.run is None:
+            # The worker has been terminated
+            return
+        worker.run.done = True
+        worker.run = None
+        worker.n_runs += 1
+
+        if self._is_expired(worker, msg.rss) or len(self._workers) > self.session.config.max_process_count:
+            self._stop(worker)
+        else:
+            self._idle.append(worker)
+
+    def close(self, timeout:float=5):
+        "Stop all workers"
+        for worker in list(self._workers.values()):
+            if worker.run is None:
+                self._stop(worker, timeout=timeout)
+            else:
+                worker.run.terminate()
+                worker.process.join(timeout)
+
+    @property
+    def n_workers(self) -> int:
+        return len(self._workers)
+
+    def _get_idle(self) -> _Worker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.process.is_alive():
+                return worker
+            self._discard(worker)
+        worker_id = next(self._ids)
+        worker = _Worker(self, worker_id, daemon=self.session.config.tasks_as_daemon)
+        self._workers[worker_id] = worker
+        return worker
+
+    def _is_expired(self, worker:_Worker, rss:Optional[int]) -> bool:
+        config = self.session.config
+        max_runs = config.process_pool_max_runs
+        max_rss = config.process_pool_max_rss
+        if max_runs is not None and worker.n_runs >= max_runs:
+            return True
+        if max_rss is not None and rss is not None and rss > max_rss * 1024 ** 2:
+            return True
+        return False
+
+    def _stop(self, worker:_Worker, timeout:float=5):
+        self._discard(worker)
+        try:
+            worker.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        worker.process.join(timeout)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+        worker.conn.close()
+
+    def _discard(self, worker:_Worker):
+        self._workers.pop(worker.id, None)
+        if worker in self._idle:
+            self._idle.remove(worker)
+
+class PooledThread:
+    """A run of a task in a thread pool.
+
+    Mimics ``threading.Thread`` so that the run
+    can be inspected like a run in a dedicated
+    thread. The run is alive also when it is
+    waiting in the queue of the pool."""
+
+    def __init__(self, future):
+        self.future = future
+
+    def is_alive(self) -> bool:
+        return not self.future.done()
+
+    def join(self, timeout:float=None):
+        wait([self.future], timeout=timeout)
+
+class ThreadPool:
+    """Bounded pool of threads for running tasks.
+
+    The runs exceeding the size of the pool wait
+    in a queue till a thread is free.
+
+    Parameters
+    ----------
+    max_workers : int
+        Maximum number of threads.
+    name : str
+        Prefix for the names of the threads.
+    """
+
+    def __init__(self, max_workers:int, name:str="rocketry"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._n_queued = 0
+        self._n_active = 0
+
+    @property
+    def n_queued(self) -> int:
+        "Number of runs waiting for a free thread"
+        return self._n_queued
+
+    @property
+    def n_active(self) -> int:
+        "Number of runs currently running"
+        return self._n_active
+
+    def submit(self, func:Callable, *args) -> PooledThread:
+        "Put a function to be run on the pool"
+        with self._lock:
+            self._n_queued += 1
+        try:
+            future = self._executor.submit(self._run, func, *args)
+        except Exception:
+            with self._lock:
+                self._n_queued -= 1
+            raise
+        return PooledThread(future)
+
+    def close(self, wait:bool=True):
+        "Shut down the threads of the pool"
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, func:Callable, *args):
+        with self._lock:
+            self._n_queued -= 1
+            self._n_active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._n_active -= 1
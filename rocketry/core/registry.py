@@ -0,0 +1,207 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableSet
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from rocketry.core import Task
+
+class TaskRegistry(MutableSet):
+    """Collection of the tasks of a session.
+
+    Behaves like a set of tasks but keeps indexes
+    up to date so that the scheduler does not need
+    to go through all of the tasks for common
+    operations:
+
+    - name: task lookup by name
+    - priority: tasks ordered by priority
+    - execution: tasks by their execution type
+    - prefix: tasks by the start of their name (ie. group prefix)
+    - runs: tasks that have runs in their run stack (possibly alive)
+
+    The tasks notify the registry when their indexed
+    attributes change.
+
+    Parameters
+    ----------
+    tasks : iterable of rocketry.core.Task, optional
+        Initial tasks.
+    """
+
+    def __init__(self, tasks:Iterable['Task']=None):
+        self._by_name: Dict[str, 'Task'] = {}
+        self._names: Dict['Task', str] = {}
+
+        # Priority order. Kept sorted by key (-priority, insertion order)
+        self._counter = count()
+        self._order_keys: Dict['Task', Tuple[int, int]] = {}
+        self._ordered_keys: List[Tuple[int, int]] = []
+        self._ordered: List['Task'] = []
+
+        self._sorted_names: List[str] = []
+        self._by_execution: Dict[Optional[str], Set['Task']] = {}
+        self._executions: Dict['Task', Optional[str]] = {}
+        self._with_runs: Set['Task'] = set()
+
+        for task in tasks or ():
+            self.add(task)
+
+# Set interface
+    def __contains__(self, task) -> bool:
+        return task in self._names
+
+    def __iter__(self) -> Iterator['Task']:
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, task:'Task'):
+        "Add a task to the registry"
+        if task in self._names:
+            return
+        name = task.name
+        existing = self._by_name.get(name)
+        if existing is not None:
+            # Names are unique in the registry
+            self.discard(existing)
+
+        self._by_name[name] = task
+        self._names[task] = name
+        self._insert_sorted_name(name)
+
+        self._insert_order(task)
+        self._set_execution(task)
+        self._set_runs(task)
+
+    def discard(self, task:'Task'):
+        "Remove a task from the registry if it exists"
+        if task not in self._names:
+            return
+        name = self._names.pop(task)
+        self._remove_name(task, name)
+
+        self._remove_order(task)
+        execution = self._executions.pop(task)
+        self._by_execution[execution].discard(task)
+        self._with_runs.discard(task)
+
+    def remove(self, task:'Task'):
+        "Remove a task from the registry"
+        if task not in self._names:
+            raise KeyError(task)
+        self.discard(task)
+
+    def clear(self):
+        "Remove all tasks from the registry"
+        self.__init__()
+
+    def __repr__(self):
+        tasks = ', '.join(repr(name) for name in self._by_name)
+        return f'{type(self).__name__}({tasks})'
+
+# Queries
+    def get(self, name:str, default=None) -> Optional['Task']:
+        "Get task by name"
+        return self._by_name.get(name, default)
+
+    def get_ordered(self) -> List['Task']:
+        "Get tasks in order of priority (highest first)"
+        return list(self._ordered)
+
+    def get_by_execution(self, execution:Optional[str]) -> Set['Task']:
+        """Get tasks that have given execution. Note that
+        tasks that use the session default have None as
+        execution."""
+        return set(self._by_execution.get(execution, ()))
+
+    def get_by_prefix(self, prefix:str) -> List['Task']:
+        "Get tasks which name start with given prefix (ie. of a group)"
+        names = self._sorted_names
+        start = bisect_left(names, prefix)
+        tasks = []
+        for name in names[start:]:
+            if not name.startswith(prefix):
+                break
+            tasks.append(self._by_name[name])
+        return tasks
+
+    def get_with_runs(self) -> List['Task']:
+        "Get tasks that have runs (alive or not cleaned) in their run stack"
+        return list(self._with_runs)
+
+# Maintaining indexes
+    def reindex(self, task:'Task', attr:str=None):
+        """Update the indexes of a task after an attribute of
+        it has changed. If attr is not given, all indexes are
+        updated."""
+        if task not in self._names:
+            return
+        if attr is None or attr == "name":
+            self._rename(task)
+        if attr is None or attr == "priority":
+            _, seq = self._remove_order(task)
+            self._insert_order(task, seq=seq)
+        if attr is None or attr == "execution":
+            self._set_execution(task)
+        if attr is None or attr == "_run_stack":
+            self._set_runs(task)
+
+    def _rename(self, task):
+        old_name = self._names[task]
+        new_name = task.name
+        if old_name == new_name:
+            return
+        self._remove_name(task, old_name)
+        self._names[task] = new_name
+        # Renaming to a name of another task should not happen
+        # but if it does, the lookup keeps the original owner
+        if self._by_name.setdefault(new_name, task) is task:
+            self._insert_sorted_name(new_name)
+
+    def _remove_name(self, task, name):
+        if self._by_name.get(name) is task:
+            del self._by_name[name]
+            self._remove_sorted_name(name)
+
+    def _insert_order(self, task, seq:int=None):
+        # There may be extra rare situation that priority is not in the task
+        # for short period if it is being modified thus we use getattr
+        seq = next(self._counter) if seq is None else seq
+        key = (-getattr(task, "priority", 0), seq)
+        pos = bisect_right(self._ordered_keys, key)
+        self._ordered_keys.insert(pos, key)
+        self._ordered.insert(pos, task)
+        self._order_keys[task] = key
+
+    def _remove_order(self, task):
+        key = self._order_keys.pop(task)
+        pos = bisect_left(self._ordered_keys, key)
+        del self._ordered_keys[pos]
+        del self._ordered[pos]
+        return key
+
+    def _set_execution(self, task):
+        if task in self._executions:
+            self._by_execution[self._executions[task]].discard(task)
+        execution = task.execution
+        self._executions[task] = execution
+        self._by_execution.setdefault(execution, set()).add(task)
+
+    def _set_runs(self, task):
+        if task._run_stack:
+            self._with_runs.add(task)
+        else:
+            self._with_runs.discard(task)
+
+    def _insert_sorted_name(self, name):
+        # Only string names can be searched by prefix
+        # (names are ids if use_instance_naming)
+        if isinstance(name, str):
+            insort(self._sorted_names, name)
+
+    def _remove_sorted_name(self, name):
+        if isinstance(name, str):
+            pos = bisect_left(self._sorted_names, name)
+            del self._sorted_names[pos]
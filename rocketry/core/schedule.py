@@ -1,6 +1,6 @@
 import asyncio
-import multiprocessing
-from typing import TYPE_CHECKING, Optional
+import math
+from typing import TYPE_CHECKING, Dict, Optional
 import threading
 import time
 import sys
@@ -13,9 +13,14 @@ from queue import Empty
 
 from rocketry._base import RedBase
 from rocketry.core.condition import BaseCondition, AlwaysFalse
+from rocketry.core.condition.cache import CondStateCache
+from rocketry.core.time.clock import CycleClock
 from rocketry.core.task import Task
+from rocketry.core.parameters import ReturnStore
+from rocketry.core.pool import ProcessPool, ThreadPool, WorkerDone
 from rocketry.exc import SchedulerRestart, SchedulerExit, TaskLoggingError, TaskSetupError
 from rocketry.core.hook import _Hooker
+from rocketry.log.transport import LogReader
 
 if TYPE_CHECKING:
     from rocketry import Session
@@ -84,20 +89,33 @@ class Scheduler(RedBase):
         self._flag_restart = threading.Event()
         self._flag_enabled.set() # Not on hold by default
 
+        # Wake up event for hibernation (set when
+        # the scheduler is started as it is bound
+        # to the event loop)
+        self._loop = None
+        self._event_wake = None
+
         # is_alive is used by testing whether the scheduler is
         # still running or not
         self.is_alive = None
 
-        self._log_queue = multiprocessing.Queue(-1)
+        self._log_queue = LogReader()
+        self._process_pool = None
+        self._thread_pool = None
+        self._last_compact = None
+        self.launch_stats: Dict[str, dict] = {} # Pickling of the process tasks by task name
 
     @property
     def tasks(self):
 
         #! TODO: Is this needed?
-        tasks = self.session.get_tasks()
-        # There may be extra rare situation that priority is not in the task
-        # for short period if it is being modified thus we use getattr
-        return sorted(tasks, key=lambda task: getattr(task, "priority", 0), reverse=True)
+        # The registry keeps the tasks ordered by priority
+        return self.session.tasks.get_ordered()
+
+    @property
+    def _tasks_with_runs(self):
+        # Only these can have alive runs or exceptions
+        return self.session.tasks.get_with_runs()
 
     def __call__(self):
         return self.run()
@@ -113,6 +131,11 @@ class Scheduler(RedBase):
         self._flag_restart.clear()
         self._flag_enabled.set()
 
+        self._loop = asyncio.get_running_loop()
+        self._event_wake = asyncio.Event()
+        # Logs from the processes are read when they arrive
+        self._log_queue.attach(self._loop, on_receive=self._wake_up)
+
         self.is_alive = True
         exception = None
         try:
@@ -127,7 +150,7 @@ class Scheduler(RedBase):
 
                 await self.run_cycle()
 
-                # self.maintain()
+                self.maintain()
         except SystemExit as exc:
             self.logger.info('Shutting down...', extra={"action": "shutdown"})
             exception = exc
@@ -151,7 +174,11 @@ class Scheduler(RedBase):
         else:
             self.logger.info('Purpose completed. Shutting down...', extra={"action": "shutdown"})
         finally:
-            await self.shut_down(exception=exception)
+            try:
+                await self.shut_down(exception=exception)
+            finally:
+                self._log_queue.detach()
+                self.session._dependency_graph = None
 
     async def run_cycle(self):
         """Run one round of tasks.
@@ -166,23 +193,31 @@ class Scheduler(RedBase):
         tasks = self.tasks
         self.logger.debug(f"Beginning cycle with {len(tasks)} tasks...", extra={"action": "run"})
 
+        if self._event_wake is not None:
+            # Changes after this are handled in the next cycle
+            self._event_wake.clear()
+
         # Running hooks
         hooker = _Hooker(self.session.hooks.scheduler_cycle)
         hooker.prerun(scheduler=self)
 
-        for task in tasks:
-            with task.lock:
-                self.handle_logs()
-                task._clean_run_stack()
-                if task.on_startup or task.on_shutdown:
-                    # Startup or shutdown tasks are not run in main sequence
-                    pass
-                elif self._flag_enabled.is_set() and self.is_task_runnable(task):
-                    # Run the actual task
-                    await self.run_task(task)
-                    # Reset force_run as a run has forced
-                    task.force_run = False
-                await task._check_termination()
+        # Equal conditions are checked once in the cycle
+        # and with the same time (unless a task changes
+        # its state)
+        self.session._cond_cycle_cache = CondStateCache()
+        self.session._cycle_clock = CycleClock(self.session)
+        graph = self.session._dependency_graph
+        if graph is not None:
+            graph.triggered.clear()
+        started = set()
+        try:
+            for task in tasks:
+                await self._check_task(task, started)
+            if graph is not None:
+                await self._check_triggered(graph, tasks, started)
+        finally:
+            self.session._cond_cycle_cache = None
+            self.session._cycle_clock = None
         self.handle_logs()
         self.check_thread_errors()
         # Running hooks
@@ -190,6 +225,33 @@ class Scheduler(RedBase):
 
         self.n_cycles += 1
 
+    async def _check_task(self, task:Task, started:set):
+        "Run the task if runnable and terminate if should"
+        with task.lock:
+            self._handle_received_logs()
+            task._clean_run_stack()
+            if task.on_startup or task.on_shutdown:
+                # Startup or shutdown tasks are not run in main sequence
+                pass
+            elif self._flag_enabled.is_set() and self.is_task_runnable(task):
+                # Run the actual task
+                await self.run_task(task)
+                # Reset force_run as a run has forced
+                task.force_run = False
+                started.add(task.name)
+            await task._check_termination()
+
+    async def _check_triggered(self, graph, tasks:list, started:set):
+        """Check again the tasks whose dependencies changed
+        status during the cycle (each is started once per
+        cycle at most)"""
+        while graph.triggered:
+            triggered = graph.triggered
+            graph.triggered = set()
+            for task in tasks:
+                if task.name in triggered and task.name not in started:
+                    await self._check_task(task, started)
+
     def check_shut_cond(self, cond: Optional[BaseCondition]) -> bool:
         # Note that failure in scheduler shut_cond always crashes the system
         if cond is None:
@@ -225,7 +287,7 @@ class Scheduler(RedBase):
 
     async def terminate_all(self, reason:str=None):
         """Terminate all running tasks."""
-        for task in self.tasks:
+        for task in self._tasks_with_runs:
             if task.is_alive():
                 await self.terminate_task(task, reason=reason)
 
@@ -255,13 +317,23 @@ class Scheduler(RedBase):
     def handle_logs(self):
         """Handle the status queue and carries the logging on their behalf."""
         # TODO: This could be maybe done in the tasks
-        queue = self._log_queue
+        self._handle_logs(self._log_queue.get_nowait)
+
+    def _handle_received_logs(self):
+        "Handle the logs already read from the processes (without polling them)"
+        self._handle_logs(self._log_queue.get_received)
+
+    def _handle_logs(self, get_record):
         while True:
             try:
-                record = queue.get(block=False)
+                record = get_record()
             except Empty:
                 break
             else:
+                if isinstance(record, WorkerDone):
+                    # A pooled process finished a run
+                    self._get_process_pool().release(record)
+                    continue
                 self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
                 task = self.session[record.task_name]
                 if record.action == "fail":
@@ -289,11 +361,121 @@ class Scheduler(RedBase):
     async def _hibernate(self):
         """Go to sleep and wake up when next task can be executed."""
         delay = self.session.config.cycle_sleep
-        if delay is not None:
-            await asyncio.sleep(delay)
-        else:
+        if delay is None:
             # delay is None, sleep 0 to release the async execution
             await asyncio.sleep(0)
+            return
+
+        next_time = self._get_next_time()
+        if next_time is not None:
+            now = self.session.get_time()
+            if next_time > now:
+                # Nothing can happen before the next time
+                # thus no need to check the tasks before it
+                delay = next_time - now
+        await self._sleep(delay)
+
+    async def _sleep(self, delay:float):
+        "Sleep given seconds or till woken up"
+        event = self._event_wake
+        if event is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=delay if delay != math.inf else None)
+        except asyncio.TimeoutError:
+            pass
+
+    def _wake_up(self):
+        "Wake up the scheduler from hibernation"
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            is_same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            # Called outside of async (ie. from other thread)
+            is_same_loop = False
+
+        if is_same_loop:
+            self._event_wake.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(self._event_wake.set)
+            except RuntimeError:
+                # Loop was closed in between
+                pass
+
+    def _get_next_time(self) -> Optional[float]:
+        """Get the earliest time (as timestamp) when a task
+        could be started or the scheduler could shut down.
+        None if cannot be determined."""
+        session = self.session
+        if session.config.time_func is not None or self.on_hold:
+            # Cannot sleep by custom time or the
+            # scheduler is controlled manually
+            return None
+
+        tasks = self.tasks
+        if any(task.is_alive() for task in self._tasks_with_runs):
+            # Running tasks need to be checked for
+            # finishing and terminating
+            return None
+
+        try:
+            shut_cond = session.config.shut_cond
+            next_time = (
+                shut_cond.get_next_time(scheduler=self, session=session)
+                if shut_cond is not None
+                else math.inf
+            )
+            if next_time is None:
+                return None
+            for task in tasks:
+                if task.on_startup or task.on_shutdown:
+                    continue
+                if task.batches:
+                    return -math.inf
+                if task.disabled:
+                    continue
+                task_time = task.start_cond.get_next_time(task=task, session=session)
+                if task_time is None:
+                    return None
+                next_time = min(next_time, task_time)
+        except Exception:
+            # The failure is handled when actually
+            # checking the conditions
+            return None
+        return next_time
+
+    def _record_launch(self, task_name:str, payload_size:int, pickle_time:float):
+        "Record a process task pickled to a process"
+        stats = self.launch_stats.get(task_name)
+        if stats is None:
+            stats = self.launch_stats[task_name] = {"launches": 0, "payload_size": 0, "pickle_time": 0.0, "total_payload_size": 0, "total_pickle_time": 0.0}
+        stats["launches"] += 1
+        stats["payload_size"] = payload_size
+        stats["pickle_time"] = pickle_time
+        stats["total_payload_size"] += payload_size
+        stats["total_pickle_time"] += pickle_time
+
+    def maintain(self):
+        "Evict the returns and compact the logs if the limits are set"
+        returns = self.session.returns
+        if isinstance(returns, ReturnStore):
+            n_evicted = returns.evict()
+            if n_evicted:
+                self.logger.debug(f"Evicted {n_evicted} return values")
+
+        config = self.session.config
+        if config.log_max_records is None and config.log_max_age is None and not config.log_needed_only:
+            return
+        now = time.monotonic()
+        if self._last_compact is not None and now - self._last_compact < config.log_compact_interval.total_seconds():
+            return
+        self._last_compact = now
+        n_removed = self.session.compact_logs()
+        self.logger.debug(f"Compacted logs (removed {n_removed} records)")
 
     async def startup(self):
         """Start up the scheduler.
@@ -309,9 +491,16 @@ class Scheduler(RedBase):
         self.startup_time = self.session._get_datetime_now()
 
         self.logger.debug("Beginning startup sequence...")
+        if not self.session.config.force_status_from_logs:
+            # Tasks depending only on other tasks are checked
+            # when those change status
+            from rocketry.utils.dependencies import DependencyGraph
+            self.session._dependency_graph = DependencyGraph(self.session)
+        # Statuses of all tasks in one go
+        statuses = self.session.get_latest_statuses(self.tasks)
         for task in self.tasks:
             try:
-                task.set_cached()
+                task.set_cached(statuses.get(task.name))
             except TaskLoggingError:
                 self.logger.exception(f"Failed setting cache for task '{task.name}'")
                 if not self.session.config.silence_task_logging:
@@ -334,12 +523,12 @@ class Scheduler(RedBase):
         return self.count_process_tasks_alive() < self.session.config.max_process_count
 
     def count_process_tasks_alive(self):
-        return sum(task.count_processes_taken() for task in self.tasks)
+        return sum(task.count_processes_taken() for task in self._tasks_with_runs)
 
     @property
     def n_alive(self) -> int:
         """Count of task runs that are alive."""
-        return sum(task.n_alive for task in self.tasks)
+        return sum(task.n_alive for task in self._tasks_with_runs)
 
     async def run_shutdown_tasks(self):
         # Make sure the tasks run if start_cond not set
@@ -385,6 +574,36 @@ class Scheduler(RedBase):
         """Wait till all, especially threading tasks, are finished."""
         while self.n_alive > 0:
             await self._hibernate()
+            if self._process_pool is not None:
+                # Pooled processes are finished via logs
+                self.handle_logs()
+
+    def _get_process_pool(self) -> ProcessPool:
+        if self._process_pool is None:
+            self._process_pool = ProcessPool(session=self.session)
+        return self._process_pool
+
+    def _close_process_pool(self):
+        if self._process_pool is not None:
+            self._process_pool.close()
+            self._process_pool = None
+
+    def _get_thread_pool(self) -> Optional[ThreadPool]:
+        size = self.session.config.thread_pool_size
+        if size is None:
+            return None
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPool(size)
+        return self._thread_pool
+
+    def _close_thread_pools(self):
+        if self._thread_pool is not None:
+            self._thread_pool.close()
+            self._thread_pool = None
+        for task in self.session.tasks:
+            if task._thread_pool is not None:
+                task._thread_pool.close()
+                task._thread_pool = None
 
     async def shut_down(self, traceback=None, exception=None):
         """Shut down the scheduler.
@@ -421,7 +640,11 @@ class Scheduler(RedBase):
             finally:
                 # Processes/threads are wait to shut down regardless if there has been any
                 # additional errors previously
-                await self.wait_task_alive() # Wait till all tasks' threads and processes are dead
+                try:
+                    await self.wait_task_alive() # Wait till all tasks' threads and processes are dead
+                finally:
+                    self._close_process_pool()
+                    self._close_thread_pools()
 
                 # Finally check logs once more
                 # and raise TaskLoggingError if has occurred in a thread and they are not silenced
@@ -482,12 +705,14 @@ class Scheduler(RedBase):
             self._flag_enabled.clear()
         else:
             self._flag_enabled.set()
+        self._wake_up()
 
     def set_shut_down(self):
         """Shut down the scheduler. Useful to shut down the
         scheduler in a controller task."""
         self.on_hold = False # In case was set to wait
         self._flag_shutdown.set()
+        self._wake_up()
 
 # Logging
     @property
@@ -519,5 +744,5 @@ class Scheduler(RedBase):
     def check_thread_errors(self):
         silence_logging = self.session.config.silence_task_logging
         if not silence_logging:
-            for task in self.tasks:
+            for task in self._tasks_with_runs:
                 task._check_exceptions()
@@ -1,6 +1,7 @@
 import asyncio
 from dataclasses import dataclass
 import inspect
+import pickle
 from pickle import PicklingError
 import sys
 import time
@@ -12,6 +13,7 @@ import warnings
 from copy import copy
 from abc import abstractmethod
 import multiprocessing
+from multiprocessing.process import BaseProcess
 import threading
 from queue import Empty
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, List, Dict, Type, Union, Tuple, Optional
@@ -21,17 +23,23 @@ except ImportError: # pragma: no cover
     from typing_extensions import Literal
 
 from pydantic.v1 import BaseModel, Field, PrivateAttr, validator
+from redbird.oper import in_
 
 from rocketry._base import RedBase
 from rocketry.core.condition import BaseCondition, AlwaysFalse, All
 from rocketry.core.time import TimePeriod
-from rocketry.core.parameters import Parameters
-from rocketry.core.log import TaskAdapter
+from rocketry.core.parameters import Parameters, SpooledReturn, spool_return
+from rocketry.core.log import TaskAdapter, ActionIndex
 from rocketry.pybox.time import to_timedelta
-from rocketry.core.utils import is_pickleable, filter_keyword_args, is_main_subprocess
+from rocketry.core.utils import is_pickleable, is_pickle_checked, filter_keyword_args, is_main_subprocess, get_context
+from rocketry.core.utils.pickle import dumps
 from rocketry.exc import SchedulerRestart, SchedulerExit, TaskInactionException, TaskTerminationException, TaskLoggingError, TaskSetupError
 from rocketry.core.hook import _Hooker
+from rocketry.core.registry import TaskRegistry
+from rocketry.core.pool import PooledProcess, PooledThread, ThreadPool, WorkerDone
 from rocketry.log import QueueHandler
+from rocketry.log.transport import LogReader, LogWriter
+from rocketry.log.utils import get_field_value
 
 if TYPE_CHECKING:
     from rocketry import Session
@@ -39,6 +47,11 @@ if TYPE_CHECKING:
 
 _IS_WINDOWS = platform.system()
 
+def _run_pickled(data:bytes, queue):
+    "Run a task pickled by Task._dump_launch. Run in the child process."
+    task, kwargs = pickle.loads(data)
+    task._run_as_process(queue=queue, **kwargs)
+
 def _create_session():
     # To avoid circular imports
     from rocketry import Session
@@ -48,9 +61,13 @@ def _create_session():
 class TaskRun:
 
     start: float
-    task: Union[asyncio.Task, threading.Thread, multiprocessing.Process, None]
+    task: Union[asyncio.Task, threading.Thread, BaseProcess, PooledProcess, PooledThread, None]
     run_id: str = None
 
+    # Process related (if pickled to the process)
+    payload_size: Optional[int] = None # Bytes
+    pickle_time: Optional[float] = None # Seconds
+
     # Thread related
     event_terminate: Optional[threading.Event] = None
     event_running: Optional[threading.Event] = None
@@ -84,7 +101,7 @@ class TaskRun:
 
     @property
     def is_process(self) -> bool:
-        return isinstance(self.task, multiprocessing.Process)
+        return isinstance(self.task, (BaseProcess, PooledProcess))
 
     @property
     def is_async(self) -> bool:
@@ -92,7 +109,7 @@ class TaskRun:
 
     @property
     def is_thread(self) -> bool:
-        return isinstance(self.task, threading.Thread)
+        return isinstance(self.task, (threading.Thread, PooledThread))
 
 class Task(RedBase, BaseModel):
     """Base class for Tasks.
@@ -160,6 +177,11 @@ class Task(RedBase, BaseModel):
         Whether run the task as daemon process
         or not. Only applicable for execution='process',
         by default use Scheduler default
+    thread_pool_size : int, optional
+        Size of a thread pool dedicated to the
+        runs of the task. Only applicable for
+        execution='thread', by default use the
+        thread pool of the session (if set)
     on_exists : str
         What to do if the name of the task already
         exists in the session, options: 'raise',
@@ -209,9 +231,13 @@ class Task(RedBase, BaseModel):
     # Class
     permanent: bool = False # Whether the task is not meant to finish (Ie. RestAPI)
     _actions: ClassVar[Tuple] = ("run", "fail", "success", "inaction", "terminate", None, "crash")
+    _status_actions: ClassVar[Tuple] = ("run", "success", "fail", "terminate", "inaction", "crash")
+    _wake_attrs: ClassVar[Tuple] = ("disabled", "force_run", "force_termination", "start_cond", "end_cond")
+    _index_attrs: ClassVar[Tuple] = ("name", "priority", "execution", "_run_stack")
     fmt_log_message: str = r"Task '{task}' status: '{action}'"
 
     daemon: Optional[bool]
+    thread_pool_size: Optional[int] = None
     batches: List[Parameters] = Field(
         default_factory=list,
         description="Run batches (parameters). If not empty, run is triggered regardless of starting condition"
@@ -248,7 +274,11 @@ class Task(RedBase, BaseModel):
 
     _run_stack: List[TaskRun] = PrivateAttr(default_factory=list)
     _lock: Optional[Type] = PrivateAttr(default=None)
+    _thread_pool: Optional[ThreadPool] = PrivateAttr(default=None)
+    _launch_latency: Optional[float] = PrivateAttr(default=None)
+    _compiled_conds: Dict[str, Tuple[BaseCondition, Callable]] = PrivateAttr(default_factory=dict)
     _main_alive: bool = PrivateAttr(default=False)
+    _action_index: ActionIndex = PrivateAttr(default_factory=ActionIndex)
 
     _mark_running = False
 
@@ -387,6 +417,75 @@ class Task(RedBase, BaseModel):
     def __hash__(self):
         return id(self)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._index_attrs:
+            # Keep the session's task registry up to date
+            self._reindex(name)
+        if name in self._wake_attrs:
+            # The task may be runnable or terminable
+            # before the scheduler would otherwise wake up
+            self._wake_scheduler()
+        if name == "status":
+            self._clear_cond_cache()
+            self._notify_dependents()
+            if value not in ("run", None):
+                self._release_returns()
+        if name in ("start_cond", "end_cond"):
+            self._compile_cond(name)
+
+    def _reindex(self, attr=None):
+        tasks = getattr(getattr(self, "session", None), "tasks", None)
+        if isinstance(tasks, TaskRegistry):
+            tasks.reindex(self, attr)
+
+    def _compile_cond(self, attr:str) -> Callable[..., bool]:
+        cond = getattr(self, attr)
+        func = cond._compile()
+        self._compiled_conds[attr] = (cond, func)
+        return func
+
+    def _observe_cond(self, attr:str, **kwargs) -> bool:
+        "Observe start_cond or end_cond using its compiled form"
+        cond, func = self._compiled_conds.get(attr, (None, None))
+        if cond is not getattr(self, attr):
+            # Not compiled or set without validation
+            func = self._compile_cond(attr)
+        return func(**kwargs)
+
+    def _clear_cond_cache(self):
+        # The states of the conditions may have changed
+        session = getattr(self, "session", None)
+        cache = getattr(session, "_cond_cycle_cache", None)
+        if cache is not None:
+            cache.clear()
+        clock = getattr(session, "_cycle_clock", None)
+        if clock is not None:
+            clock.refresh()
+
+    def _notify_dependents(self):
+        # The tasks depending on this may be runnable
+        graph = getattr(getattr(self, "session", None), "_dependency_graph", None)
+        if graph is not None:
+            graph.changed(self)
+
+    def _release_returns(self):
+        # The returns passed to the finished run are no longer needed
+        spool = getattr(getattr(self, "session", None), "_return_spool", None)
+        if spool is not None:
+            spool.release_staged(self.name)
+
+    def _add_run(self, task_run:TaskRun):
+        "Put a run to the run stack"
+        self._run_stack.append(task_run)
+        self._reindex("_run_stack")
+        self._clear_cond_cache()
+
+    def _wake_scheduler(self):
+        scheduler = getattr(self.session, "scheduler", None)
+        if scheduler is not None:
+            scheduler._wake_up()
+
     def run(self, _params:Union[Parameters, Dict]=None, **kwargs):
         """Set the task running (with given parameters)
 
@@ -409,6 +508,7 @@ class Task(RedBase, BaseModel):
         if kwargs:
             params.update(kwargs)
         self.batches.append(params)
+        self._wake_scheduler()
 
     def delete(self):
         """Delete the task from the session.
@@ -421,6 +521,12 @@ class Task(RedBase, BaseModel):
 
 # Inspection
 
+    @property
+    def launch_latency(self) -> Optional[float]:
+        """float: Seconds it took for the latest process run to
+        start (from creating the process to its run log)."""
+        return self._launch_latency
+
     @property
     def is_running(self):
         """bool: Whether the task is currently running or not."""
@@ -496,7 +602,8 @@ class Task(RedBase, BaseModel):
                 )
                 if execution == "async":
                     task_run.task = async_task
-                self._run_stack.append(task_run)
+                    async_task.add_done_callback(lambda _: self._wake_scheduler())
+                self._add_run(task_run)
                 self.log_running(task_run)
                 if execution == "main":
                     await async_task
@@ -511,7 +618,7 @@ class Task(RedBase, BaseModel):
                     # in tests will succeed.
                     time.sleep(1e-6)
             elif execution == "process":
-                self.run_as_process(params=params, direct_params=direct_params, task_run=task_run, **kwargs)
+                await self.run_as_process_async(params=params, direct_params=direct_params, task_run=task_run, **kwargs)
             elif execution == "thread":
                 self.run_as_thread(params=params, direct_params=direct_params, task_run=task_run, **kwargs)
         except (SchedulerRestart, SchedulerExit):
@@ -563,7 +670,13 @@ class Task(RedBase, BaseModel):
         if self.disabled:
             return False
 
-        cond = self.start_cond.observe(task=self)
+        graph = getattr(self.session, "_dependency_graph", None)
+        if graph is not None and graph.has(self):
+            # Depends only on other tasks, observed
+            # if they (or this) have changed status
+            return graph.is_ready(self)
+
+        cond = self._observe_cond("start_cond", task=self)
 
         return cond
 
@@ -663,17 +776,41 @@ class Task(RedBase, BaseModel):
         params = params.pre_materialize(task=self, session=self.session, terminate_event=terminate_event)
         direct_params = direct_params.pre_materialize(task=self, session=self.session, terminate_event=terminate_event)
 
+        pool = self._get_thread_pool()
+        if pool is not None:
+            # The run may wait in the queue of the pool thus
+            # it is set running here and not in the thread
+            task_run.event_terminate = terminate_event
+            try:
+                self.log_running(task_run)
+            except TaskLoggingError:
+                if self.status == "run":
+                    self.log_failure(task_run)
+                raise
+            task_run.task = pool.submit(self._run_in_thread_pool, params, direct_params, task_run)
+            self._add_run(task_run)
+            self._last_run = self.session.get_time() # Needed for termination
+            return
+
         thread = threading.Thread(target=self._run_as_thread, args=(params, direct_params, task_run))
         task_run.task = thread
         task_run.event_terminate = terminate_event
         task_run.event_running = threading.Event()
 
-        self._run_stack.append(task_run)
+        self._add_run(task_run)
 
         self._last_run = self.session.get_time() # Needed for termination
         thread.start()
         task_run.event_running.wait() # Wait until the task is confirmed to run
 
+    def _get_thread_pool(self) -> Optional[ThreadPool]:
+        "Get the thread pool of the task or the session's pool"
+        if self.thread_pool_size is None:
+            return self.session.scheduler._get_thread_pool()
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPool(self.thread_pool_size, name=f"rocketry-{self.name}")
+        return self._thread_pool
+
     def _run_as_thread(self, params:Parameters, direct_params:Parameters, task_run:TaskRun=None):
         """Running the task in a new thread. This method should only
         be run by the new thread."""
@@ -691,7 +828,23 @@ class Task(RedBase, BaseModel):
             return
         finally:
             task_run.event_running.set()
+        self._execute_in_thread(params, direct_params, task_run)
 
+    def _run_in_thread_pool(self, params:Parameters, direct_params:Parameters, task_run:TaskRun):
+        """Running the task in a thread of a thread pool. This method
+        should only be run by the pool."""
+        if task_run.event_terminate.is_set():
+            # Terminated while waiting in the queue
+            try:
+                self.log_termination(reason="terminated before started", task_run=task_run)
+            except TaskLoggingError as exc:
+                task_run.exception = exc
+            finally:
+                self._wake_scheduler()
+            return
+        self._execute_in_thread(params, direct_params, task_run)
+
+    def _execute_in_thread(self, params:Parameters, direct_params:Parameters, task_run:TaskRun):
         try:
             output = self._run_as_main(params=params, direct_params=direct_params, task_run=task_run, execution="thread")
         except Exception:
@@ -703,10 +856,28 @@ class Task(RedBase, BaseModel):
 
             # We cannot rely the exception to main thread here
             # thus we supress to prevent unnecessary warnings.
+        finally:
+            self._wake_scheduler()
 
     def run_as_process(self, params:Parameters, direct_params:Parameters, task_run:TaskRun, daemon=None, log_queue: multiprocessing.Queue=None):
         """Create a new process and run the task on that."""
+        start = time.perf_counter()
+        log_queue = self._start_process(params=params, direct_params=direct_params, task_run=task_run, log_queue=log_queue)
+        self._lock_to_run_log(log_queue)
+        self._set_launch_latency(time.perf_counter() - start)
+        return log_queue
 
+    async def run_as_process_async(self, params:Parameters, direct_params:Parameters, task_run:TaskRun, daemon=None, log_queue: multiprocessing.Queue=None):
+        """Create a new process and run the task on that.
+        Waits the process to start without blocking the
+        event loop."""
+        start = time.perf_counter()
+        log_queue = self._start_process(params=params, direct_params=direct_params, task_run=task_run, log_queue=log_queue)
+        await self._await_run_log(log_queue, task_run=task_run)
+        self._set_launch_latency(time.perf_counter() - start)
+        return log_queue
+
+    def _start_process(self, params:Parameters, direct_params:Parameters, task_run:TaskRun, log_queue: multiprocessing.Queue=None) -> multiprocessing.Queue:
         session = self.session
 
         params = params.pre_materialize(task=self, session=session)
@@ -715,30 +886,76 @@ class Task(RedBase, BaseModel):
         # Daemon resolution: task.daemon >> scheduler.tasks_as_daemon
         log_queue = session.scheduler._log_queue if log_queue is None else log_queue
 
+        if session.config.process_pool and log_queue is session.scheduler._log_queue:
+            self._run_in_pool(params=params, direct_params=direct_params, task_run=task_run)
+            return log_queue
+
+        # The process gets its own pipe to the scheduler's log reader
+        queue = log_queue.open_pipe() if isinstance(log_queue, LogReader) else log_queue
+
         daemon = self.daemon if self.daemon is not None else session.config.tasks_as_daemon
-        process = multiprocessing.Process(
-            target=self._run_as_process,
-            kwargs=dict(
-                params=params, direct_params=direct_params,
-                task_run=task_run,
-                queue=log_queue,
-                config=session.config,
-                exec_hooks=self._get_hooks("task_execute")
-            ),
-            daemon=daemon
+        kwargs = dict(
+            params=params, direct_params=direct_params,
+            task_run=task_run,
+            exec_hooks=self._get_hooks("task_execute")
         )
+        ctx = get_context()
+        if ctx.get_start_method() == "fork":
+            # The child gets a copy of the memory
+            # thus nothing is pickled
+            process = ctx.Process(
+                target=self._run_as_process,
+                kwargs=dict(queue=queue, **kwargs),
+                daemon=daemon
+            )
+        else:
+            # The queue is pickled by the process
+            # (the pipe is duplicated to the child)
+            process = ctx.Process(
+                target=_run_pickled,
+                args=(self._dump_launch(kwargs, task_run), queue),
+                daemon=daemon
+            )
         task_run.task = process
 
-        self._run_stack.append(task_run)
+        self._add_run(task_run)
         self._mark_running = True # needed in pickling
 
-        process.start()
-        self._mark_running = False
-
-        self._lock_to_run_log(log_queue)
+        try:
+            process.start()
+        finally:
+            self._mark_running = False
+            if isinstance(queue, LogWriter):
+                # Only the process writes to the pipe
+                queue.close()
         return log_queue
 
-    def _run_as_process(self, params:Parameters, direct_params:Parameters, task_run, queue, config, exec_hooks):
+    def _run_in_pool(self, params:Parameters, direct_params:Parameters, task_run:TaskRun):
+        "Run the task on a reused process of the scheduler's process pool"
+        session = self.session
+        pool = session.scheduler._get_process_pool()
+
+        data = self._dump_launch(dict(
+            params=params, direct_params=direct_params,
+            task_run=task_run,
+            exec_hooks=self._get_hooks("task_execute")
+        ), task_run)
+        task_run.task = pool.submit(data)
+        self._add_run(task_run)
+
+    def _dump_launch(self, kwargs:dict, task_run:TaskRun) -> bytes:
+        "Pickle the task and the arguments of _run_as_process (once)"
+        self._mark_running = True # needed in pickling
+        try:
+            data, elapsed = dumps((self, kwargs))
+        finally:
+            self._mark_running = False
+        task_run.payload_size = len(data)
+        task_run.pickle_time = elapsed
+        self.session.scheduler._record_launch(self.name, len(data), elapsed)
+        return data
+
+    def _run_as_process(self, params:Parameters, direct_params:Parameters, task_run, queue, config=None, exec_hooks=()):
         """Running the task in a new process. This method should only
         be run by the new process."""
 
@@ -781,6 +998,9 @@ class Task(RedBase, BaseModel):
             # There is nothing to raise it
             # to :(
             pass
+        finally:
+            if isinstance(queue, LogWriter):
+                queue.flush()
 
     def get_extra_params(self, params:Parameters, execution:str, **kwargs) -> Parameters:
         """Get additional parameters
@@ -913,21 +1133,37 @@ class Task(RedBase, BaseModel):
         self._last_inaction = None
         self._last_crash = None
 
-    def set_cached(self):
-        "Update cached statuses"
+    def set_cached(self, latest:Optional[Dict[str, float]]=None):
+        """Update cached statuses
+
+        Parameters
+        ----------
+        latest : dict, optional
+            Latest times (timestamps) of the status
+            changes by actions (see
+            ``Session.get_latest_statuses``). Read
+            from the logs if not given.
+        """
         # We get the logger here to not flood with warnings if missing repo
         logger = self.logger
 
-        self._last_run = self._get_last_action("run", from_logs=True, logger=logger)
-        self._last_success = self._get_last_action("success", from_logs=True, logger=logger)
-        self._last_fail = self._get_last_action("fail", from_logs=True, logger=logger)
-        self._last_terminate = self._get_last_action("terminate", from_logs=True, logger=logger)
-        self._last_inaction = self._get_last_action("inaction", from_logs=True, logger=logger)
-        self._last_crash = self._get_last_action("crash", from_logs=True, logger=logger)
+        if latest is None:
+            latest = self.session.get_latest_statuses([self]).get(self.name)
+
+        if latest is None:
+            # Logs not readable
+            for action in self._status_actions:
+                setattr(self, f"_last_{action}", self._get_last_action(action, from_logs=True, logger=logger))
+        else:
+            for action in self._status_actions:
+                setattr(self, f"_last_{action}", latest.get(action))
+        if self._action_index is not None:
+            # Seeded when needed
+            self._action_index.clear()
 
         times = {
             name: getattr(self, f"_last_{name}")
-            for name in ('run', 'success', 'fail', 'terminate', 'inaction', 'crash')
+            for name in self._status_actions
             if getattr(self, f"_last_{name}") is not None
         }
         if times:
@@ -941,6 +1177,27 @@ class Task(RedBase, BaseModel):
             else:
                 self.status = status
 
+    def _get_action_index(self) -> Optional[ActionIndex]:
+        """Get the index of the status changes. The index
+        is seeded from the logs on first use. Returns None
+        if the index is not available."""
+        index = self._action_index
+        if index is None:
+            return None
+        if not index.complete:
+            try:
+                records = self.logger.filter_by(action=in_(list(self._status_actions))).query()
+            except AttributeError:
+                # Logs not readable
+                return None
+            index.seed(records)
+        return index
+
+    def _index_action(self, action:str, created:float):
+        index = self._action_index
+        if index is not None:
+            index.add(action, created)
+
     def get_default_name(self, **kwargs):
         """Create a name for the task when name was not passed to initiation of
         the task. Override this method."""
@@ -972,7 +1229,7 @@ class Task(RedBase, BaseModel):
     async def _check_termination(self):
         "Terminate task if can"
         try:
-            is_end_cond = self.end_cond.observe(task=self, session=self.session)
+            is_end_cond = self._observe_cond("end_cond", task=self, session=self.session)
         except Exception:
             if not self.session.config.silence_cond_check:
                 raise
@@ -1013,6 +1270,7 @@ class Task(RedBase, BaseModel):
         for run in self._run_stack.copy():
             if run.exception:
                 self._run_stack.remove(run)
+                self._reindex("_run_stack")
                 raise run.exception
 
     async def _terminate_all(self, reason=None):
@@ -1053,24 +1311,68 @@ class Task(RedBase, BaseModel):
             except Empty:
                 if not self.is_alive():
                     # There will be no "run" log record thus ending the task gracefully
-                    self.logger.critical(f"Task '{self.name}' crashed in setup", extra={"action": "fail"})
-                    raise TaskSetupError(f"Task '{self.name}' process crashed silently")
+                    self._log_setup_crash()
             else:
+                action, exc = self._handle_start_record(record)
+                err = exc or err
 
-                #self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
-                task = self.session[record.task_name]
-                try:
-                    task.log_record(record)
-                except Exception as exc:
-                    # It must be made sure the task is set running
-                    # so we ignore logging errors until that's sure
-                    err = exc
+        if err is not None:
+            raise err
 
-                action = record.action
+    async def _await_run_log(self, log_queue, task_run:TaskRun):
+        """Wait the run log of a started process without
+        blocking the event loop. The scheduler does not continue
+        (launching the task again) before the task is confirmed
+        to run."""
+        action = None
+        err = None
+        delay = 0.0005
+
+        while action != "run":
+            # Checked before reading the queue so that
+            # the records of a dead process are already in it
+            is_alive = task_run.is_alive()
+            try:
+                record = log_queue.get(block=False)
+            except Empty:
+                if not is_alive:
+                    # There will be no "run" log record thus ending the task gracefully
+                    self._log_setup_crash()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.01)
+            else:
+                action, exc = self._handle_start_record(record)
+                err = exc or err
 
         if err is not None:
             raise err
 
+    def _handle_start_record(self, record) -> Tuple[Optional[str], Optional[Exception]]:
+        "Handle a log record got while waiting a process to start"
+        if isinstance(record, WorkerDone):
+            # A pooled process finished a run
+            self.session.scheduler._get_process_pool().release(record)
+            return None, None
+
+        #self.logger.debug(f"Inserting record for '{record.task_name}' ({record.action})")
+        task = self.session[record.task_name]
+        err = None
+        try:
+            task.log_record(record)
+        except Exception as exc:
+            # It must be made sure the task is set running
+            # so we ignore logging errors until that's sure
+            err = exc
+        return record.action, err
+
+    def _log_setup_crash(self):
+        self.logger.critical(f"Task '{self.name}' crashed in setup", extra={"action": "fail"})
+        raise TaskSetupError(f"Task '{self.name}' process crashed silently")
+
+    def _set_launch_latency(self, latency:float):
+        self._launch_latency = latency
+        self.session.scheduler.logger.debug(f"Task '{self.name}' started running in {latency:.4f} seconds")
+
     def log_running(self, task_run:TaskRun=None):
         """Make a log that the task is currently running."""
         self._set_status("run", task_run)
@@ -1125,6 +1427,7 @@ class Task(RedBase, BaseModel):
             raise TaskLoggingError(f"Logging for task '{self.name}' failed.") from exc
         else:
             setattr(self, cache_attr, record_time)
+            self._index_action(record.action, record_time)
             self.status = record.action
 
     def get_status(self) -> Literal['run', 'fail', 'success', 'terminate', 'inaction', None]:
@@ -1172,6 +1475,12 @@ class Task(RedBase, BaseModel):
             # If child process, the return value is passed via QueueHandler to the main process
             # and it's handled then in Scheduler.
             # Else the return value is handled in Task itself (__call__ & _run_as_thread)
+            spool_dir = self.session.config.return_spool
+            if spool_dir is not None:
+                # Large buffers are passed via a file
+                spooled = spool_return(return_value, spool_dir)
+                if spooled is not None:
+                    return_value = spooled
             extra["__return__"] = return_value
 
         cache_attr = f"_last_{action}"
@@ -1192,6 +1501,7 @@ class Task(RedBase, BaseModel):
             raise TaskLoggingError(f"Logging for task '{self.name}' failed.") from exc
         else:
             setattr(self, cache_attr, time_now)
+            self._index_action(action, time_now)
             self.status = action
 
     def get_last_success(self) -> datetime.datetime:
@@ -1299,7 +1609,11 @@ class Task(RedBase, BaseModel):
         priv_attrs['_lock'] = None
         priv_attrs['_process'] = None
         priv_attrs['_thread'] = None
+        priv_attrs['_thread_pool'] = None
+        priv_attrs['_compiled_conds'] = {}
         priv_attrs['_run_stack'] = None
+        # The child does not read the statuses
+        priv_attrs['_action_index'] = None
 
         # We also get rid of the conditions as if there is a task
         # containing an attr that cannot be pickled (like FuncTask
@@ -1313,9 +1627,9 @@ class Task(RedBase, BaseModel):
         # Removing possibly unpicklable manually. There is a problem in Pydantic
         # and for some reason it does not use Session's pickling
         dict_state['parameters'] = Parameters()
-        dict_state['session'] = dict_state['session']._copy_pickle()
+        dict_state['session'] = dict_state['session']._get_pickled()
 
-        if not is_pickleable(state):
+        if is_pickle_checked() and not is_pickleable(state):
             if self._mark_running:
                 # When this block might get executed?
                 #   - If FuncTask func is non-picklable
@@ -1333,7 +1647,14 @@ class Task(RedBase, BaseModel):
 
     def _handle_return(self, value):
         "Handle the return value (ie. store to parameters)"
-        self.session.returns[self] = value
+        returns = self.session.returns
+        spool = self.session._return_spool
+        previous = returns.to_dict().get(self)
+        if isinstance(previous, SpooledReturn):
+            spool.release(previous)
+        if isinstance(value, SpooledReturn):
+            spool.add(value)
+        returns[self] = value
 
     def _get_hooks(self, name:str):
         return getattr(self.session.hooks, name)
@@ -1,11 +1,24 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import ClassVar, Dict, List, Tuple, Union
 from abc import abstractmethod
 from dataclasses import dataclass
 
-from rocketry.pybox.time import to_microseconds, timedelta_to_str, datetime_to_dict, to_timedelta
+from rocketry.pybox.time import to_microseconds, timedelta_to_str, datetime_to_dict, to_timedelta, Interval
 from .base import Any, TimeInterval
 
+# Microseconds in the scopes that have fixed length
+# and that are at most a day
+_FIXED_SCOPES: Dict[str, int] = {
+    "second": to_microseconds(second=1),
+    "minute": to_microseconds(minute=1),
+    "hour": to_microseconds(hour=1),
+    "day": to_microseconds(day=1),
+}
+
+def time_of_day(dt) -> int:
+    "Get microseconds from the start of the day"
+    return ((dt.hour * 60 + dt.minute) * 60 + dt.second) * 1_000_000 + dt.microsecond
+
 @dataclass(frozen=True, repr=False)
 class AnchoredInterval(TimeInterval):
     """Base class for interval for those that have
@@ -96,6 +109,9 @@ class AnchoredInterval(TimeInterval):
 
     def anchor_dt(self, dt: datetime, **kwargs) -> int:
         "Turn datetime to nanoseconds according to the scope (by removing higher time elements)"
+        scope_length = _FIXED_SCOPES.get(self._scope)
+        if scope_length is not None:
+            return time_of_day(dt) % scope_length
         components = self.components
         components = components[components.index(self._scope) + 1:]
         d = datetime_to_dict(dt)
@@ -191,9 +207,6 @@ class AnchoredInterval(TimeInterval):
     def __contains__(self, dt) -> bool:
         "Whether dt is in the interval"
 
-        ms_start = self._start
-        ms_end = self._end
-
         if self.is_full():
             # As there is no time in between,
             # the interval is considered full
@@ -201,6 +214,12 @@ class AnchoredInterval(TimeInterval):
             return True
 
         ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return self._contains_anchor(ms)
+
+    def _contains_anchor(self, ms:int) -> bool:
+        "Whether anchored microseconds are in the interval"
+        ms_start = self._start
+        ms_end = self._end
 
         is_over_period = ms_start > ms_end # period is overnight, over weekend etc.
         if not is_over_period:
@@ -233,9 +252,58 @@ class AnchoredInterval(TimeInterval):
             return dt
         return self.prev_end(dt)
 
+    def rollforward(self, dt) -> Interval:
+        "Get next time interval of the period"
+        # The start and end are calculated as microseconds
+        # from dt and turned to datetimes once
+        ms = self.anchor_dt(dt)
+        if self.is_full():
+            # Full period so dt always belongs on it
+            start = 0
+            end = self._offset_next_end(ms, dt)
+            if end == start:
+                # Expanding the interval
+                next_dt = dt + self.resolution
+                end = 1 + self._offset_next_end(self.anchor_dt(next_dt), next_dt)
+        else:
+            start = 0 if self._contains_anchor(ms) else self._offset_next_start(ms, dt)
+            end = self._offset_next_end(ms, dt)
+            if start == end:
+                # The interval is left closed so this should
+                # not contain any points. We look for another
+                # one
+                return self.rollforward(dt + timedelta(microseconds=end + 1))
+        return Interval(dt + timedelta(microseconds=start), dt + timedelta(microseconds=end), closed="left")
+
+    def rollback(self, dt) -> Interval:
+        "Get previous time interval of the period"
+        ms = self.anchor_dt(dt)
+        closed = "left"
+        if self.is_full():
+            # Full period so dt always belongs on it
+            end = 0
+            start = self._offset_prev_start(ms, dt)
+            if end == start:
+                # Expanding the interval
+                prev_dt = dt - self.resolution
+                start = self._offset_prev_start(self.anchor_dt(prev_dt), prev_dt) - 1
+        else:
+            end = 0 if self._contains_anchor(ms) else self._offset_prev_end(ms, dt)
+            start = self._offset_prev_start(ms, dt)
+            if start == end:
+                # The interval is left closed but the start
+                # is included in the interval. Therefore
+                # we include a single point (both sides closed)
+                closed = "both"
+        return Interval(dt + timedelta(microseconds=start), dt + timedelta(microseconds=end), closed=closed)
+
     def next_start(self, dt):
         "Get next start point of the period"
         ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return dt + timedelta(microseconds=self._offset_next_start(ms, dt))
+
+    def _offset_next_start(self, ms:int, dt) -> int:
+        "Microseconds from anchored dt to the next start point"
         ms_start = self._start
         ms_end = self._end
 
@@ -254,7 +322,7 @@ class AnchoredInterval(TimeInterval):
             #            dt
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
-            offset = to_timedelta(int(ms_start) - int(ms), unit="microsecond")
+            offset = int(ms_start) - int(ms)
         else:
             # not in period, later than start
             #      dt
@@ -271,12 +339,16 @@ class AnchoredInterval(TimeInterval):
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
             ms_scope = self.get_scope_forward(dt)
-            offset = to_timedelta(int(ms_start) - int(ms) + ms_scope, unit="microsecond")
-        return dt + offset
+            offset = int(ms_start) - int(ms) + ms_scope
+        return offset
 
     def next_end(self, dt):
         "Get next end point of the period"
         ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return dt + timedelta(microseconds=self._offset_next_end(ms, dt))
+
+    def _offset_next_end(self, ms:int, dt) -> int:
+        "Microseconds from anchored dt to the next end point"
         ms_start = self._start
         ms_end = self._end
 
@@ -295,7 +367,7 @@ class AnchoredInterval(TimeInterval):
             #          dt
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
-            offset = to_timedelta(int(ms_end) - int(ms), unit="microsecond")
+            offset = int(ms_end) - int(ms)
         else:
             # not in period, over night
             #                     dt
@@ -312,12 +384,16 @@ class AnchoredInterval(TimeInterval):
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
             ms_scope = self.get_scope_forward(dt)
-            offset = to_timedelta(int(ms_end) - int(ms) + ms_scope, unit="microsecond")
-        return dt + offset
+            offset = int(ms_end) - int(ms) + ms_scope
+        return offset
 
     def prev_start(self, dt):
         "Get previous start point of the period"
         ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return dt + timedelta(microseconds=self._offset_prev_start(ms, dt))
+
+    def _offset_prev_start(self, ms:int, dt) -> int:
+        "Microseconds from anchored dt to the prev start point"
         ms_start = self._start
 
         if ms < ms_start:
@@ -336,7 +412,7 @@ class AnchoredInterval(TimeInterval):
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
             ms_scope = self.get_scope_back(dt)
-            offset = to_timedelta(int(ms_start) - int(ms) - ms_scope, unit="microsecond")
+            offset = int(ms_start) - int(ms) - ms_scope
         else:
             # not in period, later than start
             #      dt
@@ -352,12 +428,16 @@ class AnchoredInterval(TimeInterval):
             #                    dt
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
-            offset = to_timedelta(int(ms_start) - int(ms), unit="microsecond")
-        return dt + offset
+            offset = int(ms_start) - int(ms)
+        return offset
 
     def prev_end(self, dt):
         "Get pervious end point of the period"
         ms = self.anchor_dt(dt) # In relative nanoseconds (removed more accurate than scope)
+        return dt + timedelta(microseconds=self._offset_prev_end(ms, dt))
+
+    def _offset_prev_end(self, ms:int, dt) -> int:
+        "Microseconds from anchored dt to the prev end point"
         ms_end = self._end
 
         if ms < ms_end:
@@ -376,7 +456,7 @@ class AnchoredInterval(TimeInterval):
             # --<---------->-----------<-------------->--
             #  end   |   start        end    |      start
             ms_scope = self.get_scope_back(dt)
-            offset = to_timedelta(int(ms_end) - int(ms) - ms_scope, unit="microsecond")
+            offset = int(ms_end) - int(ms) - ms_scope
         else:
             # not in period, over night
             #                     dt
@@ -392,9 +472,8 @@ class AnchoredInterval(TimeInterval):
             #       dt
             #  -->----------<----------->--------------<-
             #  start   |   end        start     |     end
-            offset = to_timedelta(int(ms_end) - int(ms), unit="microsecond")
-
-        return dt + offset
+            offset = int(ms_end) - int(ms)
+        return offset
 
     def repr_ms(self, n:int):
         "Microseconds to representative format"
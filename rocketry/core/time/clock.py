@@ -0,0 +1,44 @@
+import datetime
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from .base import TimePeriod
+from .utils import period_span_cache
+
+if TYPE_CHECKING:
+    from rocketry import Session
+
+class CycleClock:
+    """Snapshot of the current time for a scheduling cycle.
+
+    The conditions checked in the cycle use the same
+    current time and the spans of the periods are
+    calculated once for the snapshot. The snapshot is
+    retaken when a task changes its state so that the
+    time does not lag behind what has happened.
+
+    Parameters
+    ----------
+    session : rocketry.Session
+        Session which time is measured.
+    """
+
+    def __init__(self, session:'Session'):
+        self.session = session
+        self.refresh()
+
+    def refresh(self):
+        "Take a new snapshot of the current time"
+        self.timestamp: float = self.session.get_time()
+        self.now: datetime.datetime = self.session._format_timestamp(self.timestamp)
+        self._spans: Dict[int, Tuple[TimePeriod, Tuple[datetime.datetime, datetime.datetime]]] = {}
+
+    def get_period_span(self, period:TimePeriod) -> Tuple[datetime.datetime, datetime.datetime]:
+        "Get the start and end of the period's current (or previous) interval"
+        try:
+            return self._spans[id(period)][1]
+        except KeyError:
+            pass
+        span = period_span_cache.get_span(period, self.now)
+        # Period is stored so its id won't be reused
+        self._spans[id(period)] = (period, span)
+        return span
@@ -1,32 +1,159 @@
 
 import time
 import datetime
-from typing import Tuple
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
 
-from .base import TimePeriod
+from rocketry.pybox.time import to_timestamp
+from .base import All, Any, TimeDelta, TimePeriod
 
-def get_period_span(period:'TimePeriod', session=None) -> Tuple[datetime.datetime, datetime.datetime]:
+class SpanCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
-    # To prevent circular import
-    from rocketry.parse import parse_time
+class PeriodSpanCache:
+    """Cache of the spans of the periods.
+
+    The span of a period (its current or previous
+    interval) stays the same until the current time
+    crosses the end of the ongoing interval or the
+    start of the next one. The spans are cached by
+    the identity of the period and reused until
+    then. Periods relative to the current time (time
+    deltas), periods of months and years and unions
+    of periods are not cached.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of periods to cache. The least
+        recently used are removed first.
+    """
+
+    def __init__(self, maxsize:int=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._spans: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+
+    def get_span(self, period:TimePeriod, now:datetime.datetime) -> Tuple[datetime.datetime, datetime.datetime]:
+        "Get the start and end of the current (or previous) interval of the period"
+        if not self._is_cacheable(period):
+            if hasattr(period, "use_reference"):
+                # Period requires reference date
+                # (usually timedelta related)
+                # and it is current datetime
+                period = period.use_reference(now)
+            interval = period.rollback(now)
+            return interval.left, interval.right
+
+        key = (id(period), now.tzinfo)
+        cached = self._spans.get(key)
+        if cached is not None:
+            _, valid_from, valid_to, start, end = cached
+            if valid_from <= now < valid_to:
+                self.hits += 1
+                self._spans.move_to_end(key)
+                # Ongoing interval ends now
+                return start, (now if end is None else end)
+        self.misses += 1
+
+        interval = period.rollback(now)
+        start, end = interval.left, interval.right
+        try:
+            next_interval = period.rollforward(now)
+        except (AttributeError, NotImplementedError, TypeError, ValueError, RecursionError):
+            # Cannot determine when the span changes
+            return start, end
+        if end == now and next_interval.left == now:
+            # Ongoing (now is in the period, not just on
+            # the right boundary of the previous interval),
+            # the start stays until the interval ends
+            valid_to = next_interval.right
+            cached_end = None
+        else:
+            # Not ongoing, the span stays until the next starts
+            valid_to = next_interval.left
+            cached_end = end
+
+        # Period is stored so its id won't be reused
+        self._spans[key] = (period, now, valid_to, start, cached_end)
+        self._spans.move_to_end(key)
+        if len(self._spans) > self.maxsize:
+            self._spans.popitem(last=False)
+        return start, end
+
+    def _is_cacheable(self, period:TimePeriod) -> bool:
+        "Whether the span of the period stays the same until the boundaries"
+        if isinstance(period, Any):
+            # The merged intervals of the sub periods
+            # depend on the given time
+            return False
+        if isinstance(period, All):
+            return all(self._is_cacheable(sub) for sub in period.periods)
+        # To prevent circular import
+        from rocketry.time.interval import TimeOfMonth, TimeOfYear
+        if isinstance(period, (TimeOfMonth, TimeOfYear)):
+            # Months and years vary in length thus their
+            # rollforward may end past the next interval
+            return False
+        # Time deltas are relative to the given time
+        return not (isinstance(period, TimeDelta) or hasattr(period, "use_reference"))
+
+    def info(self) -> SpanCacheInfo:
+        "Get hits, misses and size of the cache"
+        return SpanCacheInfo(self.hits, self.misses, self.maxsize, len(self._spans))
+
+    def clear(self):
+        self._spans.clear()
+        self.hits = 0
+        self.misses = 0
+
+_PARSED: Dict[str, TimePeriod] = {}
+period_span_cache = PeriodSpanCache()
+
+def get_period_span(period:'TimePeriod', session=None) -> Tuple[datetime.datetime, datetime.datetime]:
 
     if period is None:
         return TimePeriod.min, TimePeriod.max
     if isinstance(period, str):
-        period = parse_time(period)
+        period = _parse_period(period)
 
     if session is None:
         now = datetime.datetime.fromtimestamp(time.time())
     else:
+        clock = session._cycle_clock
+        if clock is not None:
+            # In a scheduling cycle
+            return clock.get_period_span(period)
         now = session._get_datetime_now()
+    return period_span_cache.get_span(period, now)
+
+def _parse_period(s:str) -> TimePeriod:
+    # To prevent circular import
+    from rocketry.parse import parse_time
+    try:
+        return _PARSED[s]
+    except KeyError:
+        period = parse_time(s)
+        _PARSED[s] = period
+        return period
 
-    if hasattr(period, "use_reference"):
-        # Period requires reference date
-        # (usually timedelta related)
-        # and it is current datetime
-        period = period.use_reference(now)
+def get_next_start(period:'TimePeriod', session, skip_current=False) -> Optional[float]:
+    """Get timestamp when the period next starts.
 
-    interval = period.rollback(now)
-    start = interval.left
-    end = interval.right
-    return start, end
+    If ``skip_current`` is True and the current time
+    is on the period, the start of the next interval
+    after the ongoing one is returned instead. Returns
+    None if the next start could not be determined."""
+    now = session._get_datetime_now()
+    interval = period.rollforward(now)
+    if skip_current and interval.left <= now:
+        interval = period.rollforward(interval.right)
+        if interval.left <= now:
+            # Period does not have next interval
+            # (ie. StaticInterval)
+            return None
+    return to_timestamp(interval.left)
@@ -1,4 +1,4 @@
 
-from .pickle import is_pickleable
+from .pickle import is_pickleable, is_pickle_checked
 from .meta import filter_keyword_args
-from .process import is_main_subprocess
+from .process import is_main_subprocess, get_context
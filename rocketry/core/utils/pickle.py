@@ -1,5 +1,11 @@
-
 import pickle
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing.reduction import ForkingPickler
+from typing import Tuple
+
+_STATE = threading.local()
 
 def is_pickleable(obj):
     try:
@@ -8,3 +14,51 @@ def is_pickleable(obj):
         return False
     else:
         return True
+
+def is_pickle_checked() -> bool:
+    """Whether the objects should check that their
+    states are pickleable when pickled (see ``dumps``)."""
+    return not getattr(_STATE, "unchecked", False)
+
+@contextmanager
+def _unchecked():
+    prev = getattr(_STATE, "unchecked", False)
+    _STATE.unchecked = True
+    try:
+        yield
+    finally:
+        _STATE.unchecked = prev
+
+def dumps(obj) -> Tuple[bytes, float]:
+    """Pickle an object for a child process.
+
+    The object is pickled once: the objects do not
+    check beforehand whether their states are
+    pickleable. If pickling fails, it is retried
+    with the checks (that ie. drop unpickleable
+    parameters or log the failure).
+
+    Returns
+    -------
+    bytes, float
+        The pickle and the time spent (seconds).
+    """
+    start = time.perf_counter()
+    try:
+        with _unchecked():
+            data = ForkingPickler.dumps(obj)
+    except Exception:
+        data = ForkingPickler.dumps(obj)
+    return bytes(data), time.perf_counter() - start
+
+class Pickled:
+    """Object pickled beforehand.
+
+    Pickling this writes the pickle as is
+    and the object is unpickled from it."""
+
+    def __init__(self, data:bytes):
+        self.data = data
+
+    def __reduce__(self):
+        return pickle.loads, (self.data,)
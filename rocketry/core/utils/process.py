@@ -1,4 +1,18 @@
+import multiprocessing
 from multiprocessing import current_process
 
 def is_main_subprocess():
     return current_process().name == 'MainProcess'
+
+def get_context() -> multiprocessing.context.BaseContext:
+    """Get the context the processes are created with.
+
+    Unlike creating the processes with
+    ``multiprocessing.Process``, this does not fix
+    the global start method if it is not set (the
+    platform's default is used then)."""
+    method = multiprocessing.get_start_method(allow_none=True)
+    if method is None:
+        # The first is the default
+        method = multiprocessing.get_all_start_methods()[0]
+    return multiprocessing.get_context(method)
@@ -3,3 +3,6 @@ from .log_record import (
     MinimalRecord, LogRecord, TaskLogRecord,
     MinimalRunRecord, RunRecord, TaskRunRecord
 )
+from .compact import CompactRepo, CompactRecord
+from .sqlite import SQLiteRepo
+from .buffered import BufferedRepo
@@ -0,0 +1,240 @@
+"""Log repository that writes the records to
+another repository in a background thread."""
+
+import atexit
+import threading
+import time
+import weakref
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic.v1 import PrivateAttr, root_validator
+from redbird.templates import TemplateRepo
+from redbird.utils.query import QueryMatcher
+
+class _BatchWriter:
+    """Queue of the records waiting to be written
+    and the thread writing them.
+
+    The records stay in the queue until they are
+    written so that the reads can see them. The
+    thread is started when there are records to
+    write and it exits when the queue is empty."""
+
+    def __init__(self, repo, batch_size:int, flush_interval:float, max_size:int, get_task_name):
+        self.repo = repo
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.get_task_name = get_task_name
+
+        self.pending: Deque[Tuple[Any, float]] = deque()
+        self.errors: Dict[Optional[str], Exception] = {}
+        # Guards the queue
+        self.cond = threading.Condition()
+        # Held while writing a batch and removing it from
+        # the queue so reads see the records once
+        self.io_lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        _WRITERS.add(self)
+
+    def put(self, item):
+        with self.cond:
+            task_name = self.get_task_name(item)
+            if task_name in self.errors:
+                # Writing a previous record of the task failed
+                raise self.errors.pop(task_name)
+            while len(self.pending) >= self.max_size:
+                # Backpressure
+                self._start()
+                self.cond.wait()
+            self.pending.append((item, time.monotonic()))
+            self._start()
+            if len(self.pending) >= self.batch_size:
+                self.cond.notify_all()
+
+    def get_pending(self) -> List:
+        with self.cond:
+            return [item for item, _ in self.pending]
+
+    def flush(self):
+        "Write the queued records in this thread"
+        self._write_batch()
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rocketry-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if not self._wait_batch():
+                    self._thread = None
+                    return
+            self._write_batch(self.batch_size)
+
+    def _wait_batch(self) -> bool:
+        "Wait until there is a batch to write (False if nothing to write)"
+        while self.pending:
+            timeout = self.pending[0][1] + self.flush_interval - time.monotonic()
+            if len(self.pending) >= self.batch_size or timeout <= 0:
+                return True
+            self.cond.wait(timeout)
+        return False
+
+    def _write_batch(self, size:int=None):
+        with self.io_lock:
+            with self.cond:
+                batch = [item for item, _ in islice(self.pending, size)]
+            if not batch:
+                return
+            self._write(batch)
+            with self.cond:
+                for _ in batch:
+                    self.pending.popleft()
+                self.cond.notify_all()
+
+    def _write(self, batch:list):
+        errors = {}
+        for item in batch:
+            try:
+                self.repo.add(item)
+            except Exception as exc:
+                errors[self.get_task_name(item)] = exc
+        flush = getattr(self.repo, "flush", None)
+        if flush is not None:
+            try:
+                flush()
+            except Exception as exc:
+                for item in batch:
+                    errors[self.get_task_name(item)] = exc
+        if errors:
+            with self.cond:
+                self.errors.update(errors)
+
+_WRITERS = weakref.WeakSet()
+
+@atexit.register
+def _flush_writers():
+    for writer in list(_WRITERS):
+        writer.flush()
+
+class BufferedRepo(TemplateRepo):
+    """Log repository that writes to another
+    repository in batches in a background thread.
+
+    Logging a record only puts it to a queue thus
+    slow repositories do not block the scheduler.
+    The queued records are included in the reads.
+    If writing a record fails, the error is raised
+    when the task of the record logs next time.
+
+    Parameters
+    ----------
+    repo : redbird.BaseRepo
+        Repository where the records are written.
+    batch_size : int
+        Number of records that are written
+        without waiting.
+    flush_interval : float
+        Maximum number of seconds a record waits
+        to be written.
+    max_size : int
+        Maximum number of records in the queue.
+        Logging waits if the queue is full.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from rocketry import Rocketry
+        from rocketry.log import BufferedRepo, SQLiteRepo, MinimalRecord
+
+        repo = SQLiteRepo(filename="logs.db", model=MinimalRecord)
+        app = Rocketry(logger_repo=BufferedRepo(repo=repo))
+    """
+
+    repo: Any
+    model: Type = None
+    batch_size: int = 100
+    flush_interval: float = 0.5
+    max_size: int = 10_000
+
+    _writer: _BatchWriter = PrivateAttr(default=None)
+
+    @root_validator(pre=True)
+    def get_model(cls, values):
+        if values.get("model") is None and "repo" in values:
+            values["model"] = values["repo"].model
+        return values
+
+    @property
+    def writer(self) -> _BatchWriter:
+        if self._writer is None:
+            self._writer = _BatchWriter(
+                self.repo,
+                batch_size=self.batch_size,
+                flush_interval=self.flush_interval,
+                max_size=self.max_size,
+                get_task_name=self._get_task_name,
+            )
+        return self._writer
+
+    def insert(self, item):
+        self.writer.put(item)
+
+    def flush(self):
+        "Write the queued records"
+        if self._writer is not None:
+            self._writer.flush()
+
+    def query_items(self, query:dict) -> Iterator:
+        items, pending = self._read(query, lambda result: result.all())
+        yield from items
+        yield from pending
+
+    def query_read_first(self, query:dict):
+        item, pending = self._read(query, lambda result: result.first())
+        if item is None and pending:
+            return pending[0]
+        return item
+
+    def query_read_last(self, query:dict):
+        item, pending = self._read(query, lambda result: result.last())
+        # Queued records are the latest
+        return pending[-1] if pending else item
+
+    def query_count(self, query:dict) -> int:
+        count, pending = self._read(query, lambda result: result.count())
+        return count + len(pending)
+
+    def query_update(self, query:dict, values:dict):
+        self.flush()
+        return self.repo.filter_by(**query).update(**values)
+
+    def query_delete(self, query:dict):
+        self.flush()
+        return self.repo.filter_by(**query).delete()
+
+    def _read(self, query:dict, func):
+        writer = self.writer
+        with writer.io_lock:
+            value = func(self.repo.filter_by(**query))
+            pending = writer.get_pending()
+        matcher = QueryMatcher(query, value_getter=self.get_field_value)
+        return value, [item for item in pending if item in matcher]
+
+    def _get_task_name(self, item) -> Optional[str]:
+        try:
+            return self.get_field_value(item, "task_name")
+        except (AttributeError, KeyError):
+            return None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The queue and the thread are not passed
+        state['__private_attribute_values__'] = {**state['__private_attribute_values__'], '_writer': None}
+        return state
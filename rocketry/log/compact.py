@@ -0,0 +1,168 @@
+"""In-memory log repository that stores the
+records in a compact form without validating."""
+
+import sys
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple, Type
+
+from pydantic.v1 import PrivateAttr
+from redbird.exc import DataToItemError
+from redbird.repos import MemoryRepo
+from redbird.utils.query import QueryMatcher
+
+from .log_record import MinimalRecord
+
+class CompactRecord:
+    """Log record stored in ``CompactRepo``.
+
+    The task name and the action are interned
+    thus records of the same task and action
+    share them. Other fields of the model are
+    stored in a dict."""
+
+    __slots__ = ("task_name", "action", "created", "_extra")
+
+    def __init__(self, task_name:str, action:str, created:float, extra:Optional[dict]=None):
+        set_attr = object.__setattr__
+        set_attr(self, "task_name", sys.intern(task_name))
+        set_attr(self, "action", sys.intern(action))
+        set_attr(self, "created", created)
+        set_attr(self, "_extra", extra)
+
+    def __getattr__(self, name):
+        # Called only for other than the slots
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self.__slots__:
+            if name in ("task_name", "action"):
+                value = sys.intern(value)
+            object.__setattr__(self, name, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[name] = value
+
+    def to_dict(self) -> dict:
+        data = {"task_name": self.task_name, "action": self.action, "created": self.created}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, CompactRecord):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"CompactRecord({fields})"
+
+class CompactRepo(MemoryRepo):
+    """In-memory log repository for high
+    throughput logging.
+
+    The records are not validated when logged.
+    Instead, only the fields of the model are
+    stored (in ``CompactRecord``) and they are
+    turned to the model when read. Counting and
+    reading the first or the last record do not
+    turn the other records.
+
+    Parameters
+    ----------
+    model : Type
+        Class of a log record (subclass of
+        Pydantic BaseModel). Only its fields
+        are stored.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from rocketry import Rocketry
+        from rocketry.log import CompactRepo, MinimalRecord
+
+        app = Rocketry(logger_repo=CompactRepo(model=MinimalRecord))
+    """
+
+    model: Type = MinimalRecord
+
+    _fields: Optional[Tuple[FrozenSet[str], Tuple[str, ...]]] = PrivateAttr(default=None)
+
+    def add(self, item, if_exists="raise"):
+        if self.id_field is not None or if_exists != "raise":
+            return super().add(item, if_exists=if_exists)
+        self.insert(item)
+
+    def insert(self, item):
+        record = self._to_record(item)
+        if self.id_field is not None:
+            # Checks the uniqueness
+            super().insert(record)
+        else:
+            self.collection.append(record)
+
+    def data_to_item(self, data):
+        if not isinstance(data, CompactRecord):
+            return super().data_to_item(data)
+        try:
+            return self.model(**data.to_dict())
+        except Exception as exc:
+            raise DataToItemError(f"Could not transform {data}") from exc
+
+    def query_count(self, query:dict) -> int:
+        return sum(1 for _ in self.query_data(query))
+
+    def query_read_first(self, query:dict):
+        for data in self.query_data(query):
+            return self.data_to_item(data)
+
+    def query_read_last(self, query:dict):
+        matcher = QueryMatcher(query, value_getter=self.get_field_value)
+        for data in reversed(self.collection):
+            if data in matcher:
+                return self.data_to_item(data)
+
+    def query_read_limit(self, query:dict, n:int) -> list:
+        items = []
+        for data in self.query_data(query):
+            if len(items) >= n:
+                break
+            items.append(self.data_to_item(data))
+        return items
+
+    def query_items(self, query:dict) -> Iterator:
+        for data in self.query_data(query):
+            yield self.data_to_item(data)
+
+    def _to_record(self, item) -> CompactRecord:
+        if isinstance(item, CompactRecord):
+            item = item.to_dict()
+        data = item if isinstance(item, dict) else self.item_to_dict(item, exclude_unset=False)
+        required, extra_fields = self._get_fields()
+        try:
+            if not required <= data.keys():
+                raise KeyError
+            return self._create_record(data, extra_fields)
+        except (KeyError, TypeError, ValueError):
+            # Raises the validation error or
+            # converts the values
+            data = self.item_to_dict(self.to_item(data), exclude_unset=False)
+            return self._create_record(data, extra_fields)
+
+    @staticmethod
+    def _create_record(data:dict, extra_fields:Tuple[str, ...]) -> CompactRecord:
+        extra = {field: data[field] for field in extra_fields if field in data} if extra_fields else None
+        return CompactRecord(data["task_name"], data["action"], float(data["created"]), extra)
+
+    def _get_fields(self) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        if self._fields is None:
+            fields: Dict[str, Any] = getattr(self.model, "__fields__", {})
+            required = frozenset(name for name, field in fields.items() if field.required) | {"task_name", "action", "created"}
+            extra_fields = tuple(name for name in fields if name not in CompactRecord.__slots__)
+            self._fields = (required, extra_fields)
+        return self._fields
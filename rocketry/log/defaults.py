@@ -1,9 +1,9 @@
 from redbird.logging import RepoHandler
-from redbird.repos import MemoryRepo
+from .compact import CompactRepo
 from .log_record import MinimalRecord
 
 def create_default_handler():
     "Create default handler that can be read"
     return RepoHandler(
-        repo=MemoryRepo(model=MinimalRecord)
+        repo=CompactRepo(model=MinimalRecord)
     )
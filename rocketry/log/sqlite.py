@@ -0,0 +1,306 @@
+"""Log repository that stores the records to
+a SQLite database.
+
+The repository is tuned for the queries Rocketry
+makes: latest record of an action and the records
+of actions in a time range of a task."""
+
+import atexit
+import datetime
+import sqlite3
+import threading
+import time
+import weakref
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic.v1 import Field, PrivateAttr
+from redbird.oper import Between, In, Operation, skip
+from redbird.templates import TemplateRepo
+
+from .log_record import MinimalRecord
+
+_OPERATORS = {
+    "__gt__": ">",
+    "__lt__": "<",
+    "__ge__": ">=",
+    "__le__": "<=",
+    "__eq__": "=",
+    "__ne__": "!=",
+}
+
+_COLUMN_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    datetime.timedelta: "REAL",
+}
+
+_INDEXES = (
+    # Latest of an action (the rowid is the order of the repo)
+    ("task_name", "action"),
+    # Actions in a time range
+    ("task_name", "action", "created"),
+    # All records in a time range
+    ("task_name", "created"),
+)
+
+def _to_sql_value(value):
+    "Convert a value to a type SQLite understands"
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return int(value) if isinstance(value, bool) else value
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return _to_sql_value(value.value)
+    return str(value)
+
+def _quote(name:str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+class _SQLiteStore:
+    """Connection and the write buffer of a repo.
+
+    Records are inserted in batches. The buffer is
+    flushed before reading so the reads see all of
+    the added records."""
+
+    def __init__(self, filename:str, table:str, columns:Dict[str, str], batch_size:int, flush_interval:float):
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(filename, check_same_thread=False, cached_statements=256)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.table = _quote(table)
+        cols = ", ".join(f"{_quote(col)} {type_}".rstrip() for col, type_ in columns.items())
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({cols})")
+        for index in _INDEXES:
+            if set(index) <= set(columns):
+                name = _quote(f"ix_{table}_" + "_".join(index))
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {self.table} ({', '.join(map(_quote, index))})")
+        self.conn.commit()
+
+        self.select = f"SELECT {', '.join(map(_quote, self.columns))} FROM {self.table}"
+        self.insert = f"INSERT INTO {self.table} ({', '.join(map(_quote, self.columns))}) VALUES ({', '.join('?' * len(self.columns))})"
+
+        self._buffer: List[tuple] = []
+        self._buffered_at: Optional[float] = None
+        _STORES.add(self)
+
+    def add(self, row:tuple):
+        with self.lock:
+            if not self._buffer:
+                self._buffered_at = time.monotonic()
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_size or time.monotonic() - self._buffered_at >= self.flush_interval:
+                self.flush()
+
+    def flush(self):
+        "Write the buffered rows"
+        with self.lock:
+            if not self._buffer or self.conn is None:
+                return
+            rows = self._buffer
+            self._buffer = []
+            with self.conn:
+                self.conn.executemany(self.insert, rows)
+
+    def execute(self, sql:str, params:Union[list, tuple]=()) -> List[tuple]:
+        with self.lock:
+            self.flush()
+            return self.conn.execute(sql, params).fetchall()
+
+    def modify(self, sql:str, params:Union[list, tuple]=()) -> int:
+        with self.lock:
+            self.flush()
+            with self.conn:
+                return self.conn.execute(sql, params).rowcount
+
+    def close(self):
+        with self.lock:
+            if self.conn is None:
+                return
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+_STORES = weakref.WeakSet()
+
+@atexit.register
+def _flush_stores():
+    for store in list(_STORES):
+        store.flush()
+
+class SQLiteRepo(TemplateRepo):
+    """SQLite log repository
+
+    The records are stored to a table in a SQLite
+    database (in WAL mode). The table is indexed by
+    the task name, action and creation time so that
+    the latest actions and the actions on a period
+    of the tasks can be queried without scanning
+    the table. Records are inserted in batches and
+    the batch is written before any read.
+
+    Parameters
+    ----------
+    filename : path-like
+        The database file. By default in memory.
+    table : str
+        Name of the table of the log records.
+    model : Type
+        Class of a log record. Subclass of Pydantic
+        BaseModel (columns are the fields) or dict
+        (columns are given as ``fields``).
+    fields : list of str, optional
+        Columns of the table if the model has no
+        fields.
+    batch_size : int
+        Maximum number of records waiting to be
+        inserted.
+    flush_interval : float
+        Maximum number of seconds a record waits
+        to be inserted (checked when adding).
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from rocketry import Rocketry
+        from rocketry.log import SQLiteRepo, MinimalRecord
+
+        app = Rocketry(logger_repo=SQLiteRepo(filename="logs.db", model=MinimalRecord))
+    """
+
+    filename: Union[str, Path] = ":memory:"
+    table: str = "log"
+    model: Type = MinimalRecord
+    fields: Optional[List[str]] = None
+    batch_size: int = 100
+    flush_interval: float = 1.0
+
+    ordered: bool = Field(default=True, const=True)
+
+    _store: Optional[_SQLiteStore] = PrivateAttr(default=None)
+
+    @property
+    def store(self) -> _SQLiteStore:
+        if self._store is None:
+            self._store = _SQLiteStore(
+                str(self.filename), self.table, self.get_columns(),
+                batch_size=self.batch_size, flush_interval=self.flush_interval
+            )
+        return self._store
+
+    def get_columns(self) -> Dict[str, str]:
+        "Get the columns and their types of the table"
+        if self.fields is not None:
+            return {field: "" for field in self.fields}
+        if not hasattr(self.model, "__fields__"):
+            raise TypeError("Cannot determine the columns. Pass fields or a model with fields.")
+        return {
+            name: _COLUMN_TYPES.get(field.type_, "TEXT")
+            for name, field in self.model.__fields__.items()
+        }
+
+    def insert(self, item):
+        data = self.item_to_dict(item, exclude_unset=False)
+        self.store.add(tuple(_to_sql_value(data.get(col)) for col in self.store.columns))
+
+    def flush(self):
+        "Write the records waiting to be inserted"
+        if self._store is not None:
+            self._store.flush()
+
+    def close(self):
+        "Write the waiting records and close the connection"
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def query_data(self, query:Tuple[str, list]) -> Iterator[dict]:
+        yield from self._read(query, "ORDER BY rowid")
+
+    def query_read_first(self, query:Tuple[str, list]):
+        for data in self._read(query, "ORDER BY rowid LIMIT 1"):
+            return self.data_to_item(data)
+
+    def query_read_last(self, query:Tuple[str, list]):
+        for data in self._read(query, "ORDER BY rowid DESC LIMIT 1"):
+            return self.data_to_item(data)
+
+    def query_read_limit(self, query:Tuple[str, list], n:int):
+        return [self.data_to_item(data) for data in self._read(query, f"ORDER BY rowid LIMIT {int(n)}")]
+
+    def query_count(self, query:Tuple[str, list]) -> int:
+        where, params = query
+        return self.store.execute(f"SELECT COUNT(*) FROM {self.store.table}{where}", params)[0][0]
+
+    def query_update(self, query:Tuple[str, list], values:dict):
+        where, params = query
+        self._check_fields(values)
+        sets = ", ".join(f"{_quote(col)} = ?" for col in values)
+        return self.store.modify(
+            f"UPDATE {self.store.table} SET {sets}{where}",
+            [_to_sql_value(val) for val in values.values()] + params
+        )
+
+    def query_delete(self, query:Tuple[str, list]):
+        where, params = query
+        return self.store.modify(f"DELETE FROM {self.store.table}{where}", params)
+
+    def format_query(self, query:dict) -> Tuple[str, list]:
+        "Turn the query to a WHERE clause and its parameters"
+        self._check_fields(query)
+        conditions = []
+        params = []
+        for col, value in query.items():
+            col = _quote(col)
+            if value is skip:
+                continue
+            if isinstance(value, In):
+                values = list(value.value)
+                if not values:
+                    conditions.append("0")
+                    continue
+                conditions.append(f"{col} IN ({', '.join('?' * len(values))})")
+                params.extend(_to_sql_value(val) for val in values)
+            elif isinstance(value, Between):
+                conditions.append(f"{col} BETWEEN ? AND ?")
+                params.extend((_to_sql_value(value.start), _to_sql_value(value.end)))
+            elif isinstance(value, Operation):
+                conditions.append(f"{col} {_OPERATORS[value.__py_magic__]} ?")
+                params.append(_to_sql_value(value.value))
+            elif value is None:
+                conditions.append(f"{col} IS NULL")
+            else:
+                conditions.append(f"{col} = ?")
+                params.append(_to_sql_value(value))
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, params
+
+    def _read(self, query:Tuple[str, list], order:str) -> Iterator[dict]:
+        where, params = query
+        store = self.store
+        for row in store.execute(f"{store.select}{where} {order}", params):
+            yield dict(zip(store.columns, row))
+
+    def _check_fields(self, data:dict):
+        columns = self.store.columns
+        for field in data:
+            if field not in columns:
+                raise KeyError(f"Repo has no field '{field}'")
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The connection is opened again
+        state['__private_attribute_values__'] = {**state['__private_attribute_values__'], '_store': None}
+        return state
@@ -0,0 +1,163 @@
+"""Transport of log records from the task processes
+to the scheduler.
+
+Each process gets its own pipe in which the records
+are sent in batches. The scheduler reads all of
+the pipes with one reader that is attached to its
+event loop (if the loop supports it) or polled."""
+
+import logging
+import pickle
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection, wait
+from queue import Empty
+from typing import Callable, Deque, Dict, List, Optional
+
+class LogWriter:
+    """Child side of a log pipe.
+
+    Has the same interface for putting records as
+    ``multiprocessing.Queue`` so it can be used with
+    ``QueueHandler``. Records are buffered and sent
+    as a batch. Status records (that have action) are
+    sent immediately as the scheduler waits for them.
+
+    Parameters
+    ----------
+    conn : multiprocessing.connection.Connection
+        Sending end of the pipe.
+    batch_size : int
+        Maximum number of records in a batch.
+    """
+
+    def __init__(self, conn:Connection, batch_size:int=100):
+        self.conn = conn
+        self.batch_size = batch_size
+        self._buffer: List = []
+
+    def put(self, record, block=True, timeout=None):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size or getattr(record, "action", None) is not None:
+            self.flush()
+
+    def put_nowait(self, record):
+        self.put(record, block=False)
+
+    def flush(self):
+        "Send the buffered records"
+        if not self._buffer:
+            return
+        batch = [
+            # Only the attributes are sent
+            vars(record) if isinstance(record, logging.LogRecord) else record
+            for record in self._buffer
+        ]
+        self._buffer = []
+        self.conn.send_bytes(pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def close(self):
+        self.conn.close()
+
+class LogReader:
+    """Scheduler side of the log pipes.
+
+    Has the same interface for getting records as
+    ``multiprocessing.Queue``. A pipe is opened for each
+    process and it is closed when the process has exited.
+
+    When attached to an event loop, the pipes are read
+    when they have data and the received records
+    can be got without polling the pipes.
+    """
+
+    def __init__(self):
+        self._conns: Dict[int, Connection] = {}
+        self._records: Deque = deque()
+        self._loop = None
+        self._on_receive: Optional[Callable] = None
+
+    def open_pipe(self) -> LogWriter:
+        """Open a pipe for a new process. The returned
+        writer should be passed to the process and then
+        closed in this process."""
+        conn_recv, conn_send = Pipe(duplex=False)
+        self._conns[conn_recv.fileno()] = conn_recv
+        if self._loop is not None:
+            self._loop.add_reader(conn_recv.fileno(), self._on_readable, conn_recv)
+        return LogWriter(conn_send)
+
+    def get(self, block=True, timeout=None):
+        "Get a record and poll the pipes if none received"
+        if not self._records:
+            self.read(timeout=timeout if block else 0)
+        return self.get_received()
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def get_received(self):
+        "Get a record without polling the pipes"
+        try:
+            return self._records.popleft()
+        except IndexError:
+            raise Empty
+
+    def read(self, timeout:Optional[float]=0):
+        "Receive records from the pipes that have data"
+        conns = list(self._conns.values())
+        if not conns:
+            return
+        for conn in wait(conns, timeout=timeout):
+            self._read_conn(conn)
+
+    def attach(self, loop, on_receive:Callable=None) -> bool:
+        """Read the pipes in the event loop when they
+        have data. Returns whether the loop supports
+        it (ie. the proactor loop on Windows does not)."""
+        try:
+            for fd, conn in self._conns.items():
+                loop.add_reader(fd, self._on_readable, conn)
+        except NotImplementedError:
+            return False
+        self._loop = loop
+        self._on_receive = on_receive
+        return True
+
+    def detach(self):
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            for fd in self._conns:
+                loop.remove_reader(fd)
+        self._loop = None
+        self._on_receive = None
+
+    @property
+    def n_pipes(self) -> int:
+        return len(self._conns)
+
+    def _on_readable(self, conn:Connection):
+        # The pipe may have been read (polled) after the loop
+        # found it readable thus checked to not block the loop
+        if not conn.closed and conn.poll():
+            self._read_conn(conn)
+
+    def _read_conn(self, conn:Connection):
+        try:
+            data = conn.recv_bytes()
+        except (EOFError, OSError):
+            # The process has exited and all sent
+            # records are read
+            self._close_conn(conn)
+            return
+        for item in pickle.loads(data):
+            self._records.append(logging.makeLogRecord(item) if isinstance(item, dict) else item)
+        if self._on_receive is not None:
+            self._on_receive()
+
+    def _close_conn(self, conn:Connection):
+        fd = conn.fileno()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(fd)
+        del self._conns[fd]
+        conn.close()
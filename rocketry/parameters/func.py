@@ -12,6 +12,9 @@ class FuncParam:
         name : str
             Name of the parameter, by default
             the name of the function.
+        cache : str, float, timedelta, optional
+            How the value is cached. See
+            ``rocketry.args.FuncArg``.
 
     Examples
     --------
@@ -32,14 +35,15 @@ class FuncParam:
         ... # Send email list
 
     """
-    def __init__(self, name=None, session=None):
+    def __init__(self, name=None, session=None, cache=None):
         self.name = name
         self.session = session
+        self.cache = cache
 
     def __call__(self, func: Callable):
         session = FuncArg.session if self.session is None else self.session
         name = self._get_name(func)
-        session.parameters[name] = FuncArg(func)
+        session.parameters[name] = FuncArg(func, cache=self.cache)
         func.__rocketry__ = {'param_name': name}
         return func
 
@@ -1,5 +1,6 @@
-from typing import Iterable, Iterator
+from typing import Callable, Iterable, Iterator, Sequence, Tuple
 import datetime
+import operator
 
 from rocketry.pybox.time.convert import to_datetime
 
@@ -8,12 +9,66 @@ class QueryBase:
     def _get_value(self, item:dict, oper):
         return item[oper.name] if isinstance(oper, Key) else oper
 
-    def filter(self, data:Iterable[dict]) -> Iterator[dict]:
-        "Filter iterable of dicts"
-        for dict in data:
-            if self.match(dict):
+    def filter(self, data:Iterable[dict], sorted_by:str=None) -> Iterator[dict]:
+        """Filter iterable of dicts
+
+        Parameters
+        ----------
+        data : iterable of dicts
+            Items to filter.
+        sorted_by : str, optional
+            Key the data (a sequence) is sorted by.
+            The part of the data the comparisons of
+            the key can match is searched by bisect.
+        """
+        match = self.compile()
+        items = data
+        if sorted_by is not None:
+            start, end = self._get_range(data, sorted_by)
+            items = (data[i] for i in range(start, end))
+        for dict in items:
+            if match(dict):
                 yield dict
 
+    def compile(self) -> Callable[[dict], bool]:
+        """Compile the query to a function that
+        checks whether an item matches"""
+        return self.match
+
+    def to_sql(self) -> Tuple[str, list]:
+        """Put the query to a SQL WHERE clause
+        (without WHERE) and its parameters"""
+        raise TypeError(f"No conversion to SQL for type: {type(self)}")
+
+    def _get_range(self, data:Sequence[dict], key:str) -> Tuple[int, int]:
+        "Get the range of the data (sorted by the key) the query can match"
+        start, end = 0, len(data)
+        if not data:
+            return start, end
+        comparisons = self.args if isinstance(self, All) else (self,)
+        for comp in comparisons:
+            oper_value = comp._get_key_value(key) if isinstance(comp, _Comparison) else None
+            if oper_value is None:
+                continue
+            oper, value = oper_value
+            if oper is operator.ne:
+                continue
+            if isinstance(value, datetime.datetime) or isinstance(data[0][key], datetime.datetime):
+                value = to_datetime(value)
+                get_value = lambda item: to_datetime(item[key])
+            else:
+                get_value = operator.itemgetter(key)
+
+            if oper in (operator.ge, operator.eq):
+                start = max(start, _bisect(data, value, get_value))
+            if oper is operator.gt:
+                start = max(start, _bisect(data, value, get_value, right=True))
+            if oper in (operator.le, operator.eq):
+                end = min(end, _bisect(data, value, get_value, right=True))
+            if oper is operator.lt:
+                end = min(end, _bisect(data, value, get_value))
+        return start, max(start, end)
+
     def to_pykwargs(self):
         """Put the query to simple Python keyword representation"""
 
@@ -119,6 +174,20 @@ class All(Expression):
     def match(self, item:dict):
         return all(arg.match(item) for arg in self.args)
 
+    def compile(self):
+        funcs = tuple(arg.compile() for arg in self.args)
+        if len(funcs) == 1:
+            return funcs[0]
+        def match(item):
+            for func in funcs:
+                if not func(item):
+                    return False
+            return True
+        return match
+
+    def to_sql(self):
+        return _join_sql(self.args, " AND ", empty="1")
+
     def __iter__(self):
         return iter(self.args)
 
@@ -137,6 +206,20 @@ class Any(Expression):
     def match(self, item:dict):
         return any(arg.match(item) for arg in self.args)
 
+    def compile(self):
+        funcs = tuple(arg.compile() for arg in self.args)
+        if len(funcs) == 1:
+            return funcs[0]
+        def match(item):
+            for func in funcs:
+                if func(item):
+                    return True
+            return False
+        return match
+
+    def to_sql(self):
+        return _join_sql(self.args, " OR ", empty="0")
+
     def __iter__(self):
         return iter(self.args)
 
@@ -151,101 +234,23 @@ class Not(Expression):
     def match(self, item:dict):
         return not self.right.match(item)
 
-    def __str__(self):
-        return f'~{self.right}'
-
-
-class Equal(Expression):
-
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-    def match(self, item:dict):
-        left_value = self._get_value(item, oper=self.left)
-        right_value = self._get_value(item, oper=self.right)
-        left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value == right_value
-
-    def __str__(self):
-        left, right = self.left, self.right
-        left = repr(left) if isinstance(left, str) else str(left)
-        right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} == {str(right)}" + ')'
-
-class NotEqual(Expression):
-
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-    def match(self, item:dict):
-        left_value = self._get_value(item, oper=self.left)
-        right_value = self._get_value(item, oper=self.right)
-        left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value != right_value
-
-    def __str__(self):
-        left, right = self.left, self.right
-        left = repr(left) if isinstance(left, str) else str(left)
-        right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} != {str(right)}" + ')'
-
-class Greater(Expression):
-
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-    def match(self, item:dict):
-        left_value = self._get_value(item, oper=self.left)
-        right_value = self._get_value(item, oper=self.right)
-        left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value > right_value
+    def compile(self):
+        func = self.right.compile()
+        return lambda item: not func(item)
 
-    def __str__(self):
-        left, right = self.left, self.right
-        left = repr(left) if isinstance(left, str) else str(left)
-        right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} > {str(right)}" + ')'
-
-class GreaterEqual(Expression):
-
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-    def match(self, item:dict):
-        left_value = self._get_value(item, oper=self.left)
-        right_value = self._get_value(item, oper=self.right)
-        left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value >= right_value
+    def to_sql(self):
+        sql, params = self.right.to_sql()
+        return f"NOT ({sql})", params
 
     def __str__(self):
-        left, right = self.left, self.right
-        left = repr(left) if isinstance(left, str) else str(left)
-        right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} >= {str(right)}" + ')'
+        return f'~{self.right}'
 
-class Less(Expression):
 
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
+class _Comparison(Expression):
+    "Comparison of a key to a value (or two keys or values)"
 
-    def match(self, item:dict):
-        left_value = self._get_value(item, oper=self.left)
-        right_value = self._get_value(item, oper=self.right)
-        left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value < right_value
-
-    def __str__(self):
-        left, right = self.left, self.right
-        left = repr(left) if isinstance(left, str) else str(left)
-        right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} < {str(right)}" + ')'
-
-class LessEqual(Expression):
+    _operator = None
+    _symbol = None
 
     def __init__(self, left, right):
         self.left = left
@@ -255,14 +260,130 @@ class LessEqual(Expression):
         left_value = self._get_value(item, oper=self.left)
         right_value = self._get_value(item, oper=self.right)
         left_value, right_value = self._to_comparable(left_value, right_value)
-        return left_value <= right_value
+        return self._operator(left_value, right_value)
+
+    def compile(self):
+        is_left_key = isinstance(self.left, Key)
+        is_right_key = isinstance(self.right, Key)
+        if is_left_key and not is_right_key:
+            return _compile_comparison(self.left.name, self.right, self._operator)
+        if is_right_key and not is_left_key:
+            return _compile_comparison(self.right.name, self.left, _REVERSED[self._operator])
+        return self.match
+
+    def to_sql(self):
+        sql = []
+        params = []
+        for oper in (self.left, self.right):
+            if isinstance(oper, Key):
+                sql.append(_quote(oper.name))
+            else:
+                sql.append("?")
+                params.append(oper)
+        return f"{sql[0]} {_SQL_OPERATORS[self._operator]} {sql[1]}", params
+
+    def _get_key_value(self, key:str):
+        "Get the operator and the value if compares the key"
+        if isinstance(self.left, Key) and not isinstance(self.right, Key) and self.left.name == key:
+            return self._operator, self.right
+        if isinstance(self.right, Key) and not isinstance(self.left, Key) and self.right.name == key:
+            return _REVERSED[self._operator], self.left
+        return None
 
     def __str__(self):
         left, right = self.left, self.right
         left = repr(left) if isinstance(left, str) else str(left)
         right = repr(right) if isinstance(right, str) else str(right)
-        return '(' + f"{str(left)} <= {str(right)}" + ')'
-
+        return '(' + f"{str(left)} {self._symbol} {str(right)}" + ')'
+
+class Equal(_Comparison):
+    _operator = operator.eq
+    _symbol = "=="
+
+class NotEqual(_Comparison):
+    _operator = operator.ne
+    _symbol = "!="
+
+class Greater(_Comparison):
+    _operator = operator.gt
+    _symbol = ">"
+
+class GreaterEqual(_Comparison):
+    _operator = operator.ge
+    _symbol = ">="
+
+class Less(_Comparison):
+    _operator = operator.lt
+    _symbol = "<"
+
+class LessEqual(_Comparison):
+    _operator = operator.le
+    _symbol = "<="
+
+_REVERSED = {
+    # a < b is b > a
+    operator.eq: operator.eq,
+    operator.ne: operator.ne,
+    operator.gt: operator.lt,
+    operator.ge: operator.le,
+    operator.lt: operator.gt,
+    operator.le: operator.ge,
+}
+
+_SQL_OPERATORS = {
+    operator.eq: "=",
+    operator.ne: "!=",
+    operator.gt: ">",
+    operator.ge: ">=",
+    operator.lt: "<",
+    operator.le: "<=",
+}
+
+def _quote(name:str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+def _compile_comparison(name:str, value, oper):
+    "Compile comparing item[name] to a value (oper(item[name], value))"
+    if isinstance(value, datetime.datetime):
+        def match(item):
+            return oper(to_datetime(item[name]), value)
+        return match
+
+    try:
+        dt_value = to_datetime(value)
+    except Exception:
+        # Converted (and fails) only if compared to a datetime
+        dt_value = None
+
+    def match(item):
+        item_value = item[name]
+        if isinstance(item_value, datetime.datetime):
+            return oper(item_value, dt_value if dt_value is not None else to_datetime(value))
+        return oper(item_value, value)
+    return match
+
+def _bisect(data:Sequence, value, get_value:Callable, right=False) -> int:
+    "Bisect the sorted data by the values get_value gives"
+    low, high = 0, len(data)
+    while low < high:
+        mid = (low + high) // 2
+        item_value = get_value(data[mid])
+        if item_value < value or (right and item_value == value):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+def _join_sql(args, sep:str, empty:str) -> Tuple[str, list]:
+    if not args:
+        return empty, []
+    sqls = []
+    params = []
+    for arg in args:
+        sql, arg_params = arg.to_sql()
+        sqls.append(f"({sql})")
+        params.extend(arg_params)
+    return sep.join(sqls), params
 
 class Boolean(Expression):
 
@@ -272,5 +393,12 @@ class Boolean(Expression):
     def match(self, item:dict):
         return bool(self.value)
 
+    def compile(self):
+        value = bool(self.value)
+        return lambda item: value
+
+    def to_sql(self):
+        return ("1" if self.value else "0"), []
+
 true = Boolean(True)
 false = Boolean(False)
@@ -27,5 +27,10 @@ class Regex(Expression):
     def match(self, item:dict):
         return bool(re.match(self.regex, self.key.get_value(item)))
 
+    def compile(self):
+        pattern = re.compile(self.regex)
+        name = self.key.name
+        return lambda item: bool(pattern.match(item[name]))
+
     def __str__(self):
         return f're.match({repr(self.regex)}, {str(self.key)})'
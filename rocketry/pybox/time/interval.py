@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from typing import Any
 
 try:
@@ -6,21 +6,41 @@ try:
 except ImportError: # pragma: no cover
     from typing_extensions import Literal
 
-@dataclass(frozen=True)
 class Interval:
     "Mimics pandas.Interval"
 
+    __slots__ = ("left", "right", "closed")
+
     left: Any
     right: Any
-    closed: Literal['left', 'right', 'both', 'neither'] = "left"
+    closed: Literal['left', 'right', 'both', 'neither']
 
-    def __post_init__(self):
-        if self.left > self.right:
+    def __init__(self, left, right, closed:Literal['left', 'right', 'both', 'neither']="left"):
+        if left > right:
             raise ValueError("Left cannot be greater than right")
 
-        if self.closed not in ('left', 'right', 'both', 'neither'):
-            raise ValueError(f"Invalid close: {self.closed}")
+        if closed not in ('left', 'right', 'both', 'neither'):
+            raise ValueError(f"Invalid close: {closed}")
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+        object.__setattr__(self, "closed", closed)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return (self.left, self.right, self.closed) == (other.left, other.right, other.closed)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.left, self.right, self.closed))
 
+    def __reduce__(self):
+        return (type(self), (self.left, self.right, self.closed))
 
     def __contains__(self, dt):
         if self.closed == "right":
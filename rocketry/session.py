@@ -6,18 +6,20 @@ about the scehuler/task/parameters etc.
 from copy import copy
 import datetime
 import logging
+import math
 from multiprocessing import cpu_count
 import time
 import threading
 import warnings
 
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import TYPE_CHECKING, Callable, ClassVar, FrozenSet, Iterable, Dict, List, Optional, Set, Tuple, Type, Union
 from pydantic.v1 import BaseModel, root_validator, validator
 from rocketry.pybox.time import to_timedelta
 from rocketry.log.defaults import create_default_handler
 from rocketry._base import RedBase
 from rocketry.tasks.run_id import uuid
+from rocketry.core.registry import TaskRegistry
 
 try:
     from typing import Literal
@@ -28,6 +30,9 @@ except ImportError: # pragma: no cover
 if TYPE_CHECKING:
     from rocketry.core.log import TaskAdapter
     from rocketry.parse import StaticParser
+    from rocketry.core.condition.cache import CondStateCache
+    from rocketry.core.time.clock import CycleClock
+    from rocketry.utils.dependencies import DependencyGraph
     from rocketry.core import (
         Task,
         Scheduler,
@@ -63,11 +68,23 @@ class Config(BaseModel):
     multilaunch: bool = False
     func_run_id: Callable = uuid
     max_process_count = cpu_count()
+    process_pool: bool = False # Whether to reuse processes across runs of process tasks
+    process_pool_max_runs: Optional[int] = None # Runs after a pooled process is replaced
+    process_pool_max_rss: Optional[int] = None # Memory (MB) after a pooled process is replaced
+    thread_pool_size: Optional[int] = None # Max threads for thread tasks (None: a new thread for each run)
+    return_spool: Optional[str] = None # Directory where large returns of process tasks are passed as memory-mapped files
+    returns_max_size: Optional[int] = None # Max size (bytes, pickled) of the return values kept in memory
+    returns_max_age: Optional[datetime.timedelta] = None # Time after unused return values are evicted
+    returns_spill: Optional[str] = None # Directory where evicted return values are written (removed if not set)
     tasks_as_daemon: bool = True
     restarting: str = 'replace'
     instant_shutdown: bool = False
 
     timeout: datetime.timedelta = datetime.timedelta(minutes=30)
+    log_max_records: Optional[int] = None # Max log records kept per task (in-memory repos)
+    log_max_age: Optional[datetime.timedelta] = None # Max age of log records kept (in-memory repos)
+    log_needed_only: bool = False # Keep only the log records the conditions need (in-memory repos)
+    log_compact_interval: datetime.timedelta = datetime.timedelta(minutes=10) # How often the logs are compacted
     shut_cond: Optional['BaseCondition'] = None
     cls_lock: Type = threading.Lock
 
@@ -90,7 +107,7 @@ class Config(BaseModel):
             return AlwaysFalse()
         return parse_condition(value)
 
-    @validator('timeout', pre=True, always=True)
+    @validator('timeout', 'log_max_age', 'log_compact_interval', 'returns_max_age', pre=True, always=True)
     def parse_timeout(cls, value):
         if isinstance(value, str):
             return to_timedelta(value)
@@ -179,6 +196,13 @@ class Session(RedBase):
     _time_parsers: ClassVar[Dict] = {}
     _cls_cond_parsers: ClassVar[Dict] = {} # Default condition parsers
 
+    # Attributes not passed to child processes
+    _unpicklable: ClassVar[FrozenSet[str]] = frozenset({
+        'tasks', '_cond_cache', '_cond_cycle_cache', '_cycle_clock', '_dependency_graph',
+        '_return_spool', '_pickled', 'session', '_cond_parsers', 'parameters', 'returns'
+    })
+    _unpicklable_conf: ClassVar[FrozenSet[str]] = frozenset({'shut_cond'})
+
     def _get_parameters(self, value):
         from rocketry.core import Parameters
         if value is None:
@@ -212,14 +236,20 @@ class Session(RedBase):
 
     def __init__(self, config=None, parameters=None, delete_existing_loggers=False, **kwargs):
         from rocketry.core import Scheduler
+        from rocketry.core.parameters import ReturnSpool, ReturnStore
         self.config = self._get_config(config, kwargs)
         self.parameters = self._get_parameters(parameters)
         self.scheduler = Scheduler(self)
-        self.tasks = set()
+        self.tasks = TaskRegistry()
         self.hooks = Hooks()
-        self.returns = self._get_parameters(None)
+        self.returns = ReturnStore(session=self)
         self._cond_parsers = self._cls_cond_parsers.copy()
         self._cond_cache: Dict = {} # Cached by CondParser to speed up expensive conditions
+        self._cond_cycle_cache: Optional['CondStateCache'] = None # States of conditions in a scheduling cycle
+        self._cycle_clock: Optional['CycleClock'] = None # Current time in a scheduling cycle
+        self._dependency_graph: Optional['DependencyGraph'] = None # States of the tasks depending on tasks
+        self._return_spool = ReturnSpool() # References to the spooled returns
+        self._pickled = None # Cached pickled copy for child processes
         self._cond_states = {} # Used by FuncConds to relay condiiton states to conditions
         if delete_existing_loggers:
             self.delete_task_loggers()
@@ -227,10 +257,10 @@ class Session(RedBase):
     def __getitem__(self, task:Union['Task', str]):
         "Get a task from the session"
         task_name = self._get_task_name(task)
-        for task in self.tasks:
-            if task.name == task_name:
-                return task
-        raise KeyError(f"Task '{task_name}' not found")
+        task = self.tasks.get(task_name)
+        if task is None:
+            raise KeyError(f"Task '{task_name}' not found")
+        return task
 
     def __contains__(self, task: Union['Task', str]):
         "Check if task is in session"
@@ -311,6 +341,7 @@ class Session(RedBase):
             # Set back the disabled, execution etc.
             for task in self.tasks:
                 task.__dict__.update(orig_vals[task.name])
+                self.tasks.reindex(task)
 
     def restart(self):
         """Restart the scheduler
@@ -319,6 +350,7 @@ class Session(RedBase):
         will occur after the scheduler finishes
         checking one cycle of tasks."""
         self.scheduler._flag_restart.set()
+        self.scheduler._wake_up()
 
     def shutdown(self):
         """Shut down the scheduler
@@ -331,6 +363,7 @@ class Session(RedBase):
             "Please use Session.shut_down instead"
         ), DeprecationWarning)
         self.scheduler._flag_shutdown.set()
+        self.scheduler._wake_up()
 
     def shut_down(self, force=None):
         """Shut down the scheduler"""
@@ -338,6 +371,7 @@ class Session(RedBase):
         self.scheduler._flag_shutdown.set()
         if force:
             self.scheduler._flag_force_exit.set()
+        self.scheduler._wake_up()
 
     def _set_configs(self):
         self._check_readable_logger()
@@ -422,7 +456,7 @@ class Session(RedBase):
             if if_exists == 'ignore':
                 return
             if if_exists == 'replace':
-                self.tasks.remove(task)
+                # The registry replaces the task with the same name
                 self.tasks.add(task)
             elif if_exists == 'raise':
                 raise KeyError(f"Task '{task.name}' already exists")
@@ -432,6 +466,10 @@ class Session(RedBase):
         # Adding the session to the task
         task.session = self
 
+        # The task may be runnable before the
+        # scheduler would otherwise wake up
+        self.scheduler._wake_up()
+
     def remove_task(self, task: Union['Task', str]):
         from rocketry.core.task import Task
         if not isinstance(task, Task):
@@ -445,10 +483,7 @@ class Session(RedBase):
         ), DeprecationWarning)
 
         task_name = self._get_task_name(task)
-        for task in self.tasks:
-            if task.name == task_name:
-                return True
-        return False
+        return self.tasks.get(task_name) is not None
 
     def get_repo(self):
         "Get log repo where the task logs are stored"
@@ -457,6 +492,157 @@ class Session(RedBase):
         logger = logging.getLogger(basename)
         return TaskAdapter(logger, task=None)._get_repo()
 
+    def get_latest_statuses(self, tasks:Iterable['Task']=None, page_size:int=500) -> Dict[str, Dict[str, float]]:
+        """Get the latest times of the status changes
+        of the tasks by reading each log repo once (per
+        page of tasks).
+
+        Only the latest of each action is kept: the
+        log records are not turned to models (except
+        for repos storing the records in text) and SQL
+        repos are aggregated in the database.
+
+        Parameters
+        ----------
+        tasks : iterable of Task, optional
+            Tasks to get the statuses for. By default
+            all tasks in the session.
+        page_size : int
+            Maximum number of tasks in a query.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            Latest times (timestamps) by actions by
+            task names. Tasks with unreadable logs
+            are not included.
+        """
+        from rocketry.core.log import TaskAdapter
+        from rocketry.core.task import Task
+        from redbird.oper import in_
+
+        tasks = self.tasks if tasks is None else tasks
+        repos = {}
+        for task in tasks:
+            adapter = TaskAdapter(logging.getLogger(task.logger_name), task=task, ignore_warnings=True)
+            try:
+                repo = adapter._get_repo()
+            except AttributeError:
+                continue
+            repos.setdefault(id(repo), (repo, []))[1].append(task.name)
+
+        statuses = {}
+        actions = in_(list(Task._status_actions))
+        for repo, names in repos.values():
+            for i in range(0, len(names), page_size):
+                page = names[i:i + page_size]
+                page_statuses = {name: {} for name in page}
+                result = repo.filter_by(task_name=in_(page), action=actions)
+                for task_name, action, created in _iter_latest(repo, result):
+                    latest = page_statuses[task_name]
+                    if action not in latest or created >= latest[action]:
+                        latest[action] = created
+                statuses.update(page_statuses)
+        return statuses
+
+    def compact_logs(self) -> int:
+        """Remove old log records from the in-memory
+        log repos of the tasks.
+
+        The records older than ``config.log_max_age``,
+        the records exceeding ``config.log_max_records``
+        per task and, if ``config.log_needed_only``, the
+        records the conditions do not read are removed.
+        The records the conditions of the session read
+        (ie. the records on their periods) and the latest
+        record of each action of each task are always kept.
+
+        Returns
+        -------
+        int
+            Number of removed records.
+        """
+        from redbird.repos import MemoryRepo
+        from rocketry.core.log import TaskAdapter
+        from rocketry.log.utils import get_field_value
+
+        config = self.config
+        needed = self._get_needed_logs()
+        min_created = self.get_time() - config.log_max_age.total_seconds() if config.log_max_age is not None else -math.inf
+
+        repos = {}
+        for task in self.tasks:
+            adapter = TaskAdapter(logging.getLogger(task.logger_name), task=task, ignore_warnings=True)
+            try:
+                repo = adapter._get_repo()
+            except AttributeError:
+                continue
+            if isinstance(repo, MemoryRepo):
+                repos[id(repo)] = repo
+
+        n_removed = 0
+        cutoffs = {}
+        for repo in repos.values():
+            collection = repo.collection
+            # Records logged during the compaction are
+            # appended after these
+            n = len(collection)
+            snapshot = collection[:n]
+            records = [
+                (get_field_value(record, "task_name"), get_field_value(record, "action"), get_field_value(record, "created"))
+                for record in snapshot
+            ]
+
+            times = {}
+            latest = {}
+            for i, (task_name, action, created) in enumerate(records):
+                times.setdefault(task_name, []).append(created)
+                latest[(task_name, action)] = i
+
+            repo_cutoffs = {}
+            for task_name, task_times in times.items():
+                cutoff = min_created
+                max_records = config.log_max_records
+                if max_records is not None and len(task_times) > max_records:
+                    newest = sorted(task_times)[-max_records] if max_records > 0 else math.inf
+                    cutoff = max(cutoff, newest)
+                if config.log_needed_only:
+                    cutoff = max(cutoff, needed.get(task_name, math.inf))
+                # Conditions must stay correct
+                repo_cutoffs[task_name] = min(cutoff, needed.get(task_name, math.inf))
+
+            keep = set(latest.values())
+            kept = [
+                record
+                for i, (record, (task_name, _, created)) in enumerate(zip(snapshot, records))
+                if created >= repo_cutoffs[task_name] or i in keep
+            ]
+            collection[:n] = kept
+            n_removed += n - len(kept)
+            cutoffs.update(repo_cutoffs)
+
+        for task in self.tasks:
+            cutoff = cutoffs.get(task.name)
+            if cutoff is not None and task._action_index is not None and task._action_index.complete:
+                task._action_index.trim(cutoff)
+        return n_removed
+
+    def _get_needed_logs(self) -> Dict[str, float]:
+        "Get the oldest log records (timestamps) the conditions need by task names"
+        from rocketry.core.condition.base import _merge_needed_logs
+        needed = {}
+        conds = [(self.config.shut_cond, None)]
+        for task in self.tasks:
+            conds += [(task.start_cond, task), (task.end_cond, task)]
+            # Alive runs may be read from the logs
+            starts = [run.start for run in task._run_stack if run.is_alive()]
+            if starts:
+                _merge_needed_logs(needed, {task.name: min(starts)})
+        for cond, task in conds:
+            if cond is not None:
+                _merge_needed_logs(needed, cond._get_needed_logs(task=task, session=self))
+        return needed
+
     def get_task_loggers(self, with_adapters=True) -> Dict[str, Union['TaskAdapter', logging.Logger]]:
         """Get task logger(s) from the session.
 
@@ -520,15 +706,20 @@ class Session(RedBase):
         #! TODO: Remove?
         from rocketry.core import Parameters
 
-        self.tasks = set()
+        self.tasks = TaskRegistry()
         self.parameters = Parameters()
 
     def __getstate__(self):
         # NOTE: When a process task is executed, it will pickle
         # the task.session. Therefore removing unpicklable here.
         state = self.__dict__.copy()
-        state["tasks"] = set()
+        state["tasks"] = TaskRegistry()
         state["_cond_cache"] = None
+        state["_cond_cycle_cache"] = None
+        state["_cycle_clock"] = None
+        state["_dependency_graph"] = None
+        state["_return_spool"] = None
+        state["_pickled"] = None
         state["_cond_parsers"] = None
         state["session"] = None
         #state["parameters"] = None
@@ -538,14 +729,37 @@ class Session(RedBase):
     def _copy_pickle(self):
         # Copy and remove typically unpicklable attrs.
         # Used when creating a child process
-        unpicklable_conf = {'shut_cond'}
-        unpicklable = {'tasks', '_cond_cache', 'session', '_cond_parsers', 'parameters'}
         new_self = copy(self)
-        for attr in unpicklable:
+        for attr in self._unpicklable:
             setattr(new_self, attr, None)
-        new_self.config = self.config.copy(exclude=unpicklable_conf)
+        new_self.config = self.config.copy(exclude=self._unpicklable_conf)
         return new_self
 
+    def _get_pickled(self):
+        # Copy of the session pickled for child processes.
+        # Cached till an attribute of the session or the
+        # config is set (the key holds the values thus
+        # their ids cannot be reused)
+        from rocketry.core.utils.pickle import Pickled, dumps
+        key = (
+            *((name, value) for name, value in self.__dict__.items() if name not in self._unpicklable),
+            *self.config.__dict__.items()
+        )
+        cached = self._pickled
+        if cached is not None and len(cached[0]) == len(key) and all(
+            name == cached_name and value is cached_value
+            for (name, value), (cached_name, cached_value) in zip(key, cached[0])
+        ):
+            return cached[1]
+        new_self = self._copy_pickle()
+        try:
+            pickled = Pickled(dumps(new_self)[0])
+        except Exception:
+            # Pickled with the task (fails there)
+            return new_self
+        self._pickled = (key, pickled)
+        return pickled
+
     @property
     def env(self):
         "Shorthand for parameter 'env'"
@@ -612,7 +826,44 @@ class Session(RedBase):
         return time.time()
 
     def _get_datetime_now(self):
+        clock = self._cycle_clock
+        if clock is not None:
+            # Same time for the whole scheduling cycle
+            return clock.now
         return self._format_timestamp(self.get_time())
 
     def _format_timestamp(self, dt:float):
         return datetime.datetime.fromtimestamp(dt, tz=self.config.timezone)
+
+def _iter_latest(repo, result):
+    "Iterate task names, actions and creation times of a query of a log repo"
+    from redbird.repos import MemoryRepo, SQLRepo
+    from rocketry.log.utils import get_field_value
+    if isinstance(repo, SQLRepo):
+        try:
+            yield from _query_sql_latest(repo, result)
+            return
+        except Exception:
+            # Not aggregatable, reading the rows
+            pass
+    # Memory repos store the records as is thus no
+    # need to convert them
+    records = result.query_data() if isinstance(repo, (MemoryRepo, SQLRepo)) else result.query()
+    for record in records:
+        yield (
+            get_field_value(record, "task_name"),
+            get_field_value(record, "action"),
+            get_field_value(record, "created"),
+        )
+
+def _query_sql_latest(repo, result):
+    "Query the latest creation times by task names and actions from an SQL repo"
+    from sqlalchemy import func
+    orm = repo.model_orm
+    rows = (
+        repo.session.query(orm.task_name, orm.action, func.max(orm.created))
+        .filter(result.query_)
+        .group_by(orm.task_name, orm.action)
+        .all()
+    )
+    return [tuple(row) for row in rows]
@@ -1,6 +1,9 @@
+import asyncio
+from functools import partial
 import sys
 import inspect
 import importlib
+import time
 from pathlib import Path
 from typing import Callable, List, Optional
 import warnings
@@ -68,6 +71,12 @@ class FuncTask(Task):
     sys_path : list of paths
         Paths that are appended to ``sys.path`` when the function
         is imported.
+    sync_in_executor : bool, optional
+        If True and the execution is 'async', a non-async
+        function is run in a thread executor so that it does
+        not block the scheduler. If False, it is run in the
+        event loop and the time it blocked the loop is logged.
+        By default True.
     **kwargs : dict
         See :py:class:`rocketry.core.Task`
 
@@ -133,6 +142,7 @@ class FuncTask(Task):
     path: Optional[Path] = Field(description="Path to the script that is executed")
     func_name: Optional[str] = Field(default="main", description="Name of the function in given path. Pass path as well")
     cache: bool = False
+    sync_in_executor: bool = True
 
     sys_paths: List[Path] = []
 
@@ -226,10 +236,43 @@ class FuncTask(Task):
         is_async = inspect.iscoroutinefunction(func)
         if is_async:
             output = await func(**params)
+        elif self.get_execution() == "async" and self._in_scheduler_loop():
+            output = await self._execute_sync_async(func, params)
         else:
             output = func(**params)
         return output
 
+    def _in_scheduler_loop(self) -> bool:
+        loop = self.session.scheduler._loop
+        return loop is not None and loop is asyncio.get_running_loop()
+
+    async def _execute_sync_async(self, func, params):
+        "Run a non-async function in the scheduler's event loop"
+        if self.sync_in_executor:
+            # Use the session's thread pool if it is set
+            pool = self.session.scheduler._get_thread_pool()
+            if pool is None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, partial(func, **params))
+            return await asyncio.wrap_future(pool.submit(partial(func, **params)).future)
+
+        start = time.perf_counter()
+        try:
+            return func(**params)
+        finally:
+            duration = time.perf_counter() - start
+            self._report_blocking(duration)
+
+    def _report_blocking(self, duration:float):
+        "Log how long the task blocked the event loop"
+        logger = self.session.scheduler.logger
+        msg = f"Task '{self.name}' blocked the event loop for {duration:.3f} seconds"
+        cycle_sleep = self.session.config.cycle_sleep
+        if cycle_sleep is not None and duration > cycle_sleep:
+            logger.warning(msg)
+        else:
+            logger.debug(msg)
+
     def get_func(self, cache=True):
         if self.func is None:
             # Add dir of self.path to sys.path so importing from that dir works
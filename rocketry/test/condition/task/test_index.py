@@ -0,0 +1,70 @@
+import pytest
+
+from rocketry.conditions import SchedulerCycles, TaskStarted, TaskSucceeded, DependSuccess
+from rocketry.core.log import ActionIndex
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+from .test_time import setup_task_state
+
+def test_index():
+    index = ActionIndex()
+    for created in (10.0, 30.0, 20.0, 20.0):
+        index.add("run", created)
+    index.add("success", 25.0)
+    assert list(index._times["run"]) == [10.0, 20.0, 20.0, 30.0]
+
+    assert index.count("run", 10.0, 20.0) == 3
+    assert index.count("run", 10.5, 19.5) == 0
+    assert index.count(["run", "success"], 20.0, 30.0) == 4
+    assert index.count("fail", 0.0, 100.0) == 0
+
+    assert index.latest("run") == 30.0
+    assert index.latest("run", before=25.0) == 20.0
+    assert index.latest("run", before=5.0) is None
+    assert index.latest(["run", "success"], before=29.0) == 25.0
+    assert index.latest("fail") is None
+
+    index.trim(25.0)
+    assert list(index._times["run"]) == [30.0]
+    # The latest is kept
+    assert list(index._times["success"]) == [25.0]
+    index.trim(100.0)
+    assert index.latest(["run", "success"]) == 30.0
+
+@pytest.mark.parametrize("get_cond", [
+    pytest.param(lambda: TaskStarted(task="the task", period=TimeDelta("1 day")) == 2, id="started"),
+    pytest.param(lambda: TaskSucceeded(task="the task", period=TimeDelta("1 day")) >= 3, id="succeeded"),
+    pytest.param(lambda: DependSuccess(depend_task="the task", task="other"), id="depend"),
+])
+def test_seeded(session, mock_datetime_now, get_cond):
+    logs = [
+        ("2021-01-01 10:00", "run"),
+        ("2021-01-01 10:01", "success"),
+        ("2021-01-01 11:00", "run"),
+        ("2021-01-01 11:01", "success"),
+    ]
+    task = setup_task_state(mock_datetime_now, logs, time_after="2021-01-01 12:00", session=session)
+    FuncTask(lambda: None, name="other", execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    assert not task._action_index.complete
+    assert task._get_action_index().count("run", 0, 2e9) == 2
+
+    cond = get_cond()
+    from_index = cond.observe(session=session)
+    session.config.force_status_from_logs = True
+    assert from_index == cond.observe(session=session)
+
+def test_fed(session):
+    task = FuncTask(lambda: None, name="the task", start_cond=TaskStarted() < 3, execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 5
+    session.start()
+
+    assert task._action_index.count("run", 0, 2e9) == 3
+    assert task._action_index.count("success", 0, 2e9) == 3
+
+    # Logs are not read
+    task.logger.get_records = None
+    assert (TaskStarted(task="the task") == 3).observe(session=session)
+    assert (TaskSucceeded(task="the task") >= 2).observe(session=session)
@@ -0,0 +1,85 @@
+import gc
+import weakref
+
+import pytest
+
+from rocketry.args import Session, Task
+from rocketry.conditions import TaskStarted
+from rocketry.conditions.api import daily, time_of_day, true, false
+from rocketry.core import BaseCondition, Parameters
+from rocketry.core.parameters.parameters import _COMPILED
+from rocketry.tasks import FuncTask
+
+class Tracked(BaseCondition):
+    observed = []
+
+    def __init__(self, name, state, cost=5):
+        self.name = name
+        self.state = state
+        self._cost = cost
+
+    def get_state(self, session=Session()):
+        Tracked.observed.append(self.name)
+        return self.state
+
+@pytest.mark.parametrize("get_cond", [
+    pytest.param(lambda: true, id="true"),
+    pytest.param(lambda: daily, id="daily"),
+    pytest.param(lambda: daily.after("07:00") & ~time_of_day.between("08:00", "09:00"), id="all"),
+    pytest.param(lambda: (TaskStarted() >= 1) | false | time_of_day.after("01:00"), id="any"),
+    pytest.param(lambda: ~(TaskStarted(task="other") == 0), id="not"),
+])
+def test_same_as_observe(get_cond, session):
+    task = FuncTask(lambda: None, name="the task", execution="main", session=session)
+    FuncTask(lambda: None, name="other", execution="main", session=session)
+    cond = get_cond()
+    assert cond._compile()(task=task) == cond.observe(task=task)
+
+def test_cost_order(session):
+    Tracked.observed = []
+    cond = Tracked("expensive", True, cost=10) & Tracked("unknown", True) & Tracked("cheap", False, cost=1)
+    assert not cond._compile()(session=session)
+    # Stopped at the cheapest
+    assert Tracked.observed == ["cheap"]
+
+    Tracked.observed = []
+    cond = Tracked("expensive", True, cost=10) | (Tracked("unknown 1", False) & Tracked("unknown 2", True)) | Tracked("cheap", False, cost=1)
+    assert cond._compile()(session=session)
+    assert Tracked.observed == ["cheap", "expensive"]
+    assert cond._get_cost() == 21
+
+def test_task_recompile(session):
+    task = FuncTask(lambda: None, name="the task", start_cond=false, execution="main", session=session)
+    assert not task.is_runnable()
+    task.start_cond = true
+    assert task.is_runnable()
+    task.start_cond = "false"
+    assert not task.is_runnable()
+
+def test_compile_signature(session):
+    task = FuncTask(lambda: None, name="the task", execution="main", session=session)
+
+    def func(x, task=Task(), other=Task("the task"), session=Session()):
+        ...
+    expected = Parameters._from_signature(func).materialize(task=task)
+    assert Parameters._compile_signature(func)({"task": task}) == expected == {"task": task, "other": task, "session": session}
+    # Compiled only once
+    assert Parameters._compile_signature(func) is Parameters._compile_signature(func)
+
+def test_compile_signature_not_kept():
+    def make_func():
+        data = [0] * 100
+        def func(task=Task("the task")):
+            return data
+        return func
+    func = make_func()
+    Parameters._compile_signature(func)
+    assert func in _COMPILED
+
+    ref = weakref.ref(func)
+    del func
+    gc.collect()
+    assert ref() is None
+
+    # Builtins are not weak referable
+    assert Parameters._compile_signature(print)({}) == {}
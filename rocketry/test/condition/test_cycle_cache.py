@@ -0,0 +1,125 @@
+from rocketry.args import Session, Task
+from rocketry.conditions import SchedulerCycles, TaskStarted
+from rocketry.conditions.api import daily
+from rocketry.core import BaseCondition
+from rocketry.core.condition.cache import CondStateCache
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeOfDay
+
+class CountedCond(BaseCondition):
+    n_checks = 0
+
+    def __init__(self, state):
+        self.state = state
+
+    def get_state(self, session=Session()):
+        CountedCond.n_checks += 1
+        return self.state
+
+class CountedTaskCond(BaseCondition):
+    n_checks = 0
+
+    def __init__(self, state, task=None):
+        self.state = state
+        self.task = task
+
+    def get_state(self, task=Task(default=None), session=Session()):
+        CountedTaskCond.n_checks += 1
+        return self.state
+
+def test_shared(session):
+    CountedCond.n_checks = 0
+    for i in range(5):
+        FuncTask(lambda: None, name=f"x {i}", start_cond=CountedCond(False), execution="main", session=session)
+        FuncTask(lambda: None, name=f"y {i}", start_cond=CountedCond(None) | CountedCond(0), execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 3
+    session.start()
+
+    # Three distinct conditions in three cycles
+    assert CountedCond.n_checks == 3 * 3
+    assert session._cond_cycle_cache is None
+
+    # Not cached outside of cycles
+    cond = CountedCond(False)
+    cond.observe(session=session)
+    cond.observe(session=session)
+    assert CountedCond.n_checks == 3 * 3 + 2
+
+def test_task_dependent(session):
+    CountedTaskCond.n_checks = 0
+    for i in range(5):
+        FuncTask(lambda: None, name=f"x {i}", start_cond=CountedTaskCond(False), execution="main", session=session)
+        FuncTask(lambda: None, name=f"y {i}", start_cond=CountedTaskCond(False, task="x 0"), execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    # The ones that depend on the task they are checked for
+    # are not shared
+    assert CountedTaskCond.n_checks == 5 + 1
+
+def test_cleared_on_status(session):
+    CountedCond.n_checks = 0
+    tasks = [
+        FuncTask(lambda: None, name=f"task {i}", start_cond=CountedCond(True) & (TaskStarted() == 0), execution="main", session=session)
+        for i in range(3)
+    ]
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    # Each run changed the state of a task so
+    # the condition was checked again
+    assert CountedCond.n_checks == 3
+    assert all(task.status == "success" for task in tasks)
+
+def test_key():
+    cache = CondStateCache()
+    kwargs = {"session": None}
+    cond = CountedCond(TimeOfDay("10:00", "12:00"))
+    assert cache.get_key(cond, kwargs) == cache.get_key(CountedCond(TimeOfDay("10:00", "12:00")), kwargs)
+    assert cache.get_key(cond, kwargs) != cache.get_key(CountedCond(TimeOfDay("10:00", "13:00")), kwargs)
+    assert cache.get_key(cond, kwargs) != cache.get_key(CountedTaskCond(TimeOfDay("10:00", "12:00"), task="x"), kwargs)
+
+    # Unknown arguments are not cached
+    assert cache.get_key(cond, {"session": None, "other": 1}) is None
+
+def test_clock(session):
+    times = []
+    class TimeCond(BaseCondition):
+        def __init__(self, i):
+            self.i = i
+        def get_state(self, session=Session()):
+            times.append(session._get_datetime_now())
+            return False
+
+    n_measures = 0
+    def get_time():
+        nonlocal n_measures
+        n_measures += 1
+        return 1_600_000_000.0 + n_measures
+
+    for i in range(5):
+        FuncTask(lambda: None, name=f"x {i}", start_cond=TimeCond(i) & (TaskStarted() == 0) & daily, execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.config.time_func = get_time
+    session.start()
+
+    # Same time in the cycle
+    assert len(times) == 5
+    assert len(set(times)) == 1
+    assert session._cycle_clock is None
+
+def test_clock_refreshed(session):
+    times = []
+    class TimeCond(BaseCondition):
+        def get_state(self, session=Session()):
+            times.append(session._get_datetime_now())
+            return True
+
+    for i in range(2):
+        FuncTask(lambda: None, name=f"x {i}", start_cond=TimeCond() & (TaskStarted() == 0), execution="main", session=session)
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+
+    # The first task ran thus the time was measured again
+    assert len(times) == 2
+    assert times[0] < times[1]
@@ -0,0 +1,96 @@
+import datetime
+import math
+
+import pytest
+
+from rocketry.conditions import (
+    IsPeriod, TaskExecutable, TaskRunnable, TaskStarted, DependSuccess
+)
+from rocketry.conditions.api import daily, every, false, true, cron, time_of_day
+from rocketry.pybox.time import to_datetime
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta, TimeOfDay
+from rocketry.testing.log import create_task_record
+
+def to_timestamp(s):
+    return to_datetime(s).timestamp()
+
+def do_nothing():
+    ...
+
+@pytest.mark.parametrize(
+    "get_condition,logs,now,expected",
+    [
+        pytest.param(lambda: true, [], "2020-01-01 07:30", -math.inf, id="true"),
+        pytest.param(lambda: false, [], "2020-01-01 07:30", math.inf, id="false"),
+        pytest.param(lambda: true & false, [], "2020-01-01 07:30", math.inf, id="true & false"),
+        pytest.param(lambda: true | false, [], "2020-01-01 07:30", -math.inf, id="true | false"),
+
+        pytest.param(lambda: time_of_day.between("08:00", "09:00"), [], "2020-01-01 07:30", "2020-01-01 08:00", id="time of day (before)"),
+        pytest.param(lambda: time_of_day.between("08:00", "09:00"), [], "2020-01-01 08:30", "2020-01-01 08:30", id="time of day (on)"),
+        pytest.param(lambda: time_of_day.between("08:00", "09:00"), [], "2020-01-01 09:30", "2020-01-02 08:00", id="time of day (after)"),
+
+        pytest.param(lambda: daily, [], "2020-01-01 07:30", -math.inf, id="daily (not run)"),
+        pytest.param(
+            lambda: daily,
+            [("2020-01-01 07:10", "run"), ("2020-01-01 07:20", "success")],
+            "2020-01-01 07:30", "2020-01-02 00:00",
+            id="daily (succeeded)"
+        ),
+        pytest.param(
+            lambda: daily.between("08:00", "09:00"),
+            [("2020-01-01 08:10", "run"), ("2020-01-01 08:20", "success")],
+            "2020-01-01 08:30", "2020-01-02 08:00",
+            id="daily between (succeeded)"
+        ),
+        pytest.param(
+            lambda: daily.between("08:00", "09:00") & time_of_day.after("08:45"),
+            [],
+            "2020-01-01 08:30", "2020-01-01 08:45",
+            id="daily between & time of day"
+        ),
+
+        pytest.param(lambda: every("10 minutes"), [], "2020-01-01 07:30", -math.inf, id="every (not run)"),
+        pytest.param(
+            lambda: every("10 minutes"),
+            [("2020-01-01 07:25", "run"), ("2020-01-01 07:26", "success")],
+            "2020-01-01 07:30", "2020-01-01 07:35",
+            id="every (started)"
+        ),
+        pytest.param(
+            lambda: every("10 minutes", based="finish"),
+            [("2020-01-01 07:25", "run"), ("2020-01-01 07:26", "success")],
+            "2020-01-01 07:30", "2020-01-01 07:36",
+            id="every finish (finished)"
+        ),
+
+        pytest.param(lambda: cron("0 8 * * *"), [], "2020-01-01 07:30", "2020-01-01 08:00", id="cron (before)"),
+        pytest.param(
+            lambda: cron("0 8 * * *"),
+            [("2020-01-01 08:00", "run"), ("2020-01-01 08:00:10", "success")],
+            "2020-01-01 08:00:30", "2020-01-02 08:00",
+            id="cron (ran)"
+        ),
+
+        pytest.param(lambda: DependSuccess(depend_task="other"), [], "2020-01-01 07:30", math.inf, id="depend (not succeeded)"),
+        pytest.param(lambda: TaskStarted() >= 3, [], "2020-01-01 07:30", None, id="unknown"),
+    ],
+)
+def test_next_time(get_condition, logs, now, expected, session):
+    session.config.time_func = lambda: to_timestamp(now)
+    task = FuncTask(do_nothing, name="the task", execution="main", session=session)
+    FuncTask(do_nothing, name="other", execution="main", session=session)
+    for created, action in logs:
+        task.logger.handle(create_task_record(created=to_timestamp(created), action=action, task_name="the task"))
+    task.set_cached()
+
+    cond = get_condition()
+    next_time = cond.get_next_time(task=task, session=session)
+    if isinstance(expected, str):
+        expected = to_timestamp(expected)
+    assert next_time == expected
+
+def test_next_time_force_from_logs(session):
+    session.config.force_status_from_logs = True
+    task = FuncTask(do_nothing, name="the task", execution="main", session=session)
+    assert daily.get_next_time(task=task, session=session) is None
@@ -1,11 +1,17 @@
 import logging
+import threading
+from typing import ClassVar
 
 import pytest
 import redbird
+from pydantic.v1 import ValidationError
 from redbird.logging import RepoHandler
-from redbird.repos import CSVFileRepo, SQLRepo
+from redbird.oper import between, greater_equal, in_, not_equal
+from redbird.repos import CSVFileRepo, MemoryRepo, SQLRepo
 from rocketry import Rocketry
-from rocketry.log import MinimalRecord, MinimalRunRecord, TaskLogRecord, TaskRunRecord
+from rocketry.conditions import SchedulerCycles, TaskStarted
+from rocketry.exc import TaskLoggingError
+from rocketry.log import MinimalRecord, MinimalRunRecord, TaskLogRecord, TaskRunRecord, SQLiteRepo, BufferedRepo, CompactRepo, CompactRecord
 
 def get_csv(model, tmpdir):
     file = tmpdir.join("logs.csv")
@@ -15,7 +21,13 @@ def get_sql(model, tmpdir):
     pytest.importorskip("sqlalchemy")
     return SQLRepo(conn_string="sqlite://", table="mylogs", if_missing="create", model=model, id_field="created")
 
-@pytest.mark.parametrize("get_repo", [get_csv, get_sql])
+def get_sqlite(model, tmpdir):
+    return SQLiteRepo(filename=str(tmpdir.join("logs.db")), model=model)
+
+def get_compact(model, tmpdir):
+    return CompactRepo(model=model)
+
+@pytest.mark.parametrize("get_repo", [get_csv, get_sql, get_sqlite, get_compact])
 @pytest.mark.parametrize("model", [MinimalRecord, MinimalRunRecord, TaskLogRecord, TaskRunRecord])
 def test_cache(session, tmpdir, model, get_repo):
     if get_repo == get_sql and model in (TaskRunRecord, TaskLogRecord) and redbird.version_tuple[:3] <= (0, 6, 0):
@@ -39,4 +51,181 @@ def test_cache(session, tmpdir, model, get_repo):
     assert logs == [
         {"action": "run", "task_name": "task 1"},
         {"action": "success", "task_name": "task 1"}
-    ]
\ No newline at end of file
+    ]
+QUERIES = [
+    pytest.param({}, id="all"),
+    pytest.param({"task_name": "task 1"}, id="equal"),
+    pytest.param({"task_name": "task 1", "action": in_(["success", "fail"])}, id="in"),
+    pytest.param({"action": in_([])}, id="in empty"),
+    pytest.param({"created": between(2, 5)}, id="between"),
+    pytest.param({"created": greater_equal(7), "action": not_equal("run")}, id="compare"),
+]
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_sqlite_query(query):
+    records = [
+        MinimalRecord(task_name=f"task {i % 3}", action=("run", "success", "fail")[i % 3 - 1], created=i)
+        for i in range(10)
+    ]
+    repo = SQLiteRepo(model=MinimalRecord, batch_size=3)
+    mem_repo = MemoryRepo(model=MinimalRecord)
+    for record in records:
+        repo.add(record)
+        mem_repo.add(record)
+
+    assert repo.filter_by(**query).all() == mem_repo.filter_by(**query).all()
+    assert repo.filter_by(**query).count() == mem_repo.filter_by(**query).count()
+    assert repo.filter_by(**query).first() == mem_repo.filter_by(**query).first()
+    assert repo.filter_by(**query).last() == mem_repo.filter_by(**query).last()
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_compact_query(query):
+    repo = CompactRepo(model=MinimalRecord)
+    mem_repo = MemoryRepo(model=MinimalRecord)
+    for i in range(10):
+        record = {"task_name": f"task {i % 3}", "action": ("run", "success", "fail")[i % 3 - 1], "created": i, "msg": "not stored"}
+        repo.add(record)
+        mem_repo.add(record)
+
+    assert repo.filter_by(**query).all() == mem_repo.filter_by(**query).all()
+    assert repo.filter_by(**query).count() == mem_repo.filter_by(**query).count()
+    assert repo.filter_by(**query).first() == mem_repo.filter_by(**query).first()
+    assert repo.filter_by(**query).last() == mem_repo.filter_by(**query).last()
+    assert repo.filter_by(**query).limit(2) == mem_repo.filter_by(**query).limit(2)
+
+def test_compact():
+    repo = CompactRepo(model=TaskRunRecord)
+    repo.add({"task_name": "task 1", "action": "run", "created": 1, "start": 1, "message": "started", "msg": "not stored"})
+    repo.add(TaskRunRecord(task_name="task 1", action="success", created=2, message="succeeded"))
+    record = repo.collection[0]
+    assert isinstance(record, CompactRecord)
+    # Not validated when stored
+    assert record.to_dict() == {"task_name": "task 1", "action": "run", "created": 1.0, "start": 1, "message": "started"}
+    # but when read
+    assert repo.filter_by(action="run").first() == TaskRunRecord(task_name="task 1", action="run", created=1, start=1, message="started")
+
+    repo.filter_by(action="success").update(action="fail", run_id="1")
+    assert repo.filter_by(action="fail").first().run_id == "1"
+    repo.filter_by(action="run").delete()
+    assert repo.filter_by().count() == 1
+
+    with pytest.raises(ValidationError):
+        repo.add({"task_name": "task 1", "action": "run"})
+
+def test_sqlite_persist(tmpdir, session):
+    file = str(tmpdir.join("logs.db"))
+    repo = SQLiteRepo(filename=file, model=MinimalRecord, batch_size=10, flush_interval=60)
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=1))
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=2))
+
+    # Batched
+    assert SQLiteRepo(filename=file, model=MinimalRecord).filter_by().count() == 0
+    # Reads see the batch
+    assert repo.filter_by(task_name="task 1").count() == 2
+    assert SQLiteRepo(filename=file, model=MinimalRecord).filter_by().count() == 2
+
+    repo.filter_by(action="success").update(action="fail")
+    repo.close()
+    repo = SQLiteRepo(filename=file, model=MinimalRecord)
+    assert repo.filter_by().all() == [
+        MinimalRecord(task_name="task 1", action="run", created=1),
+        MinimalRecord(task_name="task 1", action="fail", created=2),
+    ]
+    repo.filter_by(action="run").delete()
+    assert repo.filter_by().count() == 1
+
+    with pytest.raises(KeyError):
+        repo.filter_by(not_a_field=1).all()
+
+def test_sqlite_app(tmpdir):
+    file = str(tmpdir.join("logs.db"))
+    with tmpdir.as_cwd():
+        app = Rocketry(logger_repo=SQLiteRepo(filename=file, model=MinimalRecord), config={"execution": "main", "force_status_from_logs": True})
+
+        @app.task(TaskStarted() < 2)
+        def do_things():
+            ...
+        app.session.config.shut_cond = SchedulerCycles() >= 4
+        app.run()
+
+    task = app.session["do_things"]
+    assert task.logger.filter_by(action="run").count() == 2
+    assert task.logger.filter_by(action="success").count() == 2
+
+class BlockedRepo(MemoryRepo):
+    "Repo that waits writing until released"
+    released: ClassVar[threading.Event]
+    fail_task: ClassVar[str] = None
+
+    def insert(self, item):
+        self.released.wait(timeout=5)
+        if item.task_name == self.fail_task:
+            raise RuntimeError("Oops")
+        super().insert(item)
+
+@pytest.fixture
+def blocked_repo():
+    BlockedRepo.released = threading.Event()
+    BlockedRepo.fail_task = None
+    yield BlockedRepo(model=MinimalRecord, collection=[])
+    BlockedRepo.released.set()
+
+def get_buffered(model, tmpdir):
+    return BufferedRepo(repo=MemoryRepo(model=model, collection=[]), batch_size=1)
+
+@pytest.mark.parametrize("get_repo", [get_buffered])
+@pytest.mark.parametrize("model", [MinimalRecord, TaskRunRecord])
+def test_cache_buffered(session, tmpdir, model, get_repo):
+    test_cache(session, tmpdir, model, get_repo)
+
+def test_buffered_read(blocked_repo):
+    repo = BufferedRepo(repo=blocked_repo, batch_size=2)
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=1))
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=2))
+    repo.add(MinimalRecord(task_name="task 2", action="run", created=3))
+
+    # Queued records are read
+    assert blocked_repo.collection == []
+    assert repo.filter_by(task_name="task 1").count() == 2
+    assert repo.filter_by(task_name="task 1").last() == MinimalRecord(task_name="task 1", action="success", created=2)
+    assert repo.filter_by(action="run").first() == MinimalRecord(task_name="task 1", action="run", created=1)
+    assert [rec.created for rec in repo.filter_by(created=between(2, 3)).all()] == [2, 3]
+
+    blocked_repo.released.set()
+    repo.flush()
+    assert [rec.created for rec in blocked_repo.collection] == [1, 2, 3]
+    # Read once
+    assert [rec.created for rec in repo.filter_by().all()] == [1, 2, 3]
+    assert repo.filter_by(action="run").count() == 2
+
+def test_buffered_backpressure(blocked_repo):
+    repo = BufferedRepo(repo=blocked_repo, batch_size=1, max_size=2)
+    repo.add(MinimalRecord(task_name="task 1", action="run", created=1))
+    repo.add(MinimalRecord(task_name="task 1", action="success", created=2))
+
+    thread = threading.Thread(target=repo.add, args=(MinimalRecord(task_name="task 1", action="run", created=3),))
+    thread.start()
+    thread.join(timeout=0.2)
+    # Waits as the queue is full
+    assert thread.is_alive()
+
+    blocked_repo.released.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    repo.flush()
+    assert [rec.created for rec in blocked_repo.collection] == [1, 2, 3]
+
+def test_buffered_fail(session, blocked_repo):
+    BlockedRepo.fail_task = "task 1"
+    blocked_repo.released.set()
+    repo = BufferedRepo(repo=blocked_repo, batch_size=1)
+    logging.getLogger(session.config.task_logger_basename).handlers = [RepoHandler(repo=repo)]
+
+    task = session.create_task(func=lambda: None, name="task 1", execution="main")
+    task.log_running()
+    repo.flush()
+
+    # The failure of the previous write is raised
+    with pytest.raises(TaskLoggingError):
+        task.log_success()
+    assert task.status == "fail"
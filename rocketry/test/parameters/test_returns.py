@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+
+import pytest
+
+from rocketry.args import Return
+from rocketry.conditions import TaskStarted
+from rocketry.core.parameters import ReturnStore
+from rocketry.tasks import FuncTask
+
+def test_unbounded(session):
+    returns = ReturnStore(session=session)
+    returns["a"] = bytearray(1_000)
+    returns["b"] = "x"
+    assert dict(returns) == {"a": bytearray(1_000), "b": "x"}
+    assert returns.evict() == 0
+    with pytest.raises(KeyError):
+        returns["c"]
+    assert returns.stats == {"hits": 2, "misses": 1, "reloads": 0, "spills": 0, "evictions": 0, "size": 0, "spilled": 0}
+
+def test_max_size(session):
+    session.config.returns_max_size = 2_500
+    returns = ReturnStore(session=session)
+    returns["a"] = bytearray(1_000)
+    returns["b"] = bytearray(1_000)
+    returns["a"] # Now "b" is the least recently used
+    returns["c"] = bytearray(1_000)
+
+    assert set(returns) == {"a", "c"}
+    assert returns.stats["evictions"] == 1
+    assert returns.stats["size"] <= 2_500
+    with pytest.raises(KeyError):
+        returns["b"]
+
+    # Too large alone
+    returns["d"] = bytearray(3_000)
+    assert "d" not in returns.keys()
+
+def test_max_age(session):
+    session.config.returns_max_age = 60
+    returns = ReturnStore(session=session)
+    returns["a"] = "x"
+    returns["b"] = "y"
+    assert returns.evict() == 0
+    assert returns.evict(now=returns._used["b"] + 61) == 2
+    assert len(returns) == 0
+
+def test_spill(session, tmpdir):
+    session.config.returns_max_size = 2_500
+    session.config.returns_spill = str(tmpdir)
+    returns = ReturnStore(session=session)
+    returns["a"] = {"data": bytearray(b"a" * 1_000), "other": [1, 2]}
+    returns["b"] = bytearray(b"b" * 1_000)
+    returns["c"] = bytearray(b"c" * 1_000)
+
+    # "a" is spilled
+    assert len(os.listdir(tmpdir)) == 1
+    assert len(returns) == 3
+    assert returns.stats["spilled"] == 1
+    assert returns.to_dict()["b"] == bytearray(b"b" * 1_000)
+
+    # "a" is loaded and "b" is spilled
+    assert returns["a"] == {"data": bytearray(b"a" * 1_000), "other": [1, 2]}
+    assert returns["b"] == bytearray(b"b" * 1_000)
+    assert returns.stats == {"hits": 0, "misses": 0, "reloads": 2, "spills": 3, "evictions": 3, "size": returns._size, "spilled": 1}
+    assert len(os.listdir(tmpdir)) == 1
+
+    # Not pickleable, removed
+    returns["d"] = lambda: None
+    returns["e"] = bytearray(3_000)
+    assert "d" not in returns.keys()
+
+    # Replacing removes the file
+    for key in list(returns.keys()):
+        returns[key] = None
+    assert os.listdir(tmpdir) == []
+
+def func_return(value=None):
+    return value or "x" * 1_000
+
+def func_with_arg(myparam):
+    assert myparam == "x" * 1_000
+
+@pytest.mark.parametrize("execution", ["main", "process"])
+def test_spilled_return(session, execution, tmpdir):
+    session.config.returns_max_size = 100
+    session.config.returns_spill = str(tmpdir)
+
+    task_return = FuncTask(func_return, name="return task", start_cond="~has started", execution="main", session=session)
+    task = FuncTask(
+        func_with_arg,
+        name="a task",
+        start_cond="after task 'return task'",
+        parameters={"myparam": Return('return task')},
+        execution=execution,
+        session=session
+    )
+    session.config.shut_cond = TaskStarted(task="a task") >= 1
+    session.start()
+
+    assert "success" == task_return.status
+    assert "success" == task.status
+    assert session.returns.stats["reloads"] >= 1
+
+def test_threads(session):
+    session.config.returns_max_size = 5_000
+    returns = ReturnStore(session=session)
+    errors = []
+    stop = threading.Event()
+
+    def write(i):
+        try:
+            n = 0
+            while not stop.is_set():
+                returns[(i, n % 20)] = bytearray(100 + n % 50)
+                returns.get((i, (n - 1) % 20))
+                n += 1
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        end = time.monotonic() + 1
+        while time.monotonic() < end:
+            returns.evict()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    assert returns.stats["size"] == sum(returns._sizes.values())
+    assert returns.stats["size"] <= 5_000
+    assert set(returns._used) == set(returns.keys())
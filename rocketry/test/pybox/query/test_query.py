@@ -1,5 +1,6 @@
 
 import datetime
+import sqlite3
 import pytest
 from rocketry.pybox import query
 
@@ -29,3 +30,45 @@ from rocketry.pybox import query
 )
 def test_filter(qry, data, expected):
     assert list(qry.filter(data)) == expected
+
+DATA = [
+    {'name': name, 'value': value, 'mydate': datetime.datetime(2021, 1, 1) + datetime.timedelta(days=value)}
+    for value, name in enumerate(['a', 'b', 'a', 'c', 'b', 'a', 'c', 'a'])
+]
+
+QUERIES = [
+    pytest.param(query.Key('name') == 'a', id="equal"),
+    pytest.param(query.Key('value') >= 3, id="greater equal"),
+    pytest.param(3 < query.Key('value'), id="reversed"),
+    pytest.param((query.Key('value') > 1) & (query.Key('value') <= 5) & (query.Key('name') != 'b'), id="range"),
+    pytest.param((query.Key('value') < 2) | (query.Key('name') == 'c'), id="any"),
+    pytest.param(~(query.Key('value') == 4), id="not"),
+    pytest.param(query.Key('mydate') >= '2021-01-05', id="string to datetime"),
+    pytest.param(query.Key('value') == 10, id="none"),
+    pytest.param(query.parser.from_dict({'value$min': 2, 'value$max': 6, 'name$regex': '[ab]'}), id="regex"),
+    pytest.param(query.parser.from_dict({}), id="true"),
+]
+
+@pytest.mark.parametrize('qry', QUERIES)
+def test_compiled(qry):
+    expected = [item for item in DATA if qry.match(item)]
+    func = qry.compile()
+    assert [item for item in DATA if func(item)] == expected
+    assert list(qry.filter(DATA)) == expected
+    assert list(qry.filter(DATA, sorted_by='value')) == expected
+    assert list(qry.filter(DATA, sorted_by='mydate')) == expected
+
+@pytest.mark.parametrize('qry', [qry for qry in QUERIES if qry.id not in ("regex", "string to datetime")])
+def test_to_sql(qry):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (name TEXT, value INTEGER)")
+    conn.executemany("INSERT INTO items VALUES (?, ?)", [(item['name'], item['value']) for item in DATA])
+    where, params = qry.to_sql()
+    rows = conn.execute(f"SELECT name, value FROM items WHERE {where} ORDER BY value", params).fetchall()
+    assert rows == [(item['name'], item['value']) for item in DATA if qry.match(item)]
+
+def test_to_sql_string():
+    qry = (query.Key('value') > 1) & ~((query.Key('name') == 'a') | (query.Key('name') == 'b'))
+    assert qry.to_sql() == ('("value" > ?) AND (NOT (("name" = ?) OR ("name" = ?)))', [1, 'a', 'b'])
+    with pytest.raises(TypeError):
+        query.parser.from_dict({'name$regex': 'a'}).to_sql()
@@ -1,3 +1,4 @@
+import pickle
 from datetime import datetime
 import pytest
 from rocketry.pybox.time import Interval, to_datetime
@@ -75,3 +76,14 @@ def test_empty():
 def test_repr():
     for closed in ("left", "right", "neither"):
         assert repr(Interval(datetime(2022, 1, 1), datetime(2022, 1, 1), closed=closed))
+
+def test_immutable():
+    interval = Interval(to_datetime("2022-07-01"), to_datetime("2022-07-12"), closed="both")
+    with pytest.raises(AttributeError):
+        interval.left = to_datetime("2022-07-02")
+    assert not hasattr(interval, "__dict__")
+
+    copied = pickle.loads(pickle.dumps(interval))
+    assert copied == interval
+    assert hash(copied) == hash(interval)
+    assert copied != Interval(to_datetime("2022-07-01"), to_datetime("2022-07-12"), closed="left")
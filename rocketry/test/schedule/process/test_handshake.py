@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from rocketry.tasks import FuncTask
+
+def run_succeeding():
+    pass
+
+class SlowStartTask(FuncTask):
+    "Task that takes time to start in the process"
+
+    def _run_as_process(self, *args, **kwargs):
+        time.sleep(0.05)
+        return super()._run_as_process(*args, **kwargs)
+
+@pytest.mark.asyncio
+async def test_start_not_blocking(session):
+    task = SlowStartTask(run_succeeding, name="process task", execution="process", session=session)
+
+    ticks = 0
+    starting = True
+    async def tick():
+        nonlocal ticks
+        while starting:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    ticks = 0
+    await task.start_async(log_queue=session.scheduler._log_queue)
+    n_ticks = ticks
+    starting = False
+    await ticker
+
+    # The event loop was free while waiting the process to start
+    assert n_ticks > 0
+    assert task.status == "run"
+    assert task.launch_latency > 0
+
+    await session.scheduler.wait_task_alive()
+    session.scheduler.handle_logs()
+    assert task.status == "success"
@@ -0,0 +1,78 @@
+import os
+import time
+
+from rocketry.conditions import SchedulerStarted, TaskStarted, AlwaysTrue
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+def run_write_pid():
+    with open("pids.txt", "a", encoding="utf-8") as file:
+        file.write(f"{os.getpid()}\n")
+
+def run_failing():
+    raise RuntimeError("Task failed")
+
+def run_slow():
+    time.sleep(5)
+
+def read_pids():
+    with open("pids.txt", encoding="utf-8") as file:
+        return [int(pid) for pid in file.read().split()]
+
+def test_reuse(tmpdir, session):
+    with tmpdir.as_cwd():
+        session.config.process_pool = True
+        task = FuncTask(run_write_pid, name="pid", start_cond=AlwaysTrue(), execution="process", session=session)
+
+        session.config.shut_cond = (TaskStarted(task="pid") >= 3) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
+        session.start()
+
+        logger = task.logger
+        assert logger.filter_by(action="run").count() == 3
+        assert logger.filter_by(action="success").count() == 3
+
+        pids = read_pids()
+        assert len(pids) == 3
+        assert len(set(pids)) == 1
+        assert pids[0] != os.getpid()
+
+        # The pool is closed on shutdown
+        assert session.scheduler._process_pool is None
+
+def test_recycle(tmpdir, session):
+    with tmpdir.as_cwd():
+        session.config.process_pool = True
+        session.config.process_pool_max_runs = 1
+        FuncTask(run_write_pid, name="pid", start_cond=AlwaysTrue(), execution="process", session=session)
+
+        session.config.shut_cond = (TaskStarted(task="pid") >= 3) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
+        session.start()
+
+        pids = read_pids()
+        assert len(pids) == 3
+        assert len(set(pids)) == 3
+
+def test_fail(session):
+    session.config.process_pool = True
+    task = FuncTask(run_failing, name="fail", start_cond=AlwaysTrue(), execution="process", session=session)
+
+    session.config.shut_cond = (TaskStarted(task="fail") >= 2) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
+    session.start()
+
+    logger = task.logger
+    assert logger.filter_by(action="run").count() >= 2
+    assert logger.filter_by(action="fail").count() >= 2
+    assert logger.filter_by(action="success").count() == 0
+
+def test_terminate(session):
+    session.config.process_pool = True
+    session.config.timeout = 0.1
+    task = FuncTask(run_slow, name="slow", start_cond=AlwaysTrue(), execution="process", session=session)
+
+    session.config.shut_cond = (TaskStarted(task="slow") >= 2) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
+    session.start()
+
+    logger = task.logger
+    assert logger.filter_by(action="run").count() == 2
+    assert logger.filter_by(action="terminate").count() == 2
+    assert logger.filter_by(action="success").count() == 0
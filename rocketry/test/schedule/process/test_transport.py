@@ -0,0 +1,69 @@
+import logging
+import multiprocessing
+from queue import Empty
+
+import pytest
+
+from rocketry.conditions import SchedulerStarted, TaskStarted, TaskFinished
+from rocketry.log.transport import LogReader
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+def write_records(writer):
+    logger = logging.getLogger("rocketry.test.transport")
+    writer.put_nowait(logger.makeRecord(logger.name, logging.INFO, "", 0, "buffered 1", (), None))
+    writer.put_nowait(logger.makeRecord(logger.name, logging.INFO, "", 0, "buffered 2", (), None))
+    writer.put_nowait(logger.makeRecord(logger.name, logging.INFO, "", 0, "status", (), None, extra={"action": "run"}))
+    writer.put_nowait(logger.makeRecord(logger.name, logging.INFO, "", 0, "at exit", (), None))
+    writer.flush()
+
+def run_succeeding():
+    pass
+
+def test_reader():
+    reader = LogReader()
+    writer = reader.open_pipe()
+    process = multiprocessing.Process(target=write_records, args=(writer,))
+    process.start()
+    writer.close()
+    process.join()
+
+    records = [reader.get(timeout=5) for _ in range(4)]
+    assert [rec.msg for rec in records] == ["buffered 1", "buffered 2", "status", "at exit"]
+    assert records[2].action == "run"
+    assert records[0].name == "rocketry.test.transport"
+
+    with pytest.raises(Empty):
+        reader.get(block=False)
+    # The pipe is closed as the process exited
+    assert reader.n_pipes == 0
+
+def test_batched():
+    reader = LogReader()
+    writer = reader.open_pipe()
+    logger = logging.getLogger("rocketry.test.transport")
+    writer.put(logger.makeRecord(logger.name, logging.INFO, "", 0, "buffered", (), None))
+    with pytest.raises(Empty):
+        reader.get(block=False)
+
+    writer.put(logger.makeRecord(logger.name, logging.INFO, "", 0, "status", (), None, extra={"action": "run"}))
+    assert reader.get(block=False).msg == "buffered"
+    # Both came in the same batch
+    assert reader.get_received().msg == "status"
+    writer.close()
+
+def test_scheduler(session):
+    tasks = [
+        FuncTask(run_succeeding, name=f"task {i}", start_cond=TaskStarted() < 2, execution="process", session=session)
+        for i in range(3)
+    ]
+    session.config.shut_cond = (
+        (TaskFinished(task="task 0") >= 2) & (TaskFinished(task="task 1") >= 2) & (TaskFinished(task="task 2") >= 2)
+    ) | ~SchedulerStarted(period=TimeDelta("10 seconds"))
+    session.start()
+
+    for task in tasks:
+        assert task.logger.filter_by(action="run").count() == 2
+        assert task.logger.filter_by(action="success").count() == 2
+    # Pipes of the finished processes are closed
+    assert session.scheduler._log_queue.n_pipes == 0
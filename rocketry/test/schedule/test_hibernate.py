@@ -0,0 +1,48 @@
+import threading
+import time
+
+from rocketry.conds import false
+from rocketry.tasks import FuncTask
+
+def do_nothing():
+    ...
+
+def test_sleep_till_shutdown(session):
+    session.config.cycle_sleep = 0.01
+    task = FuncTask(do_nothing, start_cond=false, name="never", execution="async", session=session)
+
+    timer = threading.Timer(0.5, session.shut_down)
+    start = time.time()
+    timer.start()
+    session.start()
+    runtime = time.time() - start
+
+    # Nothing could have happened, the scheduler
+    # should not have run cycles for nothing
+    assert session.scheduler.n_cycles <= 1
+    assert 0.5 <= runtime < 5
+    assert task.status is None
+
+def test_wake_up_on_run(session):
+    session.config.cycle_sleep = 0.01
+    task = FuncTask(do_nothing, start_cond=false, name="manual", execution="async", session=session)
+
+    threading.Timer(0.3, task.run).start()
+    threading.Timer(1.0, session.shut_down).start()
+    session.start()
+
+    assert task.status == "success"
+    assert session.scheduler.n_cycles < 20
+
+def test_next_time_unknown(session):
+    session.config.cycle_sleep = 0.01
+    FuncTask(do_nothing, start_cond=false, name="never", execution="async", session=session)
+    session.config.time_func = time.time
+
+    assert session.scheduler._get_next_time() is None
+
+def test_next_time_batches(session):
+    task = FuncTask(do_nothing, start_cond=false, name="never", execution="async", session=session)
+    assert session.scheduler._get_next_time() == float("inf")
+    task.run()
+    assert session.scheduler._get_next_time() == -float("inf")
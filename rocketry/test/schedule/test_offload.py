@@ -0,0 +1,58 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from rocketry.conditions import SchedulerStarted, TaskStarted, AlwaysTrue
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+@pytest.mark.parametrize("sync_in_executor", [True, False])
+def test_sync_in_async(sync_in_executor, session, caplog):
+    threads = []
+    def run_slow():
+        threads.append(threading.current_thread())
+        time.sleep(0.5)
+
+    async def run_fast():
+        ...
+
+    slow_task = FuncTask(
+        run_slow, name="slow",
+        start_cond=TaskStarted() == 0,
+        execution="async", sync_in_executor=sync_in_executor,
+        session=session
+    )
+    fast_task = FuncTask(run_fast, name="fast", start_cond=AlwaysTrue(), execution="async", session=session)
+
+    session.config.shut_cond = (TaskStarted(task="slow") >= 1) & ~SchedulerStarted(period=TimeDelta("0.4 seconds"))
+    with caplog.at_level(logging.DEBUG, logger="rocketry.scheduler"):
+        session.start()
+
+    assert slow_task.logger.filter_by(action="success").count() == 1
+    n_fast = fast_task.logger.filter_by(action="success").count()
+    blocked = [rec for rec in caplog.records if "blocked the event loop" in rec.getMessage()]
+    if sync_in_executor:
+        # Other tasks could run while the slow one was running
+        assert threads[0] is not threading.main_thread()
+        assert n_fast > 2
+        assert not blocked
+    else:
+        assert threads[0] is threading.main_thread()
+        assert len(blocked) == 1
+        assert blocked[0].levelname == "WARNING"
+
+def test_sync_in_async_pool(session):
+    session.config.thread_pool_size = 1
+    threads = []
+    def run_sync():
+        threads.append(threading.current_thread())
+
+    task = FuncTask(run_sync, name="sync", start_cond=AlwaysTrue(), execution="async", session=session)
+    session.config.shut_cond = TaskStarted(task="sync") >= 3
+    session.start()
+
+    assert task.logger.filter_by(action="success").count() == 3
+    assert len(set(threads)) == 1
+    assert threads[0].name.startswith("rocketry")
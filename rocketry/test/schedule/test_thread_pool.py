@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+from rocketry.args import TerminationFlag
+from rocketry.conditions import SchedulerCycles, SchedulerStarted, TaskStarted, TaskFinished, AlwaysTrue
+from rocketry.core.pool import ThreadPool
+from rocketry.exc import TaskTerminationException
+from rocketry.tasks import FuncTask
+from rocketry.time import TimeDelta
+
+def run_slow(flag=TerminationFlag()):
+    time.sleep(0.2)
+    if flag.is_set():
+        raise TaskTerminationException
+
+def run_until_terminated(flag=TerminationFlag()):
+    while not flag.is_set():
+        time.sleep(0.001)
+    raise TaskTerminationException
+
+def test_pool_counters():
+    pool = ThreadPool(2)
+    event = threading.Event()
+    runs = [pool.submit(event.wait) for _ in range(5)]
+    time.sleep(0.05)
+    assert pool.n_active == 2
+    assert pool.n_queued == 3
+    assert all(run.is_alive() for run in runs)
+
+    event.set()
+    for run in runs:
+        run.join(timeout=1)
+    assert pool.n_active == 0
+    assert pool.n_queued == 0
+    assert not any(run.is_alive() for run in runs)
+    pool.close()
+
+@pytest.mark.parametrize("how", ["session", "task"])
+def test_bounded(how, session):
+    if how == "session":
+        session.config.thread_pool_size = 2
+    session.config.multilaunch = True
+    session.config.instant_shutdown = False
+    threads = []
+
+    def run_slow_collect():
+        threads.append(threading.current_thread())
+        time.sleep(0.1)
+
+    task = FuncTask(
+        run_slow_collect, name="slow task",
+        start_cond=TaskStarted() <= 5,
+        execution="thread",
+        thread_pool_size=2 if how == "task" else None,
+        session=session
+    )
+    session.config.shut_cond = (TaskStarted(task="slow task") >= 6) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+
+    logger = task.logger
+    assert logger.filter_by(action="run").count() == 6
+    assert logger.filter_by(action="success").count() == 6
+    # No more than two threads were used
+    assert len(set(threads)) <= 2
+    assert all(thread is not threading.main_thread() for thread in threads)
+
+def test_terminate(session):
+    session.config.thread_pool_size = 1
+    session.config.timeout = 0.1
+    task = FuncTask(
+        run_until_terminated, name="slow task",
+        start_cond=AlwaysTrue(),
+        execution="thread",
+        session=session
+    )
+    session.config.shut_cond = (TaskFinished(task="slow task") >= 2) | ~SchedulerStarted(period=TimeDelta("5 seconds"))
+    session.start()
+
+    logger = task.logger
+    assert logger.filter_by(action="run").count() >= 2
+    assert logger.filter_by(action="terminate").count() >= 2
+    assert logger.filter_by(action="success").count() == 0
+
+def test_terminate_queued(session):
+    session.config.thread_pool_size = 1
+    session.config.multilaunch = True
+    task = FuncTask(
+        run_slow, name="slow task",
+        start_cond=TaskStarted() <= 1,
+        execution="thread",
+        session=session
+    )
+    session.config.shut_cond = SchedulerCycles() >= 3
+    session.config.instant_shutdown = True
+    session.start()
+
+    logger = task.logger
+    assert logger.filter_by(action="run").count() == 2
+    assert logger.filter_by(action="terminate").count() == 2
@@ -1,3 +1,7 @@
+import gc
+import os
+import pickle
+import time
 from pathlib import Path
 import platform
 from textwrap import dedent
@@ -6,7 +10,7 @@ import pytest
 from rocketry.core import Parameters
 from rocketry.tasks import FuncTask
 from rocketry.conditions import TaskStarted, AlwaysTrue
-from rocketry.args import FuncArg, Arg
+from rocketry.args import FuncArg, Arg, Task
 
 
 def get_x():
@@ -184,3 +188,125 @@ def test_unpicklable(session, execution):
     assert task.status is None
     session.start()
     assert "success" == task.status
+
+CALLS = []
+
+def get_counted():
+    CALLS.append(os.getpid())
+    return "x"
+
+@pytest.mark.parametrize("cache,expected", [
+    pytest.param(None, 3, id="no cache"),
+    pytest.param("session", 1, id="session"),
+    pytest.param("shared", 1, id="shared"),
+    pytest.param("1 hour", 1, id="TTL"),
+    pytest.param(0, 3, id="TTL expired"),
+])
+def test_cache(session, cache, expected):
+    CALLS.clear()
+    arg = FuncArg(get_counted, cache=cache)
+    for _ in range(3):
+        assert arg.get_value(session=session) == "x"
+    assert len(CALLS) == expected
+
+    arg.invalidate()
+    assert arg.get_value(session=session) == "x"
+    assert len(CALLS) == expected + 1
+
+def test_cache_cycle(session):
+    CALLS.clear()
+    arg = FuncArg(get_counted, cache="cycle")
+    session.scheduler.n_cycles = 1
+    arg.get_value(session=session)
+    arg.get_value(session=session)
+    assert len(CALLS) == 1
+    session.scheduler.n_cycles = 2
+    arg.get_value(session=session)
+    assert len(CALLS) == 2
+
+def get_task_name(task=Task()):
+    CALLS.append(task.name)
+    return task.name
+
+def get_nested_task_name(name=FuncArg(get_task_name)):
+    return name
+
+@pytest.mark.parametrize("func", [get_task_name, get_nested_task_name])
+def test_cache_per_task(session, func):
+    CALLS.clear()
+    task_1 = FuncTask(lambda: None, name="task 1", execution="main", session=session)
+    task_2 = FuncTask(lambda: None, name="task 2", execution="main", session=session)
+    arg = FuncArg(func, cache="session")
+    for _ in range(2):
+        assert arg.get_value(task=task_1, session=session) == "task 1"
+        assert arg.get_value(task=task_2, session=session) == "task 2"
+    assert CALLS == ["task 1", "task 2"]
+
+    # Not task specific, shared by the tasks
+    arg = FuncArg(get_counted, cache="session")
+    assert arg.get_value(task=task_1, session=session) == arg.get_value(task=task_2, session=session)
+    assert CALLS == ["task 1", "task 2", os.getpid()]
+
+    with pytest.raises(ValueError):
+        FuncArg(func, cache="shared")
+
+def get_large():
+    CALLS.append(os.getpid())
+    return bytearray(b"x" * 2_000_000)
+
+def func_large_arg(myparam):
+    assert myparam == bytearray(b"x" * 2_000_000)
+
+@pytest.mark.parametrize("spool", [True, False])
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_shared(session, execution, spool, tmpdir):
+    CALLS.clear()
+    if spool:
+        session.config.return_spool = str(tmpdir)
+    session.parameters["myparam"] = FuncArg(get_large, cache="shared")
+    task = FuncTask(
+        func_large_arg,
+        execution=execution,
+        name="a task",
+        start_cond=AlwaysTrue(),
+        session=session
+    )
+    session.config.shut_cond = (TaskStarted(task="a task") >= 3)
+    session.start()
+
+    assert "success" == task.status
+    assert task.logger.filter_by(action="success").count() >= 3
+    # Materialized once (in this process)
+    assert CALLS == [os.getpid()]
+    if spool and execution == "process":
+        assert len(os.listdir(tmpdir)) == 1
+        session.parameters.to_dict()["myparam"].invalidate()
+        assert os.listdir(tmpdir) == []
+
+def test_cache_dropped(session):
+    from rocketry.args.builtin import _CACHE
+    arg = FuncArg(get_counted, cache="session")
+    arg.get_value(session=session)
+    assert _CACHE[arg._cache_id][0] == 0
+
+    # Other versions are not kept (ie. in pooled processes)
+    stale = pickle.loads(pickle.dumps(arg))
+    arg.invalidate()
+    stale.get_value(session=session)
+    arg.get_value(session=session)
+    assert _CACHE[arg._cache_id][0] == 1
+    assert sum(cache_id == arg._cache_id for cache_id in _CACHE) == 1
+
+    # Expired are removed
+    expiring = FuncArg(get_counted, cache=0.01)
+    expiring.get_value(session=session)
+    time.sleep(0.02)
+    arg.invalidate()
+    arg.get_value(session=session)
+    assert expiring._cache_id not in _CACHE
+
+    # Removed with the argument
+    cache_id = arg._cache_id
+    del arg, stale
+    gc.collect()
+    assert cache_id not in _CACHE
@@ -1,8 +1,11 @@
+import os
+
 import pytest
 
 from rocketry.args import Return
 from rocketry.conditions.scheduler import SchedulerCycles
 from rocketry.core import Parameters
+from rocketry.core.parameters import ReturnSpool, SpooledReturn, spool_return
 from rocketry.tasks import FuncTask
 from rocketry.conditions import TaskStarted
 
@@ -146,3 +149,62 @@ def test_default(session, execution):
     session.start()
 
     assert "success" == task.status
+
+def func_large_return():
+    return bytearray(b"x" * 2_000_000)
+
+def func_large_arg(myparam):
+    assert isinstance(myparam, bytearray)
+    assert len(myparam) == 2_000_000
+    assert myparam[:3] == b"xxx"
+
+def test_spool_return(tmpdir):
+    value = {"data": bytearray(b"x" * 2_000_000), "other": "a"}
+    spooled = spool_return(value, str(tmpdir))
+    assert os.path.exists(spooled.path)
+    assert spooled.load() == value
+    assert Parameters(a=spooled)["a"] == value
+
+    # Too small
+    assert spool_return({"data": bytearray(10)}, str(tmpdir)) is None
+    assert spool_return("x", str(tmpdir)) is None
+
+    spool = ReturnSpool()
+    spool.add(spooled)
+    spool.stage(spooled, "a task")
+    spool.release(spooled)
+    assert os.path.exists(spooled.path)
+    spool.release_staged("a task")
+    assert not os.path.exists(spooled.path)
+
+@pytest.mark.parametrize("execution", ["main", "thread", "process"])
+def test_spooled(session, execution, tmpdir):
+    session.config.return_spool = str(tmpdir)
+    task_return = FuncTask(
+        func_large_return,
+        name="return task",
+        start_cond="~has started",
+        execution="process",
+        session=session
+    )
+    task = FuncTask(
+        func_large_arg,
+        name="a task",
+        start_cond="after task 'return task'",
+        parameters={"myparam": Return('return task')},
+        execution=execution,
+        session=session
+    )
+
+    session.config.shut_cond = TaskStarted(task="a task") >= 1
+    session.start()
+
+    assert "success" == task_return.status
+    assert "success" == task.status
+    assert isinstance(session.returns.to_dict()[task_return], SpooledReturn)
+    assert session.returns[task_return] == func_large_return()
+    assert len(os.listdir(tmpdir)) == 1
+
+    # Replacing the return removes the file
+    task_return._handle_return(None)
+    assert os.listdir(tmpdir) == []
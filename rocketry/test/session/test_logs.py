@@ -2,6 +2,7 @@
 from itertools import chain
 import datetime
 import logging
+import math
 from typing import Optional
 from pydantic.v1 import root_validator, validator
 
@@ -10,11 +11,12 @@ import pytest
 from redbird.oper import in_, between
 from redbird.logging import RepoHandler
 from redbird.repos import MemoryRepo
-from rocketry.conditions import TaskFinished
+from rocketry.conditions import TaskFinished, TaskSucceeded
 from rocketry.conditions.scheduler import SchedulerCycles
 
 from rocketry.log.log_record import MinimalRecord
 from rocketry.pybox.time.convert import to_datetime
+from rocketry.time import TimeDelta
 from rocketry.tasks import FuncTask
 from rocketry.exc import TaskLoggingError
 
@@ -147,6 +149,102 @@ def test_failed_set_cache(on, session):
     session.start()
     assert task.status == "fail"
 
+def test_status_records(session, monkeypatch):
+    repo = session.get_repo()
+    for i in range(5):
+        repo.add(MinimalRecord(task_name=f"task {i}", action="run", created=1640988000 + i))
+        if i != 4:
+            repo.add(MinimalRecord(task_name=f"task {i}", action="success" if i % 2 else "fail", created=1640988060 + i))
+    repo.add(MinimalRecord(task_name="other", action="run", created=1640988100))
+    tasks = [FuncTask(do_success, name=f"task {i}", session=session) for i in range(6)]
+
+    statuses = session.get_latest_statuses(page_size=2)
+    assert statuses["task 1"] == {"run": 1640988001, "success": 1640988061}
+    assert statuses["task 5"] == {}
+    assert "other" not in statuses
+
+    # Read once
+    n_queries = 0
+    filter_by = MemoryRepo.filter_by
+    def count_queries(self, *args, **kwargs):
+        nonlocal n_queries
+        n_queries += 1
+        return filter_by(self, *args, **kwargs)
+    monkeypatch.setattr(MemoryRepo, "filter_by", count_queries)
+
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    assert n_queries == 1
+    assert [task.status for task in tasks] == ["fail", "success", "fail", "success", "crash", None]
+    assert tasks[1].last_success == datetime.datetime.fromtimestamp(1640988061)
+    assert tasks[0].last_run == datetime.datetime.fromtimestamp(1640988000)
+    assert tasks[5].last_run is None
+    # Index is seeded only when needed
+    assert not tasks[0]._action_index.complete
+
+def test_compact_logs(session):
+    now = datetime.datetime(2022, 1, 10, 12, 0).timestamp()
+    session.config.time_func = lambda: now
+    repo = session.get_repo()
+    for day in range(10):
+        for hour in (1, 13):
+            created = datetime.datetime(2022, 1, 1 + day, hour, 0).timestamp()
+            for name in ("daily", "other"):
+                repo.add(MinimalRecord(task_name=name, action="run", created=created))
+                repo.add(MinimalRecord(task_name=name, action="success", created=created + 1))
+    repo.add(MinimalRecord(task_name="other", action="fail", created=datetime.datetime(2022, 1, 1, 2, 0).timestamp()))
+
+    daily = FuncTask(do_success, name="daily", start_cond="daily", session=session)
+    other = FuncTask(do_success, name="other", session=session)
+    for task in (daily, other):
+        task.set_cached()
+
+    # Nothing to remove
+    assert session.compact_logs() == 0
+
+    session.config.log_max_records = 3
+    assert session.compact_logs() == 81 - 4 - 4
+    # The records of today are needed by the condition
+    assert [(rec.action, rec.created) for rec in daily.logger.get_records()] == [
+        ("run", datetime.datetime(2022, 1, 10, 1, 0).timestamp()),
+        ("success", datetime.datetime(2022, 1, 10, 1, 0, 1).timestamp()),
+        ("run", datetime.datetime(2022, 1, 10, 13, 0).timestamp()),
+        ("success", datetime.datetime(2022, 1, 10, 13, 0, 1).timestamp()),
+    ]
+    # The latest of each action is kept
+    assert [rec.action for rec in other.logger.get_records()] == ["success", "run", "success", "fail"]
+    assert daily._get_action_index().count("run", -math.inf, math.inf) == 2
+    assert other._get_action_index().count("fail", -math.inf, math.inf) == 1
+    assert daily.last_success == datetime.datetime(2022, 1, 10, 13, 0, 1)
+
+    session.config.log_max_records = None
+    session.config.log_needed_only = True
+    assert session.compact_logs() == 1
+    assert [rec.action for rec in other.logger.get_records()] == ["run", "success", "fail"]
+    assert len(daily.logger.get_records()) == 4
+
+def test_compact_logs_max_age(session):
+    repo = session.get_repo()
+    now = session.get_time()
+    for i in range(5):
+        repo.add(MinimalRecord(task_name="mytask", action="success", created=now - 3600 * (5 - i)))
+
+    task = FuncTask(
+        do_success, name="mytask", session=session, execution="main",
+        start_cond=TaskSucceeded(task="other", period=TimeDelta("2 hours")),
+    )
+    other = FuncTask(do_success, name="other", session=session)
+    for i in range(5):
+        repo.add(MinimalRecord(task_name="other", action="success", created=now - 3600 * (5 - i)))
+
+    session.config.log_max_age = "30 minutes"
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    # Condition reads the last 2 hours of the other task
+    assert [rec.created for rec in other.logger.get_records()] == [now - 3600]
+    assert [rec.action for rec in task.logger.get_records()] == ["run", "success"]
+    assert session.scheduler._last_compact is not None
+
 @pytest.mark.parametrize(
     "query,expected",
     [
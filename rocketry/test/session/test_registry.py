@@ -0,0 +1,74 @@
+from time import time
+
+from rocketry.core.task import TaskRun
+from rocketry.tasks import FuncTask
+
+def test_lookup(session):
+    task1 = FuncTask(lambda : None, name="example 1", execution="main", session=session)
+    task2 = FuncTask(lambda : None, name="example 2", execution="main", session=session)
+
+    assert session.tasks == {task1, task2}
+    assert session.tasks.get("example 1") is task1
+    assert session.tasks.get("example 3") is None
+
+    task1.name = "renamed"
+    assert session["renamed"] is task1
+    assert "example 1" not in session
+
+    task2.delete()
+    assert session.tasks == {task1}
+    assert session.tasks.get("example 2") is None
+
+def test_priority(session):
+    task1 = FuncTask(lambda : None, name="low", priority=1, execution="main", session=session)
+    task2 = FuncTask(lambda : None, name="high", priority=5, execution="main", session=session)
+    task3 = FuncTask(lambda : None, name="middle", priority=3, execution="main", session=session)
+    task4 = FuncTask(lambda : None, name="middle 2", priority=3, execution="main", session=session)
+
+    assert session.scheduler.tasks == [task2, task3, task4, task1]
+
+    task1.priority = 10
+    assert session.scheduler.tasks == [task1, task2, task3, task4]
+
+    # Insertion order kept in the same priority
+    task4.priority = 5
+    task3.priority = 5
+    assert session.scheduler.tasks == [task1, task2, task3, task4]
+
+def test_prefix(session):
+    task1 = FuncTask(lambda : None, name="group.do_things", execution="main", session=session)
+    task2 = FuncTask(lambda : None, name="group.do_other", execution="main", session=session)
+    FuncTask(lambda : None, name="groupie", execution="main", session=session)
+    FuncTask(lambda : None, name="other.do_things", execution="main", session=session)
+
+    assert session.tasks.get_by_prefix("group.") == [task2, task1]
+    assert session.tasks.get_by_prefix("nothing.") == []
+
+def test_execution(session):
+    task1 = FuncTask(lambda : None, name="example 1", execution="main", session=session)
+    task2 = FuncTask(lambda : None, name="example 2", execution="thread", session=session)
+
+    assert session.tasks.get_by_execution("main") == {task1}
+    task2.execution = "main"
+    assert session.tasks.get_by_execution("main") == {task1, task2}
+    assert session.tasks.get_by_execution("thread") == set()
+
+def test_runs(session):
+    task = FuncTask(lambda : None, name="example", execution="main", session=session)
+    assert session.tasks.get_with_runs() == []
+
+    task._add_run(TaskRun(start=time(), task=None))
+    assert session.tasks.get_with_runs() == [task]
+
+    task._run_stack = []
+    assert session.tasks.get_with_runs() == []
+
+def test_run(session):
+    session.config.shut_cond = None
+    task = FuncTask(lambda : None, name="example", execution="main", priority=2, session=session)
+    other = FuncTask(lambda : None, name="other", execution="main", priority=1, session=session)
+
+    session.run("example")
+    assert session.tasks == {task, other}
+    assert session.scheduler.tasks == [task, other]
+    assert session.tasks.get_with_runs() == []
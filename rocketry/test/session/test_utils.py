@@ -1,7 +1,11 @@
+import functools
+
+from rocketry.conditions import SchedulerCycles
 from rocketry.conditions.task import DependFailure, DependSuccess
+from rocketry.conditions.task.utils import DependMixin
 from rocketry.core.condition.base import All, Any
 from rocketry.tasks import FuncTask
-from rocketry.utils.dependencies import Dependencies, Link, get_dependencies
+from rocketry.utils.dependencies import Dependencies, DependencyGraph, Link, get_dependencies
 
 def test_dependency(session):
     ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main", session=session)
@@ -49,3 +53,56 @@ def test_link(session):
     assert str(Link(ta, tb, relation=DependSuccess, type=All)) == "'a' -> 'b' (multi)"
 
     assert repr(Link(ta, tb, relation=DependSuccess, type=All)) == "Link('a', 'b', relation=DependSuccess, type=All)"
+
+def test_dependency_graph(session):
+    ta = FuncTask(lambda: None, name="a", start_cond="daily", execution="main", session=session)
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main", session=session)
+    tc = FuncTask(lambda: None, name="c", start_cond="after task 'a' & after task 'b' failed", execution="main", session=session)
+    td = FuncTask(lambda: None, name="d", start_cond="after task 'a' & daily", execution="main", session=session)
+
+    graph = DependencyGraph(session)
+    session._dependency_graph = graph
+    assert graph.has(tb)
+    assert graph.has(tc)
+    assert not graph.has(ta)
+    assert not graph.has(td)
+
+    assert not graph.is_ready(tb)
+    assert graph._states == {"b": False}
+
+    ta.log_running()
+    ta.log_success()
+    assert graph.triggered == {"b", "c"}
+    assert graph._states == {}
+    assert graph.is_ready(tb)
+
+    tb.start_cond = "after task 'a' failed"
+    assert not graph.has(tb)
+
+def test_dependency_cycle(session, monkeypatch):
+    # Children before the parents
+    tc = FuncTask(lambda: None, name="c", start_cond="after task 'b'", execution="main", priority=3, session=session)
+    tb = FuncTask(lambda: None, name="b", start_cond="after task 'a'", execution="main", priority=2, session=session)
+    ta = FuncTask(lambda: None, name="a", start_cond="true", execution="main", priority=1, session=session)
+
+    n_observed = 0
+    get_state = DependMixin.get_state
+    @functools.wraps(get_state)
+    def count_observed(self, *args, **kwargs):
+        nonlocal n_observed
+        n_observed += 1
+        return get_state(self, *args, **kwargs)
+    monkeypatch.setattr(DependMixin, "get_state", count_observed)
+
+    session.config.shut_cond = SchedulerCycles() >= 1
+    session.start()
+    # Ran in the same cycle
+    assert [task.status for task in (ta, tb, tc)] == ["success", "success", "success"]
+    observed_first = n_observed
+
+    session.config.shut_cond = SchedulerCycles() >= 5
+    ta.start_cond = "false"
+    session.start()
+    assert tb.logger.filter_by(action="run").count() == 1
+    # Observed at startup only (not in every cycle)
+    assert n_observed - observed_first <= 2
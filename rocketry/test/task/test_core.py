@@ -118,6 +118,7 @@ def test_json(session):
         "permanent": false,
         "fmt_log_message": "Task '{task}' status: '{action}'",
         "daemon": null,
+        "thread_pool_size": null,
         "batches": [],
         "name": "mytest",
         "description": null,
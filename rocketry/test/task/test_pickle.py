@@ -1,11 +1,15 @@
 import pickle
+import subprocess
+import sys
 from inspect import isfunction
 
 import pytest
 
 from rocketry.tasks import FuncTask
-from rocketry.conditions import TaskFailed
+from rocketry.conditions import TaskFailed, TaskStarted
 from rocketry.core import Parameters
+from rocketry.core.task import TaskRun
+from rocketry.core.utils import get_context
 
 def func_on_main_level():
     pass
@@ -77,3 +81,72 @@ class TestFunc:
         for attr, val in vars(pick_task.session).items():
             if attr not in ('hooks', 'returns', 'config'):
                 assert val in (None, set(), {}, Parameters())
+
+class Counted:
+    n_pickled = 0
+
+    def __reduce__(self):
+        type(self).n_pickled += 1
+        return Counted, ()
+
+def func_with_arg(myparam):
+    pass
+
+def test_launch_pickled_once(session):
+    task = FuncTask(func_with_arg, execution="process", name="a task", session=session)
+    run = TaskRun(start=0, task=None)
+    Counted.n_pickled = 0
+    data = task._dump_launch(dict(params=Parameters(myparam=Counted()), direct_params=Parameters(), task_run=run), run)
+    assert Counted.n_pickled == 1
+    assert run.payload_size == len(data)
+    assert session.scheduler.launch_stats["a task"]["launches"] == 1
+
+    pick_task, kwargs = pickle.loads(data)
+    assert pick_task.name == "a task"
+    assert isinstance(kwargs["params"]["myparam"], Counted)
+
+    # Unpicklable parameters are still dropped
+    data = task._dump_launch(dict(params=Parameters(myparam=lambda: None), direct_params=Parameters(), task_run=run), run)
+    pick_task, kwargs = pickle.loads(data)
+    assert "myparam" not in kwargs["params"]
+    assert session.scheduler.launch_stats["a task"]["launches"] == 2
+
+def test_session_pickle_cached(session):
+    pickled = session._get_pickled()
+    assert session._get_pickled() is pickled
+    assert pickle.loads(pickled.data).config.timeout == session.config.timeout
+
+    session.config.timeout = 5
+    assert session._get_pickled() is not pickled
+    assert pickle.loads(session._get_pickled().data).config.timeout == session.config.timeout
+
+@pytest.mark.parametrize("process_pool", [True, False])
+def test_launch_stats(session, process_pool):
+    session.config.process_pool = process_pool
+    task = FuncTask(func_on_main_level, execution="process", name="a task", start_cond="true", session=session)
+    session.config.shut_cond = TaskStarted(task="a task") >= 2
+    session.start()
+
+    assert task.status == "success"
+    stats = session.scheduler.launch_stats
+    if process_pool or get_context().get_start_method() != "fork":
+        assert stats["a task"]["launches"] >= 2
+        assert stats["a task"]["payload_size"] > 0
+    else:
+        # Not pickled
+        assert stats == {}
+
+def test_start_method_not_fixed():
+    # The start method is global thus checked in a new interpreter
+    code = (
+        "import multiprocessing\n"
+        "from rocketry import Session\n"
+        "from rocketry.conditions import TaskStarted\n"
+        "from rocketry.tasks import FuncTask\n"
+        "session = Session(config={'shut_cond': TaskStarted(task='a task') >= 1})\n"
+        "FuncTask(print, name='a task', execution='process', start_cond='true', session=session)\n"
+        "session.start()\n"
+        "print(multiprocessing.get_start_method(allow_none=True))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, timeout=60)
+    assert out.stdout.strip().splitlines()[-1] == "None"
@@ -1,6 +1,8 @@
 import datetime
+import random
+
 import pytest
-from rocketry.time import Cron
+from rocketry.time import Cron, always
 from rocketry.time.interval import TimeOfDay, TimeOfHour, TimeOfMinute, TimeOfMonth, TimeOfWeek, TimeOfYear
 
 every_minute = TimeOfMinute()
@@ -209,3 +211,104 @@ def test_roll_conflict_day_of_month_first():
     interv = period.rollback(datetime.datetime(2022, 12, 7, 10, 0, 0))
     assert interv.left == datetime.datetime.fromisoformat("2022-10-29 22:15:00")
     assert interv.right == datetime.datetime.fromisoformat("2022-10-29 22:16:00")
+
+def _generate_field(rand, low, high, names=()):
+    if rand.random() < 0.3:
+        return "*"
+    def get_value():
+        if names and rand.random() < 0.3:
+            return rand.choice(names)
+        return str(rand.randint(low, high))
+    exprs = []
+    for _ in range(rand.choice([1, 1, 2, 3])):
+        kind = rand.random()
+        if kind < 0.4:
+            exprs.append(get_value())
+        elif kind < 0.7:
+            exprs.append(f"{get_value()}-{get_value()}")
+        elif kind < 0.85:
+            exprs.append(f"*/{rand.randint(1, 7)}")
+        else:
+            start, end = sorted([rand.randint(low, high), rand.randint(low, high)])
+            exprs.append(f"{start}-{end}/{rand.randint(1, 4)}")
+    return ",".join(exprs)
+
+def _get_field_values(period):
+    "Get allowed values of the fields using the subperiods"
+    minute = period._get_period_from_expr(TimeOfHour, period.minute)
+    hour = period._get_period_from_expr(TimeOfDay, period.hour)
+    day_of_month = period._get_period_from_expr(TimeOfMonth, period.day_of_month)
+    month = period._get_period_from_expr(TimeOfYear, period.month)
+    day_of_week = period._get_period_from_expr(TimeOfWeek, period.day_of_week, conv=period._convert_day_of_week)
+    return (
+        {i for i in range(60) if datetime.datetime(2022, 1, 1, 0, i, 30) in minute},
+        {i for i in range(24) if datetime.datetime(2022, 1, 1, i, 30) in hour},
+        {i for i in range(1, 32) if datetime.datetime(2022, 1, i, 12) in day_of_month},
+        {i for i in range(1, 13) if datetime.datetime(2022, i, 15) in month},
+        # 2022-08-01 is Monday
+        {i for i in range(1, 8) if datetime.datetime(2022, 8, i, 12) in day_of_week},
+        day_of_month is not always and day_of_week is not always,
+    )
+
+def _is_day_match(values, dt):
+    _, _, days, months, weekdays, either = values
+    if dt.month not in months:
+        return False
+    if either:
+        return dt.day in days or dt.isoweekday() in weekdays
+    return dt.day in days and dt.isoweekday() in weekdays
+
+def _brute_roll(values, dt, direction):
+    minutes, hours = values[0], values[1]
+    current = dt
+    n_days = 0
+    while not (_is_day_match(values, current) and current.hour in hours and current.minute in minutes):
+        if not _is_day_match(values, current):
+            # Skip to the next/previous day
+            current = current.replace(hour=23, minute=59) if direction > 0 else current.replace(hour=0, minute=0)
+            n_days += 1
+            if n_days > 5 * 366:
+                # Never matches
+                return None
+        current += direction * datetime.timedelta(minutes=1)
+    return current
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compiled_differential(seed):
+    # Compare the compiled roll to the the fields
+    # of the subperiods checked minute by minute
+    rand = random.Random(seed)
+    for _ in range(20):
+        period = Cron(
+            _generate_field(rand, 0, 59),
+            _generate_field(rand, 0, 23),
+            _generate_field(rand, 1, 31),
+            _generate_field(rand, 1, 12, ["JAN", "feb", "Jun", "DEC"]),
+            _generate_field(rand, 0, 7, ["MON", "fri", "Sun", "sat"]),
+        )
+        try:
+            values = _get_field_values(period)
+        except ValueError:
+            # Invalid expression
+            continue
+        if not all(values[:5]):
+            continue
+        for _ in range(3):
+            dt = datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=rand.randint(0, 2 * 365 * 86400), microseconds=rand.choice([0, 500]))
+
+            minute = dt.replace(second=0, microsecond=0)
+            start = _brute_roll(values, minute, 1)
+            if start is None:
+                break
+            interv = period.rollforward(dt)
+            assert interv.left == (dt if start == minute else start)
+            assert interv.right == start + datetime.timedelta(minutes=1)
+            assert interv.closed == "left"
+
+            if minute == dt:
+                minute -= datetime.timedelta(minutes=1)
+            start = _brute_roll(values, minute, -1)
+            interv = period.rollback(dt)
+            assert interv.left == start
+            assert interv.right == min(dt, start + datetime.timedelta(minutes=1))
+            assert interv.closed == "left"
@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+
+from rocketry.core.time.utils import PeriodSpanCache, get_period_span
+from rocketry.time import Cron, TimeDelta, TimeOfDay, TimeOfHour, TimeOfMonth, TimeOfWeek, TimeOfYear
+
+@pytest.mark.parametrize("period", [
+    pytest.param(TimeOfDay(), id="full"),
+    pytest.param(TimeOfDay("10:00", "12:00"), id="interval"),
+    pytest.param(TimeOfDay("22:00", "02:00"), id="overnight"),
+    pytest.param(TimeOfWeek("Mon", "Tue") & TimeOfDay("10:00", "12:00"), id="all"),
+    pytest.param(TimeOfHour("15:00", "30:00") | TimeOfDay("10:00", "12:00"), id="any"),
+    pytest.param(Cron("*/15", "10-12"), id="cron"),
+    pytest.param(TimeDelta("2 hours"), id="delta"),
+])
+def test_same_as_rollback(period):
+    cache = PeriodSpanCache()
+    now = datetime.datetime(2022, 8, 1, 8, 0)
+    while now < datetime.datetime(2022, 8, 4):
+        expected = period.use_reference(now).rollback(now) if isinstance(period, TimeDelta) else period.rollback(now)
+        assert cache.get_span(period, now) == (expected.left, expected.right)
+        now += datetime.timedelta(minutes=7, microseconds=1)
+
+def test_hits():
+    cache = PeriodSpanCache()
+    period = TimeOfDay("10:00", "12:00")
+
+    assert cache.get_span(period, datetime.datetime(2022, 8, 1, 13, 0)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 12, 0))
+    assert cache.get_span(period, datetime.datetime(2022, 8, 2, 9, 59)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 12, 0))
+    assert cache.info()[:2] == (1, 1)
+
+    # Crossed the start of the next interval
+    assert cache.get_span(period, datetime.datetime(2022, 8, 2, 10, 30)) == (datetime.datetime(2022, 8, 2, 10, 0), datetime.datetime(2022, 8, 2, 10, 30))
+    assert cache.get_span(period, datetime.datetime(2022, 8, 2, 11, 0)) == (datetime.datetime(2022, 8, 2, 10, 0), datetime.datetime(2022, 8, 2, 11, 0))
+    assert cache.info()[:2] == (2, 2)
+
+    # Time went backwards
+    assert cache.get_span(period, datetime.datetime(2022, 8, 1, 11, 0)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 11, 0))
+    assert cache.info()[:2] == (2, 3)
+
+def test_on_boundary():
+    # The right boundary is not in the interval
+    cache = PeriodSpanCache()
+    period = TimeOfDay("10:00", "12:00")
+
+    assert cache.get_span(period, datetime.datetime(2022, 8, 1, 12, 0)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 12, 0))
+    assert cache.get_span(period, datetime.datetime(2022, 8, 1, 13, 0)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 12, 0))
+    assert cache.get_span(period, datetime.datetime(2022, 8, 2, 9, 0)) == (datetime.datetime(2022, 8, 1, 10, 0), datetime.datetime(2022, 8, 1, 12, 0))
+    assert cache.info()[:2] == (2, 1)
+
+@pytest.mark.parametrize("period", [
+    pytest.param(TimeOfMonth(), id="month"),
+    pytest.param(TimeOfMonth("20th", "5th"), id="month interval"),
+    pytest.param(TimeOfYear(), id="year"),
+])
+def test_short_month(period):
+    # Rollforward from February ends in March
+    cache = PeriodSpanCache()
+    for now in (datetime.datetime(2022, 2, 10), datetime.datetime(2022, 3, 1, 1, 0), datetime.datetime(2022, 3, 2), datetime.datetime(2022, 3, 5)):
+        expected = period.rollback(now)
+        assert cache.get_span(period, now) == (expected.left, expected.right)
+
+def test_monthly(session):
+    from rocketry.conditions import TaskExecutable
+    from rocketry.tasks import FuncTask
+    task = FuncTask(lambda: None, name="the task", execution="main", session=session)
+    cond = TaskExecutable(task="the task", period=TimeOfMonth())
+    now = datetime.datetime(2022, 2, 10, 12, 0)
+    session.config.time_func = lambda: now.timestamp()
+    task.log_running()
+    task.log_success()
+    assert not cond.observe(session=session)
+
+    for day in (1, 2):
+        now = datetime.datetime(2022, 3, day, 1, 0)
+        assert cond.observe(session=session)
+
+def test_maxsize():
+    cache = PeriodSpanCache(maxsize=2)
+    periods = [TimeOfDay(f"{i:02d}:00", f"{i + 1:02d}:00") for i in range(3)]
+    now = datetime.datetime(2022, 8, 1, 13, 0)
+    for period in periods:
+        cache.get_span(period, now)
+    assert cache.info().currsize == 2
+
+    cache.get_span(periods[0], now)
+    assert cache.info()[:2] == (0, 4)
+
+def test_parsed(session):
+    start, _ = get_period_span("time of day between 10:00 and 12:00", session=session)
+    assert (start.hour, start.minute) == (10, 0)
+    assert get_period_span("time of day between 10:00 and 12:00", session=session)[0] == start
@@ -1,7 +1,10 @@
-from typing import Callable
+import calendar
+import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from rocketry.core.time.base import TimePeriod, always
+from rocketry.pybox.time import to_datetime, Interval
 
 from .interval import TimeOfHour, TimeOfDay, TimeOfMinute, TimeOfWeek, TimeOfMonth, TimeOfYear
 
@@ -27,12 +30,50 @@ class Cron(TimePeriod):
         # /: step values
 
     def rollforward(self, dt):
-        "Get previous time interval of the period."
-        return self.get_subperiod().rollforward(dt)
+        "Get next time interval of the period."
+        compiled = self._get_compiled()
+        if compiled is None:
+            return self.get_subperiod().rollforward(dt)
+
+        dt = to_datetime(dt)
+        current = dt.replace(second=0, microsecond=0)
+        match = compiled.next_match(current.year, current.month, current.day, current.hour, current.minute)
+        if match is None:
+            return Interval(self.max, self.max)
+        start = current.replace(*match)
+        end = start + _MINUTE
+        if start == current:
+            # dt is on the period
+            start = dt
+        return Interval(start, end, closed="left")
 
     def rollback(self, dt):
         "Get previous time interval of the period."
-        return self.get_subperiod().rollback(dt)
+        compiled = self._get_compiled()
+        if compiled is None:
+            return self.get_subperiod().rollback(dt)
+
+        dt = to_datetime(dt)
+        current = dt.replace(second=0, microsecond=0)
+        if current == dt:
+            # The interval is left closed thus
+            # the minute that ended at dt is the last one
+            current -= _MINUTE
+        match = compiled.prev_match(current.year, current.month, current.day, current.hour, current.minute)
+        if match is None:
+            return Interval(self.min, self.min)
+        start = current.replace(*match)
+        end = min(start + _MINUTE, dt)
+        return Interval(start, end, closed="left")
+
+    def _get_compiled(self) -> Optional['_CompiledCron']:
+        key = (self.minute, self.hour, self.day_of_month, self.month, self.day_of_week)
+        try:
+            return _COMPILED[key]
+        except KeyError:
+            compiled = _CompiledCron.from_cron(self)
+            _COMPILED[key] = compiled
+            return compiled
 
     def _get_period_from_expr(self, cls, expression:str, conv:Callable=None, default=always):
 
@@ -109,3 +150,207 @@ class Cron(TimePeriod):
             & self._get_period_from_expr(TimeOfYear, self.month)
             & day_of_week_month
         )
+
+_MINUTE = datetime.timedelta(minutes=1)
+
+# Values of the fields in the order of the
+# unit names of the corresponding time periods
+_UNITS = {
+    TimeOfHour: list(range(60)),
+    TimeOfDay: list(range(24)),
+    TimeOfMonth: list(range(1, 32)),
+    TimeOfYear: list(range(1, 13)),
+    TimeOfWeek: list(range(1, 8)), # ISO weekdays
+}
+
+_COMPILED: Dict[Tuple[str, ...], Optional['_CompiledCron']] = {}
+
+def _first(mask:int, start:int) -> int:
+    "Get the lowest set bit that is at or after start (-1 if none)"
+    mask >>= start
+    if not mask:
+        return -1
+    return start + (mask & -mask).bit_length() - 1
+
+def _last(mask:int, end:int) -> int:
+    "Get the highest set bit that is at or before end (-1 if none)"
+    if end < 0:
+        return -1
+    return (mask & ((2 << end) - 1)).bit_length() - 1
+
+class _CompiledCron:
+    """Cron expression compiled to bitsets of the
+    allowed minutes, hours, days of month, months and
+    ISO weekdays. The next and previous matching minute
+    is found by jumping over the unset bits instead of
+    constructing and rolling the subperiods.
+
+    The sets follow the semantics of Cron.get_subperiod
+    (including how the steps are handled) and the
+    expressions that cannot be compiled are rolled
+    using the subperiods."""
+
+    def __init__(self, minutes:int, hours:int, days:int, months:int, weekdays:int, day_or_weekday:bool):
+        self.minutes = minutes
+        self.hours = hours
+        self.months = months
+        self.day_or_weekday = day_or_weekday
+
+        # Days of month for each ISO weekday of the 1st of the month
+        self._days = {}
+        for first_weekday in range(1, 8):
+            weekday_days = 0
+            for day in range(1, 32):
+                weekday = (first_weekday + day - 2) % 7 + 1
+                if weekdays >> weekday & 1:
+                    weekday_days |= 1 << day
+            self._days[first_weekday] = days | weekday_days if day_or_weekday else days & weekday_days
+
+    @classmethod
+    def from_cron(cls, cron:Cron) -> Optional['_CompiledCron']:
+        minutes, _ = cls._parse(TimeOfHour, cron.minute)
+        hours, _ = cls._parse(TimeOfDay, cron.hour)
+        days, days_specified = cls._parse(TimeOfMonth, cron.day_of_month)
+        months, _ = cls._parse(TimeOfYear, cron.month)
+        weekdays, weekdays_specified = cls._parse(TimeOfWeek, cron.day_of_week, conv=cron._convert_day_of_week)
+        if None in (minutes, hours, days, months, weekdays):
+            return None
+        return cls(minutes, hours, days, months, weekdays, day_or_weekday=days_specified and weekdays_specified)
+
+    @staticmethod
+    def _parse(interval, expression:str, conv:Callable=None) -> Tuple[Optional[int], bool]:
+        """Turn a field to a bitset. Returns also whether
+        the field was specified (not only "*")"""
+        conv = (lambda i: i) if conv is None else conv
+        units = _UNITS[interval]
+
+        def to_index(value):
+            if isinstance(value, int):
+                return units.index(value) if value in units else None
+            if interval in (TimeOfWeek, TimeOfYear):
+                return interval._unit_mapping.get(value.lower())
+            return None
+
+        values: Optional[List[int]] = None
+        for expr in expression.split(","):
+            if expr == "*":
+                continue
+            if values is None:
+                values = []
+            if "/" in expr:
+                expr, step = expr.split("/")
+                step = int(step)
+            else:
+                step = None
+
+            if "-" in expr:
+                start, end = expr.split("-")
+                start = conv(int(start)) if start.isdigit() else start
+                end = conv(int(end)) if end.isdigit() else end
+                if step is not None:
+                    # Ints are used as indexes like
+                    # in create_range
+                    if isinstance(start, str):
+                        start = to_index(start)
+                    end = to_index(end) if isinstance(end, str) else end
+                    if start is None or end is None:
+                        return None, True
+                    selected = units[start:end + 1:step]
+                else:
+                    start = to_index(start)
+                    end = to_index(end)
+                    if start is None or end is None:
+                        return None, True
+                    if start <= end:
+                        selected = units[start:end + 1]
+                    else:
+                        # Over the end of the cycle
+                        selected = units[start:] + units[:end + 1]
+            else:
+                stepped = units[::step] if step is not None else units
+                value = conv(int(expr)) if expr.isdigit() else expr
+                if value == "*":
+                    selected = stepped
+                else:
+                    index = to_index(value)
+                    if index is None:
+                        return None, True
+                    selected = [units[index]] if units[index] in stepped else []
+            if not selected:
+                # Cannot be constructed as a period
+                return None, True
+            values += selected
+
+        if values is None:
+            values = units
+        mask = 0
+        for value in values:
+            mask |= 1 << value
+        return mask, values is not units
+
+    def get_days(self, year:int, month:int) -> int:
+        "Get bitset of the matching days of the month"
+        first_weekday, n_days = calendar.monthrange(year, month)
+        return self._days[first_weekday + 1] & ((2 << n_days) - 1)
+
+    def next_match(self, year, month, day, hour, minute) -> Optional[Tuple[int, int, int, int, int]]:
+        "Get the first matching minute at or after the given minute"
+        while year <= TimePeriod.max.year:
+            next_month = _first(self.months, month)
+            if next_month < 0:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, 0, 0
+
+            next_day = _first(self.get_days(year, month), day)
+            if next_day < 0:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                continue
+            if next_day != day:
+                day, hour, minute = next_day, 0, 0
+
+            next_hour = _first(self.hours, hour)
+            if next_hour < 0:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if next_hour != hour:
+                hour, minute = next_hour, 0
+
+            next_minute = _first(self.minutes, minute)
+            if next_minute < 0:
+                hour, minute = hour + 1, 0
+                continue
+            return year, month, day, hour, next_minute
+        return None
+
+    def prev_match(self, year, month, day, hour, minute) -> Optional[Tuple[int, int, int, int, int]]:
+        "Get the last matching minute at or before the given minute"
+        while year >= TimePeriod.min.year:
+            prev_month = _last(self.months, month)
+            if prev_month < 0:
+                year, month, day, hour, minute = year - 1, 12, 31, 23, 59
+                continue
+            if prev_month != month:
+                month, day, hour, minute = prev_month, 31, 23, 59
+
+            prev_day = _last(self.get_days(year, month), day)
+            if prev_day < 0:
+                month, day, hour, minute = month - 1, 31, 23, 59
+                continue
+            if prev_day != day:
+                day, hour, minute = prev_day, 23, 59
+
+            prev_hour = _last(self.hours, hour)
+            if prev_hour < 0:
+                day, hour, minute = day - 1, 23, 59
+                continue
+            if prev_hour != hour:
+                hour, minute = prev_hour, 59
+
+            prev_minute = _last(self.minutes, minute)
+            if prev_minute < 0:
+                hour, minute = hour - 1, 59
+                continue
+            return year, month, day, hour, prev_minute
+        return None
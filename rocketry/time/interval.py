@@ -6,11 +6,13 @@ from typing import ClassVar, List
 
 import dateutil
 
-from rocketry.core.time.anchor import AnchoredInterval
+from rocketry.core.time.anchor import AnchoredInterval, time_of_day
 from rocketry.core.time.base import TimeInterval
 from rocketry.pybox.time import datetime_to_dict, to_microseconds
 from rocketry.pybox.time.interval import Interval
 
+_DAY = to_microseconds(day=1)
+
 @dataclass(frozen=True, init=False)
 class TimeOfSecond(AnchoredInterval):
     """Time interval anchored to second cycle of a clock
@@ -138,13 +140,7 @@ class TimeOfDay(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("hour", "minute", "second", "microsecond")
-        }
-        return to_microseconds(**d)
+        return time_of_day(dt)
 
 @dataclass(frozen=True, init=False)
 class TimeOfWeek(AnchoredInterval):
@@ -206,14 +202,7 @@ class TimeOfWeek(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("hour", "minute", "second", "microsecond")
-        }
-        dayofweek = dt.weekday()
-        return to_microseconds(**d) + dayofweek * to_microseconds(day=1)
+        return time_of_day(dt) + dt.weekday() * _DAY
 
 
 @dataclass(frozen=True, init=False)
@@ -274,17 +263,8 @@ class TimeOfMonth(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        d = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in d.items()
-            if key in ("day", "hour", "minute", "second", "microsecond")
-        }
-        if "day" in d:
-            # Day (of month) does not start from 0 (but from 1)
-            d["day"] = d["day"] - 1
-
-        return to_microseconds(**d)
+        # Day (of month) does not start from 0 (but from 1)
+        return time_of_day(dt) + (dt.day - 1) * _DAY
 
     def get_scope_forward(self, dt):
         n_days = calendar.monthrange(dt.year, dt.month)[1]
@@ -389,17 +369,8 @@ class TimeOfYear(AnchoredInterval):
 
     def anchor_dt(self, dt, **kwargs):
         "Turn datetime to microseconds according to the scope (by removing higher time elements)"
-        dt_dict = datetime_to_dict(dt)
-        d = {
-            key: val
-            for key, val in dt_dict.items()
-            if key in ("day", "hour", "minute", "second", "microsecond")
-        }
-        nth_month = dt_dict["month"] - 1
-        if "day" in d:
-            # Day (of month) does not start from 0 (but from 1)
-            d["day"] = d["day"] - 1
-        return self._month_start_mapping[nth_month] + to_microseconds(**d)
+        # Day (of month) does not start from 0 (but from 1)
+        return self._month_start_mapping[dt.month - 1] + (dt.day - 1) * _DAY + time_of_day(dt)
 
 
 @dataclass(frozen=True, init=False)
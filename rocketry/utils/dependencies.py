@@ -1,9 +1,11 @@
-from typing import List, Optional, Union
+import threading
+from typing import Dict, List, Optional, Set, Union
 
 from pydantic.v1 import BaseModel
 
 from rocketry.conditions import Any, All, DependFinish, DependSuccess
 from rocketry.conditions.task import DependFailure
+from rocketry.conditions.task.utils import DependMixin
 from rocketry.core import Task
 
 from rocketry import Session
@@ -72,3 +74,83 @@ class Dependencies(BaseModel):
 def get_dependencies(session) -> List[Link]:
     "Get list of dependency links"
     return list(Dependencies(session))
+
+
+class DependencyGraph:
+    """Edge-triggered states of the start conditions
+    of the tasks that only depend on other tasks.
+
+    The start condition of such a task can change
+    only when its parent tasks or the task itself
+    changes status. The state is observed once and
+    reused until then. The tasks whose state was
+    reset are collected to ``triggered`` thus the
+    scheduler can check them again in the same cycle.
+    Other tasks are not handled by the graph.
+    """
+
+    def __init__(self, session:Session):
+        self.session = session
+        self.triggered: Set[str] = set()
+        self._conds: Dict[str, object] = {} # Start conditions the graph handles
+        self._dependents: Dict[str, Set[str]] = {}
+        self._states: Dict[str, bool] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        for link in self._get_links():
+            self._dependents.setdefault(link.parent.name, set()).add(link.child.name)
+            self._conds[link.child.name] = link.child.start_cond
+        for name in self._conds:
+            # A run resets the state of the task itself
+            self._dependents.setdefault(name, set()).add(name)
+
+    def _get_links(self):
+        deps = Dependencies(self.session)
+        for task in self.session.tasks:
+            if not self._is_dependency_only(task):
+                continue
+            try:
+                yield from list(deps._get_links(task))
+            except KeyError:
+                # Parent does not exist
+                continue
+
+    @staticmethod
+    def _is_dependency_only(task:Task) -> bool:
+        cond = task.start_cond
+        conds = cond.subconditions if isinstance(cond, (Any, All)) else [cond]
+        return bool(conds) and all(
+            isinstance(subcond, DependMixin) and subcond.task in (None, task.name, task)
+            for subcond in conds
+        )
+
+    def has(self, task:Task) -> bool:
+        "Whether the state of the start condition of the task is handled by the graph"
+        cond = self._conds.get(task.name)
+        return cond is not None and cond is task.start_cond
+
+    def is_ready(self, task:Task) -> bool:
+        "Check the start condition of the task (observed only if it may have changed)"
+        name = task.name
+        try:
+            return self._states[name]
+        except KeyError:
+            pass
+        version = self._version
+        state = task._observe_cond("start_cond", task=task)
+        with self._lock:
+            if version == self._version:
+                # Status of no task changed meanwhile
+                self._states[name] = state
+        return state
+
+    def changed(self, task:Task):
+        "Reset the states of the tasks depending on the task"
+        dependents = self._dependents.get(task.name)
+        if not dependents:
+            return
+        with self._lock:
+            self._version += 1
+            for name in dependents:
+                self._states.pop(name, None)
+            self.triggered.update(dependents)